@@ -0,0 +1,74 @@
+'''
+Import time of the package.
+
+Fails when importing `fixture` or loading all its members exceeds a budget
+(median of many fresh interpreter runs reported by `python -X importtime`).
+
+Usage: python benchmarks/import_time.py [runs]
+'''
+from pathlib import Path
+import re
+import statistics
+import subprocess
+import sys
+
+SRC = Path(__file__).parents[1] / 'src'
+
+# statement: budget in microseconds
+BUDGETS = {
+    'import fixture': 5_000,
+    'from fixture import *': 50_000,
+}
+
+LINE = re.compile(r'import time:\s+(\d+) \|\s+(\d+) \|(\s+)(\S+)')
+
+
+def measure(statement: str) -> int:
+    "Cumulative import time of top level modules imported by statement."
+    stderr = subprocess.run(
+        [sys.executable, '-X', 'importtime', '-c', statement],
+        cwd=SRC,
+        capture_output=True,
+        text=True,
+        check=True
+    ).stderr
+    baseline = subprocess.run(
+        [sys.executable, '-X', 'importtime', '-c', 'pass'],
+        cwd=SRC,
+        capture_output=True,
+        text=True,
+        check=True
+    ).stderr
+
+    def top_level(output: str):
+        return {
+            m.group(4): int(m.group(2))
+            for m in map(LINE.match, output.splitlines())
+            # one space of indent means module imported by the statement
+            if m and len(m.group(3)) == 1
+        }
+
+    # interpreter startup imports (site etc.) are not counted
+    startup = top_level(baseline)
+    return sum(
+        cumulative
+        for (name, cumulative) in top_level(stderr).items()
+        if name not in startup
+    )
+
+
+def main(runs: int = 15):
+    failed = False
+    for (statement, budget) in BUDGETS.items():
+        median = statistics.median(measure(statement) for _ in range(runs))
+        status = 'ok' if median <= budget else 'OVER BUDGET'
+        failed |= median > budget
+        print(f'{statement:<24} {median / 1000:6.2f} ms '
+              f'(budget {budget / 1000:.2f} ms) {status}')
+
+    if failed:
+        sys.exit(1)
+
+
+if __name__ == '__main__':
+    main(*map(int, sys.argv[1:]))
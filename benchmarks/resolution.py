@@ -0,0 +1,64 @@
+'''
+Per-call cost of fixture resolution.
+
+Measures time and memory allocated by injector for a single test call with
+many fixtures.
+
+Usage: python benchmarks/resolution.py [fixtures] [calls]
+'''
+from functools import cached_property
+from pathlib import Path
+import sys
+import timeit
+import tracemalloc
+
+sys.path.insert(0, str(Path(__file__).parents[1] / 'src'))
+
+from fixture import use_fixture_namespace, unzip  # noqa: E402
+
+
+def build(fixtures: int):
+    "Build namespace with properties, cached properties and unzips."
+    members = {}
+    for index in range(fixtures):
+        kind = index % 3
+        if kind == 0:
+            members[f'f{index}'] = property(lambda self, i=index: i)
+        elif kind == 1:
+            members[f'f{index}'] = cached_property(lambda self, i=index: i)
+            members[f'f{index}'].__set_name__(None, f'f{index}')
+        else:
+            def gen(self, i=index):
+                yield i
+            members[f'f{index}'] = property(unzip(gen))
+    Namespace = type('Namespace', (), members)
+
+    args = ', '.join(members)
+    scope = {}
+    exec(f'def test_method(self, {args}): pass', scope)
+    Tests = type('Tests', (), {'test_method': scope['test_method']})
+    Tests.test_method.__qualname__ = 'Tests.test_method'
+    return use_fixture_namespace(Namespace)(Tests)()
+
+
+def main(fixtures: int = 30, calls: int = 20000):
+    tests = build(fixtures)
+    tests.test_method()
+
+    seconds = min(timeit.repeat(tests.test_method, number=calls, repeat=5))
+
+    tracemalloc.start()
+    tests.test_method()
+    tracemalloc.reset_peak()
+    before, _ = tracemalloc.get_traced_memory()
+    tests.test_method()
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    print(f'fixtures per call:    {fixtures}')
+    print(f'time per call:        {seconds / calls * 1e6:.2f} us')
+    print(f'peak memory per call: {peak - before} B')
+
+
+if __name__ == '__main__':
+    main(*map(int, sys.argv[1:]))
@@ -0,0 +1,286 @@
+'''
+Scaling of decoration and injection with the size of test suite.
+
+Builds synthetic suites (namespaces with properties, cached properties and
+unzips, test classes with `func_copy` copies of other classes tests) of
+growing size and measures:
+- `inject_fixtures` time of all classes (and per test method),
+- `FunctionBackup` growth,
+- per-call injector cost of sampled tests.
+
+Suites grow along all axes at once, then (with `--axis-namespaces`
+namespaces) along members per namespace and along tests per class only.
+Scaling exponents between the smallest and the biggest suites should stay
+close to 1 (per call cost close to 0), bigger ones mean quadratic behaviour.
+
+Usage: python benchmarks/scaling.py [--namespaces N] [--members N]
+    [--tests N] [--fan-out N] [--unzip-ratio R] [--copy-density R]
+    [--axis-namespaces N] [--max-per-class N] [--steps N]
+'''
+from functools import cached_property
+from pathlib import Path
+import argparse
+import math
+import random
+import sys
+import time
+
+sys.path.insert(0, str(Path(__file__).parents[1] / 'src'))
+
+from fixture import func_copy, use_fixture_namespace, unzip  # noqa: E402
+from fixture.state import FunctionBackup  # noqa: E402
+
+# calls of sampled tests measured for every suite
+SAMPLE = 2000
+
+
+def build_namespace(name: str, members: int, unzip_ratio: float, rng):
+    "Namespace with `members` properties, cached properties and unzips."
+    namespace = {}
+    for index in range(members):
+        if rng.random() < unzip_ratio:
+            def gen(self, i=index):
+                yield i
+            namespace[f'f{index}'] = property(unzip(gen))
+        elif index % 2:
+            namespace[f'f{index}'] = cached_property(lambda self, i=index: i)
+        else:
+            namespace[f'f{index}'] = property(lambda self, i=index: i)
+    return type(name, (), namespace)
+
+
+def build_test(qualname: str, args: list[str]):
+    scope = {}
+    exec(f'def test(self, {", ".join(args)}): pass', scope)
+    func = scope['test']
+    func.__name__ = qualname.rsplit('.', 1)[1]
+    func.__qualname__ = qualname
+    return func
+
+
+def build_suite(
+    prefix: str,
+    namespaces: int,
+    members: int,
+    tests: int,
+    fan_out: int,
+    unzip_ratio: float,
+    copy_density: float,
+    seed: int = 0
+):
+    "Build namespaces and not decorated test classes."
+    rng = random.Random(seed)
+    per_class = max(tests // namespaces, 1)
+    suite = []
+    # tests of previous class which can be copied
+    cases: list[str] = []
+    for index in range(namespaces):
+        namespace = build_namespace(
+            f'{prefix}Namespace{index}',
+            members,
+            unzip_ratio,
+            rng
+        )
+        name = f'{prefix}Tests{index}'
+        body = {}
+        for number in range(per_class):
+            # copies need decorated class, so the first class has none
+            copy = cases and rng.random() < copy_density
+            fname = f'test_{"copy" if copy else "case"}_{number}'
+            body[fname] = build_test(
+                f'{name}.{fname}',
+                [] if copy else rng.sample(
+                    [f'f{i}' for i in range(members)],
+                    min(fan_out, members)
+                )
+            )
+            if copy:
+                body[fname].copy_of = rng.choice(cases)
+        cases = [fname for fname in body if fname.startswith('test_case')]
+        suite.append((namespace, type(name, (), body)))
+    return suite
+
+
+def decorate(suite) -> list[type]:
+    "Decorate test classes, copies are taken from previous class."
+    decorated = []
+    for (namespace, klass) in suite:
+        for (fname, func) in list(vars(klass).items()):
+            source = getattr(func, 'copy_of', None)
+            if source is not None:
+                original = getattr(decorated[-1], source)
+                setattr(klass, fname, func_copy(original)(func))
+        decorated.append(use_fixture_namespace(namespace)(klass))
+    return decorated
+
+
+def measure_calls(decorated: list[type], rng) -> float:
+    "Mean time (seconds) of sampled tests calls."
+    tests = [
+        getattr(klass(), fname)
+        for klass in decorated
+        for fname in vars(klass)
+        if fname.startswith('test_')
+    ]
+    sample = [rng.choice(tests) for _ in range(SAMPLE)]
+    for test in sample[:100]:
+        # warm up cached properties
+        test()
+    start = time.perf_counter()
+    for test in sample:
+        test()
+    return (time.perf_counter() - start) / len(sample)
+
+
+def exponent(points: list[tuple[int, float]]) -> float:
+    "Growth exponent between the first and the last point."
+    ((x1, y1), (x2, y2)) = points[0], points[-1]
+    if x1 == x2 or y1 <= 0 or y2 <= 0:
+        return float('nan')
+    return math.log(y2 / y1) / math.log(x2 / x1)
+
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(prog='scaling.py')
+    parser.add_argument('--namespaces', type=int, default=500)
+    parser.add_argument('--members', type=int, default=200)
+    parser.add_argument('--tests', type=int, default=20000)
+    parser.add_argument(
+        '--fan-out', type=int, default=8,
+        help='fixtures per test'
+    )
+    parser.add_argument(
+        '--unzip-ratio', type=float, default=0.2,
+        help='part of members marked with unzip'
+    )
+    parser.add_argument(
+        '--copy-density', type=float, default=0.1,
+        help='part of tests copied with func_copy'
+    )
+    parser.add_argument(
+        '--axis-namespaces', type=int, default=50,
+        help='namespaces of members and tests per class sweeps'
+    )
+    parser.add_argument(
+        '--max-per-class', type=int, default=400,
+        help='the biggest tests per class of tests per class sweep'
+    )
+    parser.add_argument(
+        '--steps', type=int, default=4,
+        help='suites sizes, from 1/steps to full size'
+    )
+    return parser.parse_args(argv)
+
+
+def measure_suite(suite, seed: int) -> tuple[int, float, int, float]:
+    "Decorate suite, get test methods, decoration time, backup growth, call."
+    methods = sum(
+        fname.startswith('test_')
+        for (_, klass) in suite
+        for fname in vars(klass)
+    )
+
+    backup = len(FunctionBackup().register)
+    start = time.perf_counter()
+    decorated = decorate(suite)
+    seconds = time.perf_counter() - start
+    backup = len(FunctionBackup().register) - backup
+
+    per_call = measure_calls(decorated, random.Random(seed))
+    return methods, seconds, backup, per_call
+
+
+def sweep_axis(args, axis: str, prefix: str) -> list[tuple[int, float, float]]:
+    '''
+    Measure suites of `--axis-namespaces` namespaces growing only along one
+    axis: `members` per namespace or `tests` per class, get
+    (axis value, decoration time, per call cost) points.
+    '''
+    per_class = max(args.tests // args.namespaces, 1)
+    points = []
+    for step in range(1, args.steps + 1):
+        members, tests = args.members, per_class
+        if axis == 'members':
+            members = max(args.members * step // args.steps, 1)
+        else:
+            tests = max(args.max_per_class * step // args.steps, 1)
+        suite = build_suite(
+            f'{prefix}{step}',
+            args.axis_namespaces,
+            members,
+            tests * args.axis_namespaces,
+            args.fan_out,
+            args.unzip_ratio,
+            args.copy_density,
+            seed=step
+        )
+        _, seconds, _, per_call = measure_suite(suite, step)
+        value = members if axis == 'members' else tests
+        points.append((value, seconds, per_call))
+        print(
+            f'{value:>10} {seconds:>9.3f}s {seconds / value * 1e6:>10.1f}us '
+            f'{per_call * 1e6:>8.2f}us'
+        )
+    return points
+
+
+def main(argv=None) -> int:
+    args = parse_args(argv)
+    print(
+        f'members {args.members}, fan-out {args.fan_out}, '
+        f'unzip ratio {args.unzip_ratio}, copy density {args.copy_density}'
+    )
+    print(
+        f'{"namespaces":>10} {"tests":>7} {"decorate":>10} '
+        f'{"per test":>10} {"backup":>8} {"per call":>10}'
+    )
+
+    decorate_points, backup_points, call_points = [], [], []
+    for step in range(1, args.steps + 1):
+        namespaces = max(args.namespaces * step // args.steps, 1)
+        tests = max(args.tests * step // args.steps, 1)
+        suite = build_suite(
+            f'S{step}',
+            namespaces,
+            args.members,
+            tests,
+            args.fan_out,
+            args.unzip_ratio,
+            args.copy_density,
+            seed=step
+        )
+        methods, seconds, backup, per_call = measure_suite(suite, step)
+        decorate_points.append((methods, seconds))
+        backup_points.append((methods, backup))
+        call_points.append((methods, per_call))
+        print(
+            f'{namespaces:>10} {methods:>7} {seconds:>9.3f}s '
+            f'{seconds / methods * 1e6:>8.1f}us {backup:>8} '
+            f'{per_call * 1e6:>8.2f}us'
+        )
+
+    print(f'decorate exponent: {exponent(decorate_points):.2f}')
+    print(f'backup exponent:   {exponent(backup_points):.2f}')
+    print(f'per call exponent: {exponent(call_points):.2f}')
+
+    # namespaces size and classes size grow separately, so quadratic
+    # behaviour in one of them isn't hidden by the suite size
+    for (axis, prefix, header) in (
+        ('members', 'M', 'members per namespace'),
+        ('tests', 'C', 'tests per class')
+    ):
+        print(f'\n{header}, {args.axis_namespaces} namespaces')
+        print(
+            f'{axis:>10} {"decorate":>10} {"per " + axis[:-1]:>12} '
+            f'{"per call":>10}'
+        )
+        points = sweep_axis(args, axis, prefix)
+        decorate = [(value, seconds) for (value, seconds, _) in points]
+        calls = [(value, per_call) for (value, _, per_call) in points]
+        print(f'{axis} decorate exponent: {exponent(decorate):.2f}')
+        print(f'{axis} per call exponent: {exponent(calls):.2f}')
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,18 @@
+#!/usr/bin/env bash
+activate_venv() {
+	echo "Creating venv"
+	if [ ! -d .venv ]; then
+		python3 -m venv .venv
+	fi
+	echo "Activating venv"
+	source .venv/bin/activate
+}
+
+UP="$(dirname -- "$0")/.."
+
+cd "$UP" && \
+activate_venv && \
+echo "Generating reports/benchmarks_report.txt" && \
+for benchmark in benchmarks/*.py; do
+	echo "# $benchmark" && python "$benchmark" && echo
+done > reports/benchmarks_report.txt
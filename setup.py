@@ -6,6 +6,9 @@ setup(
     description='Allows to inject class-based fixtures to any test classes.',
     package_dir={'': 'src'},
     packages=find_packages(where='src'),
+    entry_points={
+        'pytest11': ['fixture = fixture.pytest_plugin']
+    },
     author='Adam Lewandowski',
     author_email='adam_lewandowski_1998@outlook.com',
     classifiers=[
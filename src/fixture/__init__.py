@@ -1,6 +1,67 @@
-from .namespace_injector import use_fixture_namespace
-from .func_copy import func_copy
-from .unzip import unzip
-from .error import FixtureError
+'''
+Members are loaded lazily on the first access, so importing the package
+doesn't import the injector until it's really needed.
+'''
+from importlib import import_module
+from sys import modules
+from types import ModuleType
 
-__all__ = ['use_fixture_namespace', 'unzip', 'FixtureError', 'func_copy']
+# member name: module
+_members = {
+    'use_fixture_namespace': '.namespace_injector',
+    'inject': '.namespace_injector',
+    'injectable': '.namespace_injector',
+    'func_copy': '.func_copy',
+    'unzip': '.unzip',
+    'stream': '.stream',
+    'shared': '.shared',
+    'mock': '.mock',
+    'snapshot': '.snapshot',
+    'factory': '.factory',
+    'priority': '.ordering',
+    'precondition': '.ordering',
+    'FixtureError': '.error',
+}
+
+__all__ = [
+    'use_fixture_namespace',
+    'inject',
+    'injectable',
+    'unzip',
+    'stream',
+    'shared',
+    'mock',
+    'snapshot',
+    'factory',
+    'priority',
+    'precondition',
+    'FixtureError',
+    'func_copy'
+]
+
+
+def __getattr__(name: str):
+    if name not in _members:
+        raise AttributeError(f'module {__name__!r} has no attribute {name!r}')
+
+    member = getattr(import_module(_members[name], __name__), name)
+    # next access doesn't reach __getattr__
+    setattr(modules[__name__], name, member)
+    return member
+
+
+def __dir__():
+    return sorted({*globals(), *__all__})
+
+
+class _LazyModule(ModuleType):
+    def __setattr__(self, name: str, value):
+        # importing submodule with the same name as member (e.g. `unzip`)
+        # binds it to package, member has to be kept instead like
+        # eager `from .unzip import unzip` did
+        if name in _members and isinstance(value, ModuleType):
+            value = getattr(value, name)
+        super().__setattr__(name, value)
+
+
+modules[__name__].__class__ = _LazyModule
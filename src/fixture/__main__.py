@@ -0,0 +1,79 @@
+'''
+Command line interface.
+
+Usage:
+    python -m fixture plan [--jobs N] [--timings FILE] [-o FILE] PATH...
+    python -m fixture trace {chrome,timings} [-o FILE] TRACE
+    python -m fixture run [--jobs N] [-v] PATH...
+'''
+import argparse
+import sys
+
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(prog='python -m fixture')
+    commands = parser.add_subparsers(dest='command', required=True)
+
+    plan = commands.add_parser(
+        'plan',
+        help='export fixtures resolution plan of test modules as JSON'
+    )
+    plan.add_argument('paths', nargs='+', help='test files or directories')
+    plan.add_argument(
+        '-j', '--jobs', type=int, default=1,
+        help='number of processes importing modules in parallel'
+    )
+    plan.add_argument(
+        '--timings',
+        help='JSON file with recorded fixtures timings used to estimate costs'
+    )
+    plan.add_argument(
+        '-o', '--output', type=argparse.FileType('w'), default=sys.stdout,
+        help='output file (default: stdout)'
+    )
+
+    trace = commands.add_parser(
+        'trace',
+        help='convert fixtures trace to Chrome trace-event format or to '
+             'fixtures timings'
+    )
+    trace.add_argument('format', choices=('chrome', 'timings'))
+    trace.add_argument('trace', help='trace file (JSON lines)')
+    trace.add_argument(
+        '-o', '--output', type=argparse.FileType('w'), default=sys.stdout,
+        help='output file (default: stdout)'
+    )
+
+    run = commands.add_parser(
+        'run',
+        help='run decorated test classes in workers forked after computing '
+             'shared fixtures'
+    )
+    run.add_argument('paths', nargs='+', help='test files or directories')
+    run.add_argument(
+        '-j', '--jobs', type=int, default=None,
+        help='number of worker processes (default: number of CPUs)'
+    )
+    run.add_argument(
+        '-v', '--verbose', action='store_true',
+        help='print result of every test'
+    )
+    return parser.parse_args(argv)
+
+
+def main(argv=None) -> int:
+    args = parse_args(argv)
+    if args.command == 'plan':
+        from fixture.plan import main as plan
+        return plan(args)
+    if args.command == 'trace':
+        from fixture.trace import main as trace
+        return trace(args)
+    if args.command == 'run':
+        from fixture.runner import main as run
+        return run(args)
+    return 2
+
+
+if __name__ == '__main__':
+    sys.exit(main())
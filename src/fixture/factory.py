@@ -0,0 +1,177 @@
+'''
+Factory fixtures, memoising calls by arguments.
+
+```
+class Namespace:
+    # make_users(100) is built once for tests class
+    @factory
+    def make_users(self, count):
+        return [User(name=str(i)) for i in range(count)]
+
+    # generator factories are closed at the end of scope
+    @factory(scope='test')
+    def open_file(self, name):
+        with open(name) as file:
+            yield file
+```
+
+Injected value is callable, calls with the same (hashable) arguments return
+the same value within scope: `test`, `class` (default, every decorated class
+has its own values) or `session`. Calls
+with unhashable arguments are not memoised. Generators returned by factory
+are unpacked like `unzip` fixtures, they are closed at the end of scope, like
+generators of other fixtures after test. `stats()` returns hits and misses
+of the current scope.
+
+`class` and `session` values are closed by `close_factories`, pytest plugin,
+runner and `setup_class` test cases close `class` ones when tests class ends
+and `session` ones at exit. Other runners close them with
+`from fixture.factory import close_factories` (`fixture.factory` attribute
+of the package is `factory` function, not this module).
+'''
+from collections import namedtuple
+from collections.abc import Generator
+from functools import partial
+from threading import Lock, RLock
+from typing import Callable
+
+SCOPES = ('test', 'class', 'session')
+
+FactoryStats = namedtuple('FactoryStats', ('hits', 'misses', 'size'))
+
+# scope: (memos of factory, memo owner) closed by `close_factories`
+_active: dict[str, list[tuple[dict, object]]] = {'class': [], 'session': []}
+_lock = Lock()
+
+# separates positional and keyword arguments in memo keys, so `f(1, ('a', 2))`
+# and `f(1, a=2)` are different calls
+_KWARGS = object()
+
+
+class Memo:
+    "Values produced by factory within scope."
+    __slots__ = ('values', 'generators', 'hits', 'misses', 'lock')
+
+    def __init__(self):
+        # arguments: value
+        self.values = {}
+        self.generators = []
+        self.hits = 0
+        self.misses = 0
+        # factory can call other factories, also itself
+        self.lock = RLock()
+
+    def close(self):
+        "Close produced generators, in reversed order."
+        with self.lock:
+            generators, self.generators = self.generators, []
+            self.values.clear()
+        for generator in reversed(generators):
+            generator.close()
+
+
+class FactoryCall:
+    "Injected factory, memoising calls by arguments."
+    __slots__ = ('func', 'namespace', 'memo')
+
+    def __init__(self, func: Callable, namespace, memo: Memo):
+        self.func = func
+        self.namespace = namespace
+        self.memo = memo
+
+    def __call__(self, *args, **kwargs):
+        key = (*args, _KWARGS, *sorted(kwargs.items())) if kwargs else args
+        try:
+            hash(key)
+        except TypeError:
+            # unhashable arguments, value is not memoised
+            key = None
+
+        memo = self.memo
+        with memo.lock:
+            if key is not None:
+                value = memo.values.get(key, memo)
+                if value is not memo:
+                    memo.hits += 1
+                    return value
+
+            memo.misses += 1
+            value = self.func(self.namespace, *args, **kwargs)
+            if isinstance(value, Generator):
+                generator = value
+                value = next(generator)
+                memo.generators.append(generator)
+            if key is not None:
+                memo.values[key] = value
+            return value
+
+    def stats(self) -> FactoryStats:
+        "Get hits, misses and number of memoised values of current scope."
+        memo = self.memo
+        return FactoryStats(memo.hits, memo.misses, len(memo.values))
+
+    def close(self):
+        self.memo.close()
+
+
+class Factory:
+    "Factory fixture of namespace."
+
+    def __init__(self, func: Callable, scope: str = 'class'):
+        if scope not in SCOPES:
+            raise ValueError(f'Invalid factory scope {scope!r}')
+        self.func = func
+        self.scope = scope
+        # memo of class scope for every decorated class (its compiled
+        # namespace context), of session scope for every namespace class
+        self.memos: dict[object, Memo] = {}
+
+    def __repr__(self) -> str:
+        return (
+            f'{type(self).__name__}({self.func.__qualname__}, '
+            f'scope={self.scope!r})'
+        )
+
+    def open(self, namespace_class: type, namespace_context) -> FactoryCall:
+        '''
+        Get factory bound to namespace object, with memo of scope. Classes
+        decorated with the same namespace have their own `class` memos.
+        '''
+        namespace = namespace_context.instance
+        if self.scope == 'test':
+            return FactoryCall(self.func, namespace, Memo())
+
+        owner = namespace_context if self.scope == 'class' \
+            else namespace_class
+        memo = self.memos.get(owner)
+        if memo is None:
+            with _lock:
+                memo = self.memos.get(owner)
+                if memo is None:
+                    memo = self.memos[owner] = Memo()
+                    _active[self.scope].append((self.memos, owner))
+        return FactoryCall(self.func, namespace, memo)
+
+
+def factory(func: Callable | None = None, *, scope: str = 'class'):
+    '''
+    Mark method as factory fixture, memoising calls by arguments within
+    scope. Can be used as `@factory` or `@factory(scope='test')`.
+    '''
+    if func is None:
+        return partial(factory, scope=scope)
+    return Factory(func, scope)
+
+
+def close_factories(scope: str | None = None):
+    "Close values of scope ('class' or 'session'), all if scope is None."
+    scopes = list(_active) if scope is None else [scope]
+    for name in scopes:
+        with _lock:
+            memos = [
+                memos.pop(owner)
+                for (memos, owner) in _active[name]
+            ]
+            _active[name] = []
+        for memo in reversed(memos):
+            memo.close()
@@ -79,6 +79,10 @@ def func_copy(original_func: Callable, map_args: dict[str, str] = {}):
 
         # replace signature
         setattr(wrapped, '__signature__', wrapped_signature)
+        # keep reference to copied function (e.g. for its source)
+        setattr(wrapped, '__func_copy__', retrieved)
+        # and to copied (injected) function, e.g. to share its fixtures
+        setattr(wrapped, '__func_copy_source__', original_func)
         return wrapped
 
     return get_function
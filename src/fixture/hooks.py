@@ -0,0 +1,94 @@
+'''
+Hooks observing fixtures resolution, e.g. profiling.
+
+Hooks are checked once per test call, without active hooks injection has
+no additional costs.
+
+Reads of namespace members from other members (nested `self.x`) are
+reported only for namespaces decorated when `observe_members` was set,
+observed namespace members are a bit slower.
+'''
+from functools import partial
+from threading import Lock
+from typing import TYPE_CHECKING, Callable, Generator
+
+if TYPE_CHECKING:
+    # hooks are imported by the injector
+    from fixture.namespace_injector.records import FixtureRecord
+
+
+class FixtureHook:
+    "Base class of hooks, every method has to call passed function."
+
+    def call(
+        self,
+        namespace_class: type,
+        func: Callable,
+        run: Callable[[], object]
+    ):
+        "Called around injected function call (with fixtures setup/teardown)."
+        return run()
+
+    def setup(
+        self,
+        namespace_class: type,
+        name: str,
+        getter: Callable[[], 'FixtureRecord']
+    ) -> 'FixtureRecord':
+        "Called around getting fixture value."
+        return getter()
+
+    def access(
+        self,
+        namespace_class: type,
+        name: str,
+        get: Callable[[], object]
+    ):
+        "Called around every namespace member read, see `observe_members`."
+        return get()
+
+    def teardown(
+        self,
+        namespace_class: type,
+        name: str,
+        generator: Generator,
+        close: Callable[[], None]
+    ):
+        "Called around closing fixture generator (or other closable value)."
+        close()
+
+
+# active hooks, the first one is the outermost
+active: tuple[FixtureHook, ...] = ()
+# namespaces decorated when set report members reads to `access`
+observe_members = False
+_members_hooks: tuple[FixtureHook, ...] = ()
+_lock = Lock()
+
+
+def add_hook(hook: FixtureHook, members: bool = False):
+    '''
+    Activate hook, with `members` namespaces decorated while the hook is
+    active report members reads.
+    '''
+    global active, observe_members, _members_hooks
+    with _lock:
+        active = (*active, hook)
+        if members:
+            _members_hooks = (*_members_hooks, hook)
+            observe_members = True
+
+
+def remove_hook(hook: FixtureHook):
+    global active, observe_members, _members_hooks
+    with _lock:
+        active = tuple(h for h in active if h is not hook)
+        _members_hooks = tuple(h for h in _members_hooks if h is not hook)
+        observe_members = bool(_members_hooks)
+
+
+def wrap_access(namespace_class: type, name: str, get: Callable[[], object]):
+    "Wrap member read with active hooks."
+    for hook in reversed(active):
+        get = partial(hook.access, namespace_class, name, get)
+    return get
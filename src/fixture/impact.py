@@ -0,0 +1,145 @@
+'''
+Test impact selection.
+
+Index maps tests to fingerprints of sources they depend on: test function,
+fixtures injected into the test (together with namespace members they access
+through `self`) and namespace initialization. Tests with unchanged
+fingerprints, which passed during the last recorded run, can be skipped.
+
+Only tests of classes decorated with `use_fixture_namespace` are tracked,
+changes of code called by tests (outside namespace) are not detected.
+'''
+from functools import cached_property
+from hashlib import sha1
+from pathlib import Path
+import inspect
+import json
+import textwrap
+
+from fixture.members import member_function, referenced_names
+
+_MISSING = object()
+
+
+def digest(*parts: str) -> str:
+    return sha1('\0'.join(parts).encode()).hexdigest()
+
+
+def source_hash(func) -> str:
+    "Hash of function source, line numbers don't matter."
+    func = inspect.unwrap(func)
+    try:
+        source = textwrap.dedent(inspect.getsource(func))
+    except (OSError, TypeError):
+        # source not available, e.g. function created with exec
+        code = getattr(func, '__code__', None)
+        source = repr(
+            (code.co_code, code.co_consts, code.co_names) if code else func
+        )
+    return digest(source)
+
+
+class NamespaceFingerprint:
+    '''
+    Fingerprints of namespace members.
+
+    Member fingerprint covers its own source and fingerprints of members
+    it uses, so changing `words` changes fingerprint of `something`
+    returning `self.words + ['d']`.
+    '''
+
+    def __init__(self, NamespaceClass: type):
+        self.namespace_class = NamespaceClass
+        self.members = {}
+        # the first class in MRO defines member, same as attribute lookup
+        for klass in reversed(NamespaceClass.__mro__[:-1]):
+            self.members.update(vars(klass))
+        self.hashes: dict[str, str] = {}
+
+    @cached_property
+    def base(self) -> str:
+        "Fingerprint of namespace parts used by every fixture."
+        init = self.members.get('__init__')
+        return digest(
+            *(klass.__qualname__ for klass in self.namespace_class.__mro__),
+            source_hash(init) if init else ''
+        )
+
+    def __call__(self, name: str) -> str:
+        if name in self.hashes:
+            return self.hashes[name]
+        # recursive members references
+        self.hashes[name] = ''
+
+        member = self.members.get(name, _MISSING)
+        func = member_function(member)
+        if func is None:
+            fingerprint = digest(repr(member))
+        else:
+            code = getattr(inspect.unwrap(func), '__code__', None)
+            used = referenced_names(code) if code else set()
+            fingerprint = digest(source_hash(func), *(
+                self(other)
+                for other in sorted(used & self.members.keys())
+                if other != name
+            ))
+
+        self.hashes[name] = fingerprint
+        return fingerprint
+
+
+class ImpactIndex:
+    "Index of tests fingerprints and outcomes of the last recorded run."
+
+    def __init__(self, path: Path):
+        self.path = path
+        self.tests: dict[str, dict] = {}
+        if path.exists():
+            self.tests = json.loads(path.read_text())['tests']
+        self.namespaces: dict[type, NamespaceFingerprint] = {}
+
+    def fingerprint(self, klass: type | None, fname: str) -> str | None:
+        "Get test fingerprint, None if test is not tracked."
+        plan = vars(klass).get('__fixture_plan__') if klass else None
+        if plan is None or fname not in plan.tests:
+            return None
+
+        namespace = self.namespaces.get(plan.namespace_class)
+        if namespace is None:
+            namespace = NamespaceFingerprint(plan.namespace_class)
+            self.namespaces[plan.namespace_class] = namespace
+
+        # injector wraps test function
+        func = getattr(klass, fname).__wrapped__
+        parts = [source_hash(func)]
+        if hasattr(func, '__func_copy__'):
+            # body of test copied with `func_copy`
+            parts.append(source_hash(func.__func_copy__))
+
+        return digest(
+            *parts,
+            namespace.base,
+            *(namespace(name) for name in plan.tests[fname])
+        )
+
+    def is_affected(self, test_id: str, fingerprint: str) -> bool:
+        "Check if test has to run again."
+        recorded = self.tests.get(test_id)
+        return not (
+            recorded
+            and recorded['fingerprint'] == fingerprint
+            and recorded['outcome'] == 'passed'
+        )
+
+    def record(self, test_id: str, fingerprint: str, outcome: str):
+        self.tests[test_id] = {'fingerprint': fingerprint, 'outcome': outcome}
+
+    def save(self):
+        # replace at once, index is never half written
+        temporary = self.path.with_name(f'{self.path.name}.tmp')
+        temporary.write_text(json.dumps(
+            {'tests': self.tests},
+            indent=1,
+            sort_keys=True
+        ))
+        temporary.replace(self.path)
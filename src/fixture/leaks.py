@@ -0,0 +1,154 @@
+'''
+Leaks detector of fixtures.
+
+Tracks (with weak references) every value and generator created during
+fixtures resolution, also by namespace members read from other members
+(`self.x`) of namespaces decorated while detector is active. After every
+injected call reports values which are still alive and generators which
+were not closed, at the end reports everything that survived.
+
+Values which cannot be weakly referenced (e.g. `list`, `int`) are not
+tracked. Detector is opt-in, without it injection has no additional costs.
+'''
+from contextlib import contextmanager
+from threading import Lock, local
+from types import GeneratorType
+from typing import Iterator
+import gc
+import reprlib
+import weakref
+
+from fixture import hooks
+
+
+class Leak:
+    "Object created by fixture and still alive after test."
+    __slots__ = ('test', 'namespace', 'fixture', 'kind', 'object')
+
+    def __init__(self, test: str, namespace: str, fixture: str, obj):
+        self.test = test
+        self.namespace = namespace
+        self.fixture = fixture
+        self.kind = 'unclosed generator' \
+            if isinstance(obj, GeneratorType) and obj.gi_frame is not None \
+            else 'alive value'
+        self.object = reprlib.repr(obj)
+
+    def __str__(self) -> str:
+        return (
+            f'{self.test}: {self.kind} {self.object} '
+            f'of {self.namespace}.{self.fixture}'
+        )
+
+
+def qualified_name(obj) -> str:
+    return f'{obj.__module__}.{obj.__qualname__}'
+
+
+class LeakDetector(hooks.FixtureHook):
+    def __init__(self):
+        # objects tracked in calls of current thread
+        self._calls = local()
+        self._lock = Lock()
+        # leaks found after every call
+        self.leaks: list[Leak] = []
+        # (namespace name, fixture name, reference) of alive objects
+        self._session: list[tuple[str, str, weakref.ref]] = []
+        # id: reference of already reported objects, e.g. cached values
+        # alive after every test are reported only once
+        self._reported: dict[int, weakref.ref] = {}
+
+    def track(self, namespace_class: type, name: str, obj):
+        stack = getattr(self._calls, 'stack', None)
+        if not stack:
+            # not inside injected call
+            return
+        try:
+            reference = weakref.ref(obj)
+        except TypeError:
+            return
+        stack[-1].append((qualified_name(namespace_class), name, reference))
+
+    def call(self, namespace_class, func, run):
+        stack = self._calls.__dict__.setdefault('stack', [])
+        tracked = []
+        stack.append(tracked)
+        try:
+            return run()
+        finally:
+            stack.pop()
+            self.check(qualified_name(func), tracked)
+
+    def setup(self, namespace_class, name, getter):
+        value, generator = record = getter()
+        self.track(namespace_class, name, value)
+        if generator is not None:
+            self.track(namespace_class, name, generator)
+        return record
+
+    def access(self, namespace_class, name, get):
+        value = get()
+        self.track(namespace_class, name, value)
+        return value
+
+    def check(self, test: str, tracked: list):
+        "Report tracked objects which are still alive."
+        gc.collect()
+        leaks = []
+        alive = []
+        seen = set()
+        with self._lock:
+            for (namespace, name, reference) in tracked:
+                obj = reference()
+                if obj is None or id(obj) in seen:
+                    continue
+                seen.add(id(obj))
+                reported = self._reported.get(id(obj))
+                if reported is not None and reported() is obj:
+                    continue
+                self._reported[id(obj)] = reference
+                leaks.append(Leak(test, namespace, name, obj))
+                alive.append((namespace, name, reference))
+
+            self.leaks.extend(leaks)
+            self._session.extend(alive)
+
+    def survivors(self) -> list[Leak]:
+        "Objects which are alive now, e.g. at the end of tests session."
+        gc.collect()
+        with self._lock:
+            self._session = [
+                item for item in self._session if item[2]() is not None
+            ]
+            session = list(self._session)
+        return [
+            Leak('session', namespace, name, obj)
+            for (namespace, name, reference) in session
+            if (obj := reference()) is not None
+        ]
+
+    def report(self) -> str:
+        lines = [str(leak) for leak in self.leaks]
+        lines += [str(leak) for leak in self.survivors()]
+        return '\n'.join(lines)
+
+
+@contextmanager
+def detect_leaks() -> Iterator[LeakDetector]:
+    '''
+    Detect leaks of fixtures injected inside the block. Namespaces decorated
+    inside the block report also objects created by nested members reads.
+
+    Example:
+    ```
+    with detect_leaks() as detector:
+        unittest.main(exit=False)
+    print(detector.report())
+    ```
+    '''
+    detector = LeakDetector()
+    hooks.add_hook(detector, members=True)
+    try:
+        yield detector
+    finally:
+        hooks.remove_hook(detector)
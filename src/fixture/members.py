@@ -0,0 +1,36 @@
+'''
+Namespace members inspection, shared by the injector and tools reading
+namespaces (impact selection, plan). Module has no dependencies, so it can be
+imported by the injector core without loading fixture kinds modules.
+'''
+from functools import cached_property
+from types import CodeType, FunctionType
+
+
+def member_function(member):
+    "Get function defining namespace member, None for plain attributes."
+    if isinstance(member, property):
+        return member.fget
+    if isinstance(member, cached_property):
+        return member.func
+    if isinstance(member, (staticmethod, classmethod)):
+        return member.__func__
+    if isinstance(member, FunctionType):
+        return member
+    if callable(member) and hasattr(member, 'cache_info'):
+        # functools.cache
+        return member.__wrapped__
+    # fixture objects defined by method (streams, snapshots, factories)
+    func = getattr(member, 'func', None)
+    if isinstance(func, FunctionType):
+        return func
+    return None
+
+
+def referenced_names(code: CodeType) -> set[str]:
+    "Attributes and globals names used by code and its nested functions."
+    names = set(code.co_names)
+    for const in code.co_consts:
+        if isinstance(const, CodeType):
+            names |= referenced_names(const)
+    return names
@@ -0,0 +1,189 @@
+'''
+Mock fixtures, patching target with one reusable mock.
+
+```
+class Namespace:
+    # patched for every test, like `unzip` property with `patch`
+    requests = mock('app.client.requests')
+
+    # patched once, kept until the end of tests class
+    database = mock('app.db.connect', scope='class', return_value=None)
+
+    # patched once, kept until the end of session (`stop_mocks()`)
+    clock = mock('app.time.now', scope='session', autospec=True)
+```
+
+Target is resolved (imported) and mock is created once, on the first test
+using it. Patch is started and stopped once per scope, between tests only
+`reset_mock()` is called: calls are forgotten, configured return values and
+side effects are kept.
+
+When mocks of many scopes patch the same target, the mock of the shortest
+scope is patched during tests.
+
+`class` and `session` patches are stopped by `stop_mocks`, pytest plugin and
+runner stop `class` patches when tests class ends and `session` ones at exit.
+Other runners (e.g. Django test runner) stop them with:
+```
+from fixture.mock import stop_mocks
+
+stop_mocks('class')
+```
+`fixture.mock` attribute of the package is `mock` function, not this module.
+'''
+from threading import Lock
+from typing import Callable
+
+SCOPES = ('test', 'class', 'session')
+
+# scope: started patches, stopped by `stop_mocks`
+_active: dict[str, list['MockFixture']] = {'class': [], 'session': []}
+# target: started patches, patches of shorter scopes on top
+_patched: dict[str, list['MockFixture']] = {}
+_lock = Lock()
+
+
+class AfterTest:
+    "Closable called after test."
+    __slots__ = ('close',)
+
+    def __init__(self, close: Callable[[], None]):
+        self.close = close
+
+
+class MockFixture:
+    "Patch of target, started once per scope."
+
+    def __init__(
+        self,
+        target: str,
+        scope: str = 'test',
+        autospec: bool = False,
+        new_callable: Callable | None = None,
+        **kwargs
+    ):
+        if scope not in SCOPES:
+            raise ValueError(f'Invalid mock scope {scope!r}')
+        if '.' not in target:
+            raise ValueError(f'Invalid patch target {target!r}')
+        self.target = target
+        self.scope = scope
+        self.autospec = autospec
+        self.new_callable = new_callable
+        self.kwargs = kwargs
+        self.mock = None
+        self.active = False
+        self._patcher = None
+        self.after_test = AfterTest(self.reset)
+
+    def __repr__(self):
+        # every argument, repr is a part of test impact fingerprint
+        args = [repr(self.target), f'scope={self.scope!r}']
+        if self.autospec:
+            args.append(f'autospec={self.autospec!r}')
+        if self.new_callable is not None:
+            # function repr changes with its address between runs
+            name = getattr(self.new_callable, '__qualname__', None)
+            args.append(
+                f'new_callable={self.new_callable.__module__}.{name}'
+                if name else f'new_callable={self.new_callable!r}'
+            )
+        args.extend(
+            f'{name}={value!r}'
+            for (name, value) in sorted(self.kwargs.items())
+        )
+        return f'mock({", ".join(args)})'
+
+    def resolve(self):
+        "Import target and create mock, once."
+        # imported with the first mock, not with every namespace
+        from pkgutil import resolve_name
+        from unittest.mock import MagicMock, create_autospec, patch
+
+        owner_name, attribute = self.target.rsplit('.', 1)
+        owner = resolve_name(owner_name)
+        if self.autospec:
+            self.mock = create_autospec(
+                getattr(owner, attribute),
+                **self.kwargs
+            )
+        else:
+            self.mock = (self.new_callable or MagicMock)(**self.kwargs)
+        self._patcher = patch.object(owner, attribute, self.mock)
+
+    def start(self):
+        "Start patch, if it is not active."
+        if self.active:
+            return self.mock
+        with _lock:
+            if not self.active:
+                if self._patcher is None:
+                    self.resolve()
+                stack = _patched.setdefault(self.target, [])
+                # the same target patched by mocks of many scopes shows mock
+                # of the shortest scope, in every test
+                index = next((
+                    index
+                    for (index, fixture) in enumerate(stack)
+                    if SCOPES.index(fixture.scope) < SCOPES.index(self.scope)
+                ), len(stack))
+                restack(stack[index:], self._patcher.start)
+                stack.insert(index, self)
+                self.active = True
+                if self.scope != 'test':
+                    _active[self.scope].append(self)
+        return self.mock
+
+    def stop(self):
+        "Stop patch, mock is kept for the next start."
+        with _lock:
+            if self.active:
+                stack = _patched[self.target]
+                index = stack.index(self)
+                restack(stack[index + 1:], self._patcher.stop)
+                del stack[index]
+                if not stack:
+                    del _patched[self.target]
+                self.active = False
+
+    def reset(self):
+        "Forget calls after test, stop patch of test scope."
+        self.mock.reset_mock()
+        if self.scope == 'test':
+            self.stop()
+
+
+def restack(above: list[MockFixture], change: Callable[[], object]):
+    '''
+    Start or stop patch below `above` patches of the same target, they
+    keep patched value as original one, so they are stopped before and
+    started again after the change.
+    '''
+    for fixture in reversed(above):
+        fixture._patcher.stop()
+    change()
+    for fixture in above:
+        fixture._patcher.start()
+
+
+def mock(target: str, *, scope: str = 'test', **kwargs) -> MockFixture:
+    '''
+    Create mock fixture patching `target` ('package.module.attribute').
+
+    `scope` ('test', 'class' or 'session') says how long patch is active,
+    `autospec=True` creates mock with spec of patched object, other keyword
+    arguments are passed to mock class (`new_callable`, `MagicMock` by
+    default).
+    '''
+    return MockFixture(target, scope, **kwargs)
+
+
+def stop_mocks(scope: str | None = None):
+    "Stop patches of scope ('class' or 'session'), all if scope is None."
+    scopes = list(_active) if scope is None else [scope]
+    for name in scopes:
+        with _lock:
+            fixtures, _active[name] = _active[name], []
+        # stopped in reversed order, the same target may be patched twice
+        for fixture in reversed(fixtures):
+            fixture.stop()
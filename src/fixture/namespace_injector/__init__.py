@@ -1,3 +1,3 @@
-from .injector import use_fixture_namespace
+from .injector import inject, injectable, use_fixture_namespace
 
-__all__ = ['use_fixture_namespace']
+__all__ = ['use_fixture_namespace', 'inject', 'injectable']
@@ -0,0 +1,252 @@
+from functools import cached_property, partial
+from threading import Lock, RLock, local
+from typing import Sequence, Type, TypeVar
+from weakref import WeakValueDictionary
+import inspect
+
+from fixture import hooks
+from fixture.members import member_function, referenced_names
+
+T = TypeVar('T')
+
+_MISSING = object()
+
+
+class SharedValue:
+    "Cached fixture value, shared by namespaces computing the same fixture."
+    __slots__ = ('value', 'flight', 'instances', '__weakref__')
+
+    def __init__(self):
+        self.value = _MISSING
+        self.flight = RLock()
+        # id: namespace object holding value in `__dict__`, namespace
+        # objects may be not hashable
+        self.instances: WeakValueDictionary[int, object] = \
+            WeakValueDictionary()
+
+    def clear(self, name: str):
+        "Forget value (e.g. closed generator), it's computed again."
+        with self.flight:
+            self.value = _MISSING
+            for instance in list(self.instances.values()):
+                instance.__dict__.pop(name, None)
+            self.instances.clear()
+
+
+class SharedCachedProperty(cached_property):
+    '''
+    `cached_property` evaluated only once for all threads.
+
+    Since Python 3.12 `cached_property` doesn't lock, so concurrent threads
+    could compute the same fixture many times. Here the first thread computes
+    the value (single-flight) and the others wait for it. The value is copied
+    into `__dict__` of every thread namespace object, so later lookups never
+    reach the descriptor (lock-free path).
+
+    Value is kept in `shared`, the same for all namespaces sharing fixture
+    (see `create_namespace_class`).
+    '''
+
+    def __init__(
+        self,
+        func,
+        observed_class: type | None = None,
+        shared: SharedValue | None = None
+    ):
+        super().__init__(func)
+        self.shared = shared or SharedValue()
+        # namespace class reported to hooks, None if not observed
+        self.observed_class = observed_class
+
+    def __get__(self, instance, owner=None):
+        if instance is None:
+            return self
+
+        shared = self.shared
+        # reached once per namespace object, then value is in `__dict__`
+        with shared.flight:
+            # other thread could compute it while we were waiting
+            value = shared.value
+            if value is _MISSING:
+                compute = partial(self.func, instance)
+                if self.observed_class:
+                    compute = hooks.wrap_access(
+                        self.observed_class,
+                        self.attrname,
+                        compute
+                    )
+                value = shared.value = compute()
+            instance.__dict__[self.attrname] = value
+            shared.instances[id(instance)] = instance
+        return value
+
+
+class ObservedProperty(property):
+    "Property reporting every read (also nested `self.x`) to hooks."
+
+    def __init__(self, prop: property, observed_class: type):
+        super().__init__(prop.fget, prop.fset, prop.fdel, prop.__doc__)
+        self.observed_class = observed_class
+
+    def __set_name__(self, owner, name):
+        self.name = name
+
+    def __get__(self, instance, owner=None):
+        if instance is None:
+            return self
+        return hooks.wrap_access(
+            self.observed_class,
+            self.name,
+            partial(property.__get__, self, instance, owner)
+        )()
+
+
+class NamespaceContext(local):
+    "Per-thread namespace object."
+
+    def __init__(self, NamespaceClass: Type):
+        # called again on the first access from every new thread
+        self.instance = NamespaceClass()
+
+
+class Same:
+    "Key part comparing object identity, also of not hashable objects."
+    __slots__ = ('object',)
+
+    def __init__(self, object):
+        self.object = object
+
+    def __hash__(self):
+        return id(self.object)
+
+    def __eq__(self, other):
+        return isinstance(other, Same) and other.object is self.object
+
+
+# names reading namespace class (or its members by name), value of member
+# using them may depend on namespace where it's computed
+DYNAMIC_NAMES = frozenset({
+    'type', 'super', 'vars', 'getattr', 'isinstance', 'id',
+    '__class__', '__dict__'
+})
+
+
+def sharing_key(
+    members: dict,
+    name: str,
+    seen: set | None = None
+) -> tuple | None:
+    '''
+    Key of namespace member, equal for members which provably give the same
+    value: the same function (or object) using the same members. None when
+    value may depend on namespace class (e.g. `type(self).__name__`).
+    '''
+    seen = seen if seen is not None else set()
+    member = members.get(name, _MISSING)
+    func = member_function(member)
+    if func is None:
+        return (Same(member),)
+    if name in seen:
+        # recursive members references
+        return (Same(func),)
+    seen = seen | {name}
+
+    code = getattr(inspect.unwrap(func), '__code__', None)
+    names = referenced_names(code) if code else set()
+    if names & DYNAMIC_NAMES:
+        return None
+    key = [Same(func)]
+    for other in sorted((names & members.keys()) - {name}):
+        other_key = sharing_key(members, other, seen)
+        if other_key is None:
+            return None
+        key.append((other, other_key))
+    return tuple(key)
+
+
+def namespace_members(NamespaceClass: type) -> dict:
+    "Get namespace members, also inherited ones."
+    members = {}
+    # the first class in MRO defines member, same as attribute lookup
+    for klass in reversed(NamespaceClass.__mro__):
+        members.update(klass.__dict__)
+    return members
+
+
+# function of @shared member: value, kept while any namespace uses it
+_shared_values: WeakValueDictionary[Same, SharedValue] = WeakValueDictionary()
+_shared_values_lock = Lock()
+
+
+def get_shared_value(func) -> SharedValue:
+    "Get value storage of member marked with `@shared`, one for all namespaces."
+    key = Same(func)
+    with _shared_values_lock:
+        shared = _shared_values.get(key)
+        if shared is None:
+            shared = _shared_values[key] = SharedValue()
+    return shared
+
+
+def find_source_value(
+    members: dict,
+    name: str,
+    sources: Sequence[type]
+) -> SharedValue | None:
+    '''
+    Get value storage of cached fixture computed by namespace of tests copied
+    with `func_copy` (compiled `sources` classes), if fixture is provably the
+    same there: the same function using the same members, with the same
+    namespace `__init__`.
+    '''
+    key = sharing_key(members, name)
+    if key is None:
+        return None
+    for source in sources:
+        source_members = namespace_members(source)
+        member = source.__dict__.get(name)
+        if isinstance(member, SharedCachedProperty) \
+                and source_members.get('__init__') is members.get('__init__') \
+                and sharing_key(source_members, name) == key:
+            return member.shared
+    return None
+
+
+def create_namespace_class(
+    NamespaceClass: Type[T],
+    sources: Sequence[type] = ()
+) -> Type[T]:
+    '''
+    Subclass namespace class with cached properties shared between threads
+    (and with observed members, see `hooks.observe_members`).
+
+    Every compiled namespace computes its cached properties once. Values are
+    shared with other namespaces only for members marked with `@shared` and
+    for the same fixtures of compiled namespaces of copied tests (`sources`).
+    '''
+    observed = NamespaceClass if hooks.observe_members else None
+    all_members = namespace_members(NamespaceClass)
+
+    members = {}
+    for (name, member) in all_members.items():
+        if isinstance(member, cached_property) or (
+            # @shared property is computed once too
+            type(member) is property and hasattr(member.fget, 'shared')
+        ):
+            func = member_function(member)
+            if hasattr(func, 'shared'):
+                shared = get_shared_value(func)
+            else:
+                shared = find_source_value(all_members, name, sources)
+            members[name] = SharedCachedProperty(func, observed, shared)
+        elif observed and type(member) is property:
+            members[name] = ObservedProperty(member, observed)
+
+    if not members:
+        return NamespaceClass
+
+    return type(NamespaceClass)(NamespaceClass.__name__, (NamespaceClass,), {
+        '__module__': NamespaceClass.__module__,
+        '__qualname__': NamespaceClass.__qualname__,
+        **members
+    })
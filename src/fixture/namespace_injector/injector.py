@@ -1,6 +1,10 @@
 from functools import partial
 from typing import Type, Callable
-from .steps.outer_scope import inject_fixtures
+from .steps.outer_scope import (
+    get_namespace_plan,
+    inject_fixtures,
+    inject_function
+)
 
 
 # I can't mix pytest fixtures with Django tests easily, I would like also
@@ -8,11 +12,24 @@ from .steps.outer_scope import inject_fixtures
 # to get fixtures workaround.
 
 
-def use_fixture_namespace(NamespaceClass: Type) -> Callable:
+def use_fixture_namespace(
+    NamespaceClass: Type,
+    select: str | Callable[[str], bool] | None = None,
+    setup_class: bool = False
+) -> Callable:
     '''
     Injects fixture into methods arguments from class properties.
     Method must starts with a `test` name.
 
+    Other methods can be selected using `select` rule: names regex
+    (matched from the beginning) or names predicate. Methods marked with
+    `@injectable` are always selected.
+
+    With `setup_class` (`unittest.TestCase` classes only) fixtures computed
+    once (e.g. `@cached_property`) are resolved in `setUpClass`, after the
+    original one, and closed in `tearDownClass`. Tests resolve only per-test
+    fixtures.
+
     Use in inspect module the following predicates for methods:
     - `isdatadescriptor` for `@property` annotated,
     - `ismethoddescriptor` for `@cached_property` annotated
@@ -35,4 +52,63 @@ def use_fixture_namespace(NamespaceClass: Type) -> Callable:
             assert something == ['a', 'b', 'c', 'd']
     ```
     '''
-    return partial(inject_fixtures, NamespaceClass)
+    return partial(
+        inject_fixtures,
+        NamespaceClass,
+        select=select,
+        setup_class=setup_class
+    )
+
+
+def injectable(func: Callable):
+    '''
+    Mark method to be injected by `use_fixture_namespace`, even if its name
+    doesn't start with a `test` name (e.g. `setUp`).
+    '''
+    setattr(func, 'injectable', True)
+    return func
+
+
+def inject(
+    namespace: Type,
+    select: str | Callable[[str], bool] | None = None
+) -> Callable:
+    '''
+    Injects fixture into any function or method arguments.
+
+    `namespace` is a namespace class or a class decorated with
+    `use_fixture_namespace`. Functions injected from the same namespace class
+    share fixtures (e.g. `@cached_property` is computed once for all of
+    them), functions injected from decorated class share fixtures with its
+    tests.
+
+    Decorating a class works like `use_fixture_namespace(namespace, select)`.
+
+    Example:
+    ```
+    @use_fixture_namespace(FixtureNamespace)
+    class TestClass:
+        def test_something(self, something): ...
+
+    @inject(TestClass)
+    def make_user(words):
+        return User(name=words[0])
+    ```
+    '''
+    def decorator(target):
+        plan = vars(namespace).get('__fixture_plan__')
+
+        if isinstance(target, type):
+            NamespaceClass = plan.namespace_class if plan else namespace
+            return inject_fixtures(NamespaceClass, target, select)
+
+        if plan is None:
+            plan = get_namespace_plan(namespace)
+        return inject_function(
+            plan,
+            f'{target.__module__}.{target.__qualname__}',
+            target,
+            helper=True
+        )
+
+    return decorator
@@ -0,0 +1,361 @@
+'''
+Kinds of namespace members injected as fixtures.
+
+Every kind matches namespace members and creates getters returning
+`(value, closable)` records, `closable.close()` is called after test
+(teardown, e.g. generator of `unzip` fixture). Constant kinds are resolved
+once, when namespace is compiled, and injected without any getter.
+
+New kinds are added with `register_kind`, they are matched before built-in
+ones:
+```
+class ConnectionKind(FixtureKind):
+    name = 'connection'
+
+    def match(self, member):
+        return isinstance(member, Connection)
+
+    def create_getter(self, namespace_class, namespace_context, name, member):
+        def getter():
+            connection = member.connect()
+            return connection, connection
+
+        return getter
+
+
+register_kind(ConnectionKind())
+```
+'''
+from collections.abc import Generator
+from functools import cached_property
+from threading import Lock
+from typing import Callable, Type
+import sys
+
+from fixture.namespace_injector.context import NamespaceContext
+from fixture.namespace_injector.records import FixtureRecord
+
+
+class FixtureKind:
+    "Base class of fixtures kinds."
+    # name reported by fixture plan
+    name = 'unknown'
+    # 'test' fixtures are resolved for every test, 'class' ones once
+    scope = 'test'
+    # resolved once with `resolve`, injected without getter
+    constant = False
+
+    def match(self, member) -> bool:
+        "Check if namespace member is fixture of this kind."
+        raise NotImplementedError
+
+    def create_getter(
+        self,
+        namespace_class: Type,
+        namespace_context: NamespaceContext,
+        name: str,
+        member
+    ) -> Callable[[], FixtureRecord]:
+        "Create function returning fixture record on every test call."
+        raise NotImplementedError
+
+    def resolve(self, namespace_class: Type, name: str, member):
+        "Get value of constant fixture."
+        return member
+
+    def unzip(self, member) -> bool:
+        "Check if fixture is marked with `unzip`."
+        return False
+
+    def member_scope(self, member) -> str:
+        "Get scope of fixture, kinds with configurable scope override it."
+        return self.scope
+
+    def per_test(self, member) -> bool:
+        '''
+        Check if getter has to be called for every test, also when value is
+        computed once (e.g. it resets or restores state).
+        '''
+        return self.member_scope(member) == 'test'
+
+
+def imported(module: str, name: str) -> type | None:
+    '''
+    Get class of fixtures module, None when module isn't imported yet.
+    Fixtures modules (mock, snapshot, ...) aren't imported with injector,
+    members can't be instances of their classes before they are imported.
+    '''
+    module = sys.modules.get(module)
+    return getattr(module, name, None) if module else None
+
+
+def create_attribute_getter(
+    namespace_context: NamespaceContext,
+    name: str,
+    unzip: bool
+) -> Callable[[], FixtureRecord]:
+    "Getter reading namespace object attribute."
+    if unzip:
+        # if property (method in class) is marked using unzip,
+        # then unpack it
+        def unzip_getter(name=name):
+            generator = getattr(namespace_context.instance, name)
+            return next(generator), generator
+
+        return unzip_getter
+    else:
+        # else just get value
+        def getter(name=name):
+            value = getattr(namespace_context.instance, name)
+            return value, value if isinstance(value, Generator) else None
+
+        return getter
+
+
+class PropertyKind(FixtureKind):
+    "`@property`, evaluated for every test."
+    name = 'property'
+
+    def match(self, member) -> bool:
+        return isinstance(member, property)
+
+    def unzip(self, member) -> bool:
+        # how to get access to unzip attribute
+        # @property: <class>.<method>.fget.unzip
+        return hasattr(member.fget, 'unzip')
+
+    def create_getter(self, namespace_class, namespace_context, name, member):
+        return create_attribute_getter(
+            namespace_context,
+            name,
+            self.unzip(member)
+        )
+
+
+class CachedPropertyKind(PropertyKind):
+    "`@cached_property`, evaluated once for namespace."
+    name = 'cached_property'
+    scope = 'class'
+
+    def match(self, member) -> bool:
+        return isinstance(member, cached_property)
+
+    def unzip(self, member) -> bool:
+        # @cached_property: <class>.<method>.func.unzip
+        return hasattr(member.func, 'unzip')
+
+
+class SharedKind(FixtureKind):
+    '''
+    `@property` or `@cached_property` marked with `@shared`, computed once and
+    reused by all namespaces. Shared values are never closed.
+    '''
+    name = 'shared'
+    scope = 'shared'
+
+    def match(self, member) -> bool:
+        return isinstance(member, (property, cached_property)) \
+            and hasattr(self.function(member), 'shared')
+
+    @staticmethod
+    def function(member):
+        # @property: fget, @cached_property: func
+        return getattr(member, 'fget', None) or getattr(member, 'func', None)
+
+    def create_getter(self, namespace_class, namespace_context, name, member):
+        if hasattr(self.function(member), 'unzip'):
+            raise ValueError('Shared fixture cannot be unzipped')
+
+        def shared_getter(name=name):
+            return getattr(namespace_context.instance, name), None
+
+        return shared_getter
+
+
+class CacheKind(FixtureKind):
+    '''
+    Method decorated with `functools.cache` (or `lru_cache`), called with
+    namespace object, so values are cached per thread namespace object.
+    Cached values are reused, so they are never closed.
+    '''
+    name = 'cache'
+    scope = 'class'
+
+    def match(self, member) -> bool:
+        return callable(member) and hasattr(member, 'cache_info')
+
+    def create_getter(self, namespace_class, namespace_context, name, member):
+        # skip method binding, call cache wrapper directly
+        def cache_getter(method=member):
+            return method(namespace_context.instance), None
+
+        return cache_getter
+
+
+class StaticMethodKind(FixtureKind):
+    "`@staticmethod` factory, called for every test."
+    name = 'staticmethod'
+
+    def match(self, member) -> bool:
+        return isinstance(member, staticmethod)
+
+    def unzip(self, member) -> bool:
+        return hasattr(member.__func__, 'unzip')
+
+    def create_getter(self, namespace_class, namespace_context, name, member):
+        factory = member.__func__
+        if self.unzip(member):
+            def unzip_getter(factory=factory):
+                generator = factory()
+                return next(generator), generator
+
+            return unzip_getter
+        else:
+            def getter(factory=factory):
+                value = factory()
+                return value, value if isinstance(value, Generator) else None
+
+            return getter
+
+
+class StreamKind(FixtureKind):
+    "`@stream` and `stream.file` fixtures, new reader for every test."
+    name = 'stream'
+
+    def match(self, member) -> bool:
+        Stream = imported('fixture.stream', 'Stream')
+        return Stream is not None and isinstance(member, Stream)
+
+    def create_getter(self, namespace_class, namespace_context, name, member):
+        def stream_getter(member=member):
+            reader = member.open(namespace_context.instance)
+            # reader closes its generator and file after test
+            return reader, reader
+
+        return stream_getter
+
+
+class MockKind(FixtureKind):
+    '''
+    `mock` fixtures, patch is started once per its scope and mock is reset
+    after every test.
+    '''
+    name = 'mock'
+
+    def match(self, member) -> bool:
+        MockFixture = imported('fixture.mock', 'MockFixture')
+        return MockFixture is not None and isinstance(member, MockFixture)
+
+    def member_scope(self, member) -> str:
+        return member.scope
+
+    def per_test(self, member) -> bool:
+        # mock is reset after every test
+        return True
+
+    def create_getter(self, namespace_class, namespace_context, name, member):
+        def mock_getter(member=member):
+            return member.start(), member.after_test
+
+        return mock_getter
+
+
+class SnapshotKind(FixtureKind):
+    '''
+    `@snapshot` seeding methods, run once per namespace, database snapshot is
+    restored for every next test.
+    '''
+    name = 'snapshot'
+    scope = 'class'
+
+    def match(self, member) -> bool:
+        Snapshot = imported('fixture.snapshot', 'Snapshot')
+        return Snapshot is not None and isinstance(member, Snapshot)
+
+    def per_test(self, member) -> bool:
+        # database is restored before every test
+        return True
+
+    def create_getter(self, namespace_class, namespace_context, name, member):
+        def snapshot_getter(member=member, name=name):
+            return member.get(
+                namespace_class,
+                name,
+                namespace_context.instance
+            ), None
+
+        return snapshot_getter
+
+
+class FactoryKind(FixtureKind):
+    '''
+    `@factory` methods, injected as callables memoising calls by arguments
+    within scope.
+    '''
+    name = 'factory'
+
+    def match(self, member) -> bool:
+        Factory = imported('fixture.factory', 'Factory')
+        return Factory is not None and isinstance(member, Factory)
+
+    def member_scope(self, member) -> str:
+        return member.scope
+
+    def create_getter(self, namespace_class, namespace_context, name, member):
+        def factory_getter(member=member):
+            call = member.open(namespace_class, namespace_context)
+            # values of test scope are closed after test, like generators
+            return call, call if member.scope == 'test' else None
+
+        return factory_getter
+
+
+class ConstantKind(FixtureKind):
+    '''
+    Plain class attribute (not a function nor descriptor), the same object
+    is injected into every test.
+    '''
+    name = 'constant'
+    scope = 'class'
+    constant = True
+
+    def match(self, member) -> bool:
+        return not hasattr(type(member), '__get__')
+
+
+# matched in order, the first matching kind is used
+kinds: list[FixtureKind] = [
+    SharedKind(),
+    PropertyKind(),
+    CachedPropertyKind(),
+    CacheKind(),
+    StaticMethodKind(),
+    StreamKind(),
+    MockKind(),
+    SnapshotKind(),
+    FactoryKind(),
+    ConstantKind()
+]
+_lock = Lock()
+
+
+def register_kind(kind: FixtureKind):
+    "Add fixture kind, matched before already registered kinds."
+    global kinds
+    with _lock:
+        kinds = [kind, *kinds]
+
+
+def unregister_kind(kind: FixtureKind):
+    "Remove fixture kind, e.g. registered by tests or plugins."
+    global kinds
+    with _lock:
+        kinds = [k for k in kinds if k is not kind]
+
+
+def find_kind(member) -> FixtureKind | None:
+    "Get kind of namespace member, None if it is not a fixture."
+    for kind in kinds:
+        if kind.match(member):
+            return kind
+    return None
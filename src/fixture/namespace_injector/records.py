@@ -0,0 +1,71 @@
+from collections.abc import Generator
+from typing import TypedDict
+
+
+class GetterInfo(TypedDict):
+    "Dict shape of `FixtureRecord`, kept for backward compatibility."
+    value: object
+    generator: Generator[object, None, None] | None
+
+
+# (value, generator or other object which has to be closed after test),
+# tuples are the cheapest records to build for every fixture on every call
+FixtureRecord = tuple[object, Generator[object, None, None] | None]
+
+
+class InjectionPlan:
+    '''
+    Fixtures used by test methods of decorated class, available as
+    `__fixture_plan__` class attribute.
+    '''
+    __slots__ = (
+        'namespace_class',
+        'namespace_context',
+        'fixtures_getters',
+        'constants',
+        'kinds',
+        'positions',
+        'tests',
+        'missing',
+        'helpers',
+        'helpers_missing'
+    )
+
+    def __init__(
+        self,
+        namespace_class: type,
+        namespace_context,
+        fixtures_getters: dict,
+        constants: dict | None = None,
+        kinds: dict | None = None,
+        priorities: dict[str, int] | None = None
+    ):
+        self.namespace_class = namespace_class
+        self.namespace_context = namespace_context
+        self.fixtures_getters = fixtures_getters
+        # fixture name: value resolved when namespace was compiled
+        self.constants = constants or {}
+        # fixture name: kind, in namespace definition order
+        self.kinds = kinds if kinds is not None else dict.fromkeys(
+            fixtures_getters
+        )
+        # fixture name: evaluation position (priority, then definition
+        # order), built once, so test fixtures are ordered without walking
+        # all namespace members
+        priorities = priorities or {}
+        self.positions = {
+            name: position
+            for (position, name) in enumerate(sorted(
+                self.kinds,
+                key=lambda name: priorities.get(name, 0)
+            ))
+        }
+        # test method name: fixtures names in injection order
+        self.tests: dict[str, list[str]] = {}
+        # test method name: not existing fixtures names
+        self.missing: dict[str, set[str]] = {}
+        # functions injected with `inject`, kept apart from tests
+        # qualified name: fixtures names in injection order
+        self.helpers: dict[str, list[str]] = {}
+        # qualified name: not existing fixtures names
+        self.helpers_missing: dict[str, set[str]] = {}
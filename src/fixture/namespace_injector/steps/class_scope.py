@@ -0,0 +1,136 @@
+'''
+Class scope steps, executed once per `unittest.TestCase` class, in
+`setUpClass` and `tearDownClass` (`use_fixture_namespace(setup_class=True)`).
+'''
+from functools import partial
+from typing import Callable, Type
+import sys
+
+from fixture import hooks
+from fixture.namespace_injector.context import SharedCachedProperty
+from fixture.namespace_injector.records import InjectionPlan
+
+
+# 1.
+def select_class_fixtures(plan: InjectionPlan) -> set[str]:
+    "Get fixtures computed once, resolved in class setup"
+    members = vars(plan.namespace_class)
+    return {
+        name
+        for (name, kind) in plan.kinds.items()
+        if not kind.constant and not kind.per_test(members[name])
+    }
+
+
+# 2.
+def setup_class_fixtures(
+    plan: InjectionPlan,
+    names: list[str]
+) -> tuple[dict[str, object], list[tuple[str, object]]]:
+    "Resolve class fixtures, get values and closables"
+    observers = hooks.active
+    values, closables = {}, []
+    try:
+        for name in names:
+            getter = plan.fixtures_getters[name]
+            for hook in reversed(observers):
+                getter = partial(hook.setup, plan.namespace_class, name, getter)
+            values[name], closable = getter()
+            if closable:
+                closables.append((name, closable))
+    except BaseException:
+        # fail fast, fixtures resolved so far are cleaned up
+        teardown_class_fixtures(plan, closables)
+        raise
+    return values, closables
+
+
+# 3.
+def teardown_class_fixtures(
+    plan: InjectionPlan,
+    closables: list[tuple[str, object]]
+):
+    '''
+    Close class fixtures in reversed order, closed cached values are dropped,
+    so they are computed again by the next class (or run) using them.
+    '''
+    observers = hooks.active
+    namespace_members = vars(type(plan.namespace_context.instance))
+    for (name, closable) in reversed(closables):
+        close = closable.close
+        for hook in reversed(observers):
+            close = partial(
+                hook.teardown,
+                plan.namespace_class,
+                name,
+                closable,
+                close
+            )
+        try:
+            close()
+        finally:
+            member = namespace_members.get(name)
+            if isinstance(member, SharedCachedProperty):
+                member.shared.clear(name)
+
+
+def wrap_class_setup(
+    InjectionClass: Type,
+    plan: InjectionPlan,
+    injections: list[tuple[dict, list[str]]]
+):
+    '''
+    Resolve class fixtures after original `setUpClass` (e.g. inside Django
+    class transaction) and put them into tests injected values, close them
+    before original `tearDownClass`.
+    '''
+    names = [
+        name
+        for name in sorted(plan.kinds, key=plan.positions.__getitem__)
+        if any(name in test_names for (_, test_names) in injections)
+    ]
+    original_setup: Callable = vars(InjectionClass).get('setUpClass')
+    original_teardown: Callable = vars(InjectionClass).get('tearDownClass')
+    # closables of resolved fixtures
+    resolved = []
+
+    def call(original, cls, name: str):
+        if original is not None:
+            original.__func__(cls)
+        else:
+            getattr(super(InjectionClass, cls), name)()
+
+    def setUpClass(cls):
+        call(original_setup, cls, 'setUpClass')
+        try:
+            values, closables = setup_class_fixtures(plan, names)
+        except BaseException:
+            # tearDownClass is not called when setUpClass fails
+            call(original_teardown, cls, 'tearDownClass')
+            raise
+        resolved.extend(closables)
+        for (constants, test_names) in injections:
+            for name in test_names:
+                constants[name] = values[name]
+
+    def tearDownClass(cls):
+        try:
+            for (constants, test_names) in injections:
+                for name in test_names:
+                    constants.pop(name, None)
+            closables = resolved.copy()
+            resolved.clear()
+            teardown_class_fixtures(plan, closables)
+            # patches of class scoped mocks and factories values end with
+            # class, there are none before their modules are imported
+            mock = sys.modules.get('fixture.mock')
+            if mock:
+                mock.stop_mocks('class')
+            factory = sys.modules.get('fixture.factory')
+            if factory:
+                factory.close_factories('class')
+        finally:
+            call(original_teardown, cls, 'tearDownClass')
+
+    setattr(InjectionClass, 'setUpClass', classmethod(setUpClass))
+    setattr(InjectionClass, 'tearDownClass', classmethod(tearDownClass))
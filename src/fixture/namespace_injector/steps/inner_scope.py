@@ -0,0 +1,146 @@
+'''
+Inner scope steps, executed on every test call.
+'''
+from functools import partial, wraps
+from typing import Callable, Generator
+
+from fixture import hooks
+from fixture.namespace_injector.records import FixtureRecord
+
+
+# 1.
+def extract_fixtures(
+    fix_maping: dict[str, Callable[[], FixtureRecord]],
+    constants: dict[str, object] | None = None
+) -> tuple[dict[str, object], list[Generator]]:
+    "Unpack fixtures values and generators from properties"
+    # constants are resolved once, they don't have getters
+    values = constants.copy() if constants else {}
+    # single pass without intermediate records mapping,
+    # records are dropped right after unpacking
+    generators = []
+    try:
+        for fixture_name, getter in fix_maping.items():
+            values[fixture_name], generator = getter()
+            if generator:
+                generators.append(generator)
+    except BaseException:
+        # fail fast, fixtures evaluated so far are cleaned up
+        cleanup_generators(generators)
+        raise
+    return values, generators
+
+
+# 2.
+def cleanup_generators(generators: list[Generator]):
+    "Cleanup generators (important for memory leakage)"
+    for generator in generators:
+        generator.close()
+
+
+def skip_test(reason: str):
+    "Skip test, `unittest` is imported only when a test is skipped"
+    from unittest import SkipTest
+    raise SkipTest(reason)
+
+
+def check_preconditions(preconditions: tuple[Callable, ...], args: tuple):
+    "Check test requirements before fixtures are evaluated"
+    for check in preconditions:
+        if not check(*args):
+            skip_test(f'Precondition {check.__qualname__} failed')
+
+
+def call_observed(
+    func: Callable,
+    fix_maping: dict,
+    constants: dict,
+    preconditions: tuple[Callable, ...],
+    namespace_class: type,
+    observers: tuple[hooks.FixtureHook, ...],
+    args: tuple,
+    kwargs: dict
+):
+    "Run function like `injector` does, wrapping steps with hooks"
+    def run():
+        check_preconditions(preconditions, args)
+        only_values = constants.copy()
+        generators = []
+        try:
+            for fixture_name, getter in fix_maping.items():
+                for hook in reversed(observers):
+                    getter = partial(
+                        hook.setup,
+                        namespace_class,
+                        fixture_name,
+                        getter
+                    )
+                only_values[fixture_name], generator = getter()
+                if generator:
+                    generators.append((fixture_name, generator))
+            only_values.update(kwargs)
+            return func(*args, **only_values)
+        finally:
+            for (fixture_name, generator) in generators:
+                close = generator.close
+                for hook in reversed(observers):
+                    close = partial(
+                        hook.teardown,
+                        namespace_class,
+                        fixture_name,
+                        generator,
+                        close
+                    )
+                close()
+
+    for hook in reversed(observers):
+        run = partial(hook.call, namespace_class, func, run)
+    return run()
+
+
+def create_wrapper(
+    func: Callable,
+    fix_maping: dict,
+    namespace_class: type | None = None,
+    constants: dict | None = None,
+    preconditions: tuple[Callable, ...] = ()
+):
+    '''
+    Create wrapper for function
+    '''
+    if constants is None:
+        # the same dict is kept, class fixtures are put into it in setUpClass
+        constants = {}
+
+    # copy values from function to nested function
+    # to save current reference instead of the last variable reference
+    @wraps(func)
+    def injector(*args, func=func, fix_maping=fix_maping, **kwargs):
+        observers = hooks.active
+        if observers:
+            return call_observed(
+                func,
+                fix_maping,
+                constants,
+                preconditions,
+                namespace_class,
+                observers,
+                args,
+                kwargs
+            )
+        if preconditions:
+            # cheap test requirements before any fixture
+            check_preconditions(preconditions, args)
+        # unpack fixtures values and generators from properties
+        only_values, generators = extract_fixtures(fix_maping, constants)
+        # fixtures has lower priority than default test arguments
+        only_values.update(kwargs)
+        try:
+            # run function with fixtures
+            ret_val = func(*args, **only_values)
+            return ret_val
+        finally:
+            # cleanup generators (important for memory leakage)
+            cleanup_generators(generators)
+
+    return injector
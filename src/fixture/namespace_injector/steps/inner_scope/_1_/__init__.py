@@ -1,3 +0,0 @@
-from .extractor import extract_fixtures
-
-__all__ = ['extract_fixtures']
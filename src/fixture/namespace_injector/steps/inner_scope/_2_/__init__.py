@@ -1,3 +0,0 @@
-from .extractor import extract_values
-
-__all__ = ['extract_values']
@@ -1,3 +0,0 @@
-from .cleanup import cleanup_generators
-
-__all__ = ['cleanup_generators']
@@ -1,3 +0,0 @@
-from .pipe import create_wrapper
-
-__all__ = ['create_wrapper']
@@ -0,0 +1,387 @@
+'''
+Outer scope steps, executed once when test class is decorated.
+'''
+import inspect
+import re
+import sys
+from functools import cached_property
+from threading import Lock
+from types import ModuleType
+from typing import Callable, Sequence, Type, TypeVar
+from weakref import WeakKeyDictionary
+
+from fixture.error import FixtureError
+from fixture.members import member_function
+from fixture.namespace_injector.context import (
+    NamespaceContext,
+    create_namespace_class
+)
+from fixture.namespace_injector.kinds import FixtureKind, find_kind
+from fixture.namespace_injector.records import (
+    FixtureRecord,
+    GetterInfo,
+    InjectionPlan
+)
+from fixture.namespace_injector.steps.class_scope import (
+    select_class_fixtures,
+    wrap_class_setup
+)
+from fixture.namespace_injector.steps.inner_scope import create_wrapper
+from fixture.state import FunctionBackup, deferred_verification
+
+T = TypeVar('T')
+
+
+# 1.
+def create_getter(
+    namespace_class: Type[T],
+    namespace_context: NamespaceContext,
+    property_name: str,
+    property: property | cached_property,
+    kind: FixtureKind | None = None
+) -> Callable[[], FixtureRecord]:
+    "Create getter of namespace member with its (or found) fixture kind"
+    kind = kind or find_kind(property)
+    if kind is None or kind.constant:
+        raise ValueError('Invalid method')
+    return kind.create_getter(
+        namespace_class,
+        namespace_context,
+        property_name,
+        property
+    )
+
+
+def create_fixtures(
+    NamespaceClass: Type,
+    namespace_context: NamespaceContext
+) -> tuple[dict[str, FixtureKind], dict[str, Callable], dict[str, object]]:
+    "Get fixtures kinds, getters and constants values from namespace class"
+    members_kinds = (
+        # members are not sorted, definition order is kept
+        # http://192.168.2.1:3000/alewandowski/django-fixtures/issues/4
+        (name, find_kind(member))
+        for (name, member) in NamespaceClass.__dict__.items()
+        # remove from query set hidden or protected properties
+        if not name.startswith('_')
+    )
+    fixtures_kinds = {
+        # property name: kind
+        # get members of known kinds (@property, @cached_property, ...)
+        name: kind
+        for (name, kind) in members_kinds
+        if kind
+    }
+    fixtures_getters = {
+        # property name: getter
+        # getter gets the latest property value on every call
+        name: create_getter(
+            NamespaceClass,
+            namespace_context,
+            name,
+            NamespaceClass.__dict__[name],
+            kind
+        )
+        for (name, kind) in fixtures_kinds.items()
+        if not kind.constant
+    }
+    fixtures_constants = {
+        # resolved once, injected without getter
+        name: kind.resolve(NamespaceClass, name, NamespaceClass.__dict__[name])
+        for (name, kind) in fixtures_kinds.items()
+        if kind.constant
+    }
+    return fixtures_kinds, fixtures_getters, fixtures_constants
+
+
+def create_fixtures_priorities(
+    NamespaceClass: Type,
+    fixtures_kinds: dict[str, FixtureKind]
+) -> dict[str, int]:
+    "Get priorities of fixtures marked with `@priority`"
+    priorities = {}
+    for name in fixtures_kinds:
+        func = member_function(NamespaceClass.__dict__[name])
+        if hasattr(func, 'priority'):
+            priorities[name] = func.priority
+    return priorities
+
+
+# 2.
+def create_selector(
+    select: str | Callable[[str], bool] | None
+) -> Callable[[str], bool]:
+    "Create methods names predicate from selection rule."
+    if select is None:
+        return lambda fname: fname.startswith('test')
+    if isinstance(select, str):
+        return re.compile(select).match
+    return select
+
+
+def extract_tests_methods(
+    InjectionClass: Type,
+    select: str | Callable[[str], bool] | None = None
+):
+    "Get methods with names from desired class"
+    selector = create_selector(select)
+    return [
+        (fname, func)
+        # get methods
+        for (fname, func) in inspect.getmembers(InjectionClass, inspect.isfunction)
+        # get only test methods or explicitly marked ones
+        if selector(fname) or hasattr(func, 'injectable')
+    ]
+
+
+# 3.
+def extract_args_names(func: Callable):
+    "Get method arguments without self attribute"
+    signature = inspect.signature(func)
+    func_args_names = signature.parameters.keys()
+    func_args_names = filter(lambda x: x != 'self', func_args_names)
+    func_args_names = list(func_args_names)
+    return func_args_names
+
+
+# 4.
+def filter_fixtures(
+    fixtures_getters: dict,
+    func_args_names: list[str],
+    positions: dict[str, int] | None = None
+):
+    "Set values for fixtures to be used in injector"
+    if positions is None:
+        positions = {name: i for (i, name) in enumerate(fixtures_getters)}
+    return {
+        prop_name: fixtures_getters[prop_name]
+        # look up only function arguments, sorted by position to have
+        # exactly the same order of injecting properties
+        # from top to bottom of namespace class
+        for prop_name in sorted(
+            (name for name in func_args_names if name in fixtures_getters),
+            key=positions.__getitem__
+        )
+    }
+
+
+# 5.
+def verify_fixtures(func_args_names: list[str], fix_map: dict[str, Callable]):
+    "Check if all needed fixtures exists"
+    needed_fixtures = [
+        name
+        for name in func_args_names
+        if name not in fix_map
+    ]
+    if needed_fixtures:
+        raise FixtureError('Fixtures does not exists', set(needed_fixtures))
+
+
+def compile_namespace(
+    NamespaceClass: Type,
+    sources: Sequence[InjectionPlan] = ()
+) -> InjectionPlan:
+    '''
+    Create getters of namespace fixtures, shared by injected functions.
+
+    Cached fixtures provably the same as in `sources` (plans of tests copied
+    with `func_copy`) reuse their values.
+    '''
+    # create per-thread object class to get access to properties,
+    # cached properties are evaluated once and shared between threads
+    namespace_context = NamespaceContext(create_namespace_class(
+        NamespaceClass,
+        [type(source.namespace_context.instance) for source in sources]
+    ))
+
+    # get fixtures from namespace class
+    fixtures_kinds, fixtures_getters, fixtures_constants = create_fixtures(
+        NamespaceClass,
+        namespace_context
+    )
+    # fixtures marked with @priority are evaluated before/after others
+    fixtures_priorities = create_fixtures_priorities(
+        NamespaceClass,
+        fixtures_kinds
+    )
+    # keep what was injected, for tools walking decorated classes
+    return InjectionPlan(
+        NamespaceClass,
+        namespace_context,
+        fixtures_getters,
+        fixtures_constants,
+        fixtures_kinds,
+        fixtures_priorities
+    )
+
+
+# namespace class: plan shared by functions injected directly from namespace
+_namespaces_plans: WeakKeyDictionary[type, InjectionPlan] = WeakKeyDictionary()
+_namespaces_plans_lock = Lock()
+
+
+def get_namespace_plan(NamespaceClass: Type) -> InjectionPlan:
+    "Get (or compile) plan shared by functions injected from namespace."
+    plan = _namespaces_plans.get(NamespaceClass)
+    if plan is None:
+        with _namespaces_plans_lock:
+            plan = _namespaces_plans.get(NamespaceClass)
+            if plan is None:
+                plan = compile_namespace(NamespaceClass)
+                _namespaces_plans[NamespaceClass] = plan
+    return plan
+
+
+def find_copied_plans(
+    test_methods: list[tuple[str, Callable]]
+) -> list[InjectionPlan]:
+    "Get plans of decorated classes which tests were copied with `func_copy`"
+    plans = []
+    for (_, func) in test_methods:
+        source = getattr(func, '__func_copy_source__', None)
+        plan = getattr(source, '__fixture_plan__', None)
+        if plan is not None and plan not in plans:
+            plans.append(plan)
+    return plans
+
+
+def inject_function(
+    plan: InjectionPlan,
+    fname: str,
+    func: Callable,
+    class_fixtures: set[str] = frozenset(),
+    injections: list[tuple[dict, list[str]]] | None = None,
+    helper: bool = False
+):
+    '''
+    Inject fixtures from compiled namespace to function.
+
+    `class_fixtures` are not resolved by function, they are put into its
+    injected values in `setUpClass`, see `injections`. Fixtures of `helper`
+    functions are saved apart from tests.
+    '''
+    tests, missing = (plan.helpers, plan.helpers_missing) if helper \
+        else (plan.tests, plan.missing)
+    # get method arguments without self attribute
+    func_args_names = extract_args_names(func)
+
+    # set values for fixtures to be used in injector
+    fix_maping = filter_fixtures(
+        plan.fixtures_getters,
+        func_args_names,
+        plan.positions
+    )
+    constants = filter_fixtures(
+        plan.constants,
+        func_args_names,
+        plan.positions
+    )
+
+    # check if all needed fixtures exists
+    try:
+        verify_fixtures(func_args_names, plan.kinds)
+    except FixtureError as error:
+        if not deferred_verification.get():
+            raise
+        missing[fname] = set(error.fixtures)
+    tests[fname] = list(
+        filter_fixtures(plan.kinds, func_args_names, plan.positions)
+    )
+
+    # fixtures resolved in setUpClass are injected like constants
+    class_names = [name for name in fix_maping if name in class_fixtures]
+    if class_names:
+        for name in class_names:
+            del fix_maping[name]
+        injections.append((constants, class_names))
+
+    # create wrapper for function
+    injector = create_wrapper(
+        func,
+        fix_maping,
+        plan.namespace_class,
+        constants,
+        getattr(func, 'preconditions', ())
+    )
+    # copies of injected function (`func_copy`) can share its fixtures
+    setattr(injector, '__fixture_plan__', plan)
+    return injector
+
+
+def inject_fixtures(
+    NamespaceClass: Type,
+    InjectionClass: Type[T],
+    select: str | Callable[[str], bool] | None = None,
+    setup_class: bool = False
+) -> Type[T]:
+    "Inject fixtures to every selected (`test`) method of `InjectionClass`."
+    if setup_class:
+        # unittest is imported only by classes which use it
+        from unittest import TestCase
+        if not issubclass(InjectionClass, TestCase):
+            raise TypeError('setup_class requires unittest.TestCase class')
+
+    # get methods with names from desired class
+    test_methods = extract_tests_methods(InjectionClass, select)
+
+    # copied tests share provably the same fixtures with their sources
+    plan = compile_namespace(NamespaceClass, find_copied_plans(test_methods))
+
+    # fixtures computed once are resolved in setUpClass
+    class_fixtures = select_class_fixtures(plan) if setup_class \
+        else frozenset()
+    # (injected values, names of class fixtures) of every method
+    injections = []
+
+    # make fixture injections for every test method
+    for (fname, func) in test_methods:
+        # save original function for retrieval/backup
+        FunctionBackup().save(func)
+
+        # create wrapper for function
+        injector = inject_function(
+            plan,
+            fname,
+            func,
+            class_fixtures,
+            injections
+        )
+
+        # inject function with fixtures
+        setattr(InjectionClass, fname, injector)
+
+    if setup_class:
+        wrap_class_setup(InjectionClass, plan, injections)
+
+    setattr(InjectionClass, '__fixture_plan__', plan)
+
+    # return modified class with new methods injections
+    return InjectionClass
+
+
+def register_legacy_modules():
+    '''
+    Numbered steps package was merged into this module, records and getter
+    are still importable from its paths (`steps.outer_scope._1_` and
+    `steps.outer_scope._1_.create_getter`).
+    '''
+    members = {
+        'GetterInfo': GetterInfo,
+        'FixtureRecord': FixtureRecord,
+        'NamespaceContext': NamespaceContext,
+        'create_namespace_class': create_namespace_class,
+        'create_getter': create_getter
+    }
+    package = ModuleType(f'{__name__}._1_')
+    package.__path__ = []
+    package.__dict__.update(members)
+    module = ModuleType(f'{package.__name__}.create_getter')
+    module.__dict__.update(members)
+    # like imported submodule, bound to its package
+    package.create_getter = module
+    sys.modules[package.__name__] = package
+    sys.modules[module.__name__] = module
+    setattr(sys.modules[__name__], '_1_', package)
+
+
+register_legacy_modules()
@@ -1,4 +0,0 @@
-from .builder import create_fixtures_getters
-from .create_getter import GetterInfo
-
-__all__ = ['create_fixtures_getters', 'GetterInfo']
@@ -1,3 +0,0 @@
-from .extractor import extract_tests_methods
-
-__all__ = ['extract_tests_methods']
@@ -1,3 +0,0 @@
-from .extractor import extract_args_names
-
-__all__ = ['extract_args_names']
@@ -1,3 +0,0 @@
-from .filter import filter_fixtures
-
-__all__ = ['filter_fixtures']
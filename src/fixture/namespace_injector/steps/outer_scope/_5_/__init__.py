@@ -1,3 +0,0 @@
-from .verify import verify_fixtures
-
-__all__ = ['verify_fixtures']
@@ -1,3 +0,0 @@
-from .pipe import inject_fixtures
-
-__all__ = ['inject_fixtures']
@@ -0,0 +1,66 @@
+'''
+Fixtures evaluation order.
+
+Fixtures are evaluated in namespace definition order, `@priority` moves
+fixture before (lower) or after (higher) others, so cheap fixtures which
+can fail fast are evaluated before expensive setup. `@precondition` checks
+test requirements before any fixture is evaluated.
+'''
+from typing import Callable
+
+# named priorities, fixtures without priority have 0
+GROUPS = {
+    'precondition': -200,
+    'cheap': -100,
+    'default': 0,
+    'expensive': 100
+}
+
+
+def priority(value: int | str):
+    '''
+    Mark property with evaluation priority - fixtures with lower priority are
+    evaluated first, fixtures with the same priority in definition order.
+    Priority is a number or group name (see `GROUPS`).
+
+    Example:
+    ```
+    class Namespace:
+        @property
+        @priority('expensive')
+        def database(self): ...
+
+        @property
+        @priority('cheap')
+        def settings(self): ...
+    ```
+    '''
+    if isinstance(value, str):
+        value = GROUPS[value]
+
+    def mark(func: Callable):
+        setattr(func, 'priority', value)
+        return func
+
+    return mark
+
+
+def precondition(check: Callable):
+    '''
+    Check test requirement before its fixtures are evaluated. `check` is
+    called with test positional arguments (e.g. `self`), it can raise
+    exception, returned false value skips test (`unittest.SkipTest`).
+
+    Example:
+    ```
+    @precondition(lambda self: shutil.which('docker'))
+    def test_container(self, container): ...
+    ```
+    '''
+    def mark(func: Callable):
+        # the outermost check is the first one
+        preconditions = (check, *getattr(func, 'preconditions', ()))
+        setattr(func, 'preconditions', preconditions)
+        return func
+
+    return mark
@@ -0,0 +1,247 @@
+'''
+Static fixture plan of test modules.
+
+Test modules are imported once (with deferred verification, so all missing
+fixtures are reported in a single pass) and every class decorated with
+`use_fixture_namespace` is described: which fixtures its tests use, their
+kinds, scopes and estimated costs.
+'''
+from concurrent.futures import ProcessPoolExecutor
+from importlib import import_module
+from pathlib import Path
+from typing import Iterable
+import json
+import sys
+
+from fixture.namespace_injector.kinds import find_kind
+from fixture.state import deferred_verification
+
+# pytest default test files
+TEST_FILES = ('test_*.py', '*_test.py')
+
+
+def find_modules(paths: Iterable[str]) -> list[Path]:
+    "Get test files from files and directories."
+    found = []
+    for path in map(Path, paths):
+        if path.is_dir():
+            found.extend(sorted({
+                file
+                for pattern in TEST_FILES
+                for file in path.rglob(pattern)
+            }))
+        else:
+            found.append(path)
+    return found
+
+
+def import_path(path: Path):
+    '''
+    Import file as module, like pytest `prepend` import mode: the first
+    directory above packages is inserted into `sys.path`.
+    '''
+    path = path.resolve()
+    parts = [path.stem]
+    root = path.parent
+    while (root / '__init__.py').exists():
+        parts.insert(0, root.name)
+        root = root.parent
+
+    if str(root) not in sys.path:
+        sys.path.insert(0, str(root))
+
+    return import_module('.'.join(parts))
+
+
+def describe_fixture(NamespaceClass: type, name: str) -> dict:
+    "Get fixture kind and scope."
+    member = NamespaceClass.__dict__[name]
+    kind = find_kind(member)
+    return {
+        'kind': kind.name,
+        'scope': kind.member_scope(member),
+        'unzip': kind.unzip(member)
+    }
+
+
+def qualified_name(obj) -> str:
+    return f'{obj.__module__}.{obj.__qualname__}'
+
+
+def plan_module(path: Path) -> dict:
+    '''
+    Import test module and describe its decorated classes.
+
+    Result has JSON compatible types, so it can be returned from worker
+    processes.
+    '''
+    token = deferred_verification.set(True)
+    try:
+        module = import_path(path)
+    except Exception as error:
+        return {'path': str(path), 'error': repr(error)}
+    finally:
+        deferred_verification.reset(token)
+
+    classes, namespaces = {}, {}
+    for klass in vars(module).values():
+        plan = vars(klass).get('__fixture_plan__') \
+            if isinstance(klass, type) else None
+        # skip classes imported from other modules
+        if plan is None or klass.__module__ != module.__name__:
+            continue
+
+        namespace_name = qualified_name(plan.namespace_class)
+        namespaces.setdefault(namespace_name, {
+            name: describe_fixture(plan.namespace_class, name)
+            for name in plan.kinds
+        })
+        classes[klass.__qualname__] = {
+            'namespace': namespace_name,
+            'tests': {
+                fname: {
+                    'fixtures': fixtures,
+                    'missing': sorted(plan.missing.get(fname, ()))
+                }
+                for (fname, fixtures) in plan.tests.items()
+            },
+            # functions injected with `inject(klass)`, they aren't tests
+            'helpers': {
+                name: {
+                    'fixtures': fixtures,
+                    'missing': sorted(plan.helpers_missing.get(name, ()))
+                }
+                for (name, fixtures) in plan.helpers.items()
+            }
+        }
+
+    return {
+        'path': str(path),
+        'module': module.__name__,
+        'classes': classes,
+        'namespaces': namespaces
+    }
+
+
+def estimate_costs(report: dict, timings: dict[str, float]):
+    '''
+    Add estimated costs (seconds) from recorded fixture timings
+    (`{"<module>.<Namespace>.<fixture>": seconds}`).
+
+    Test cost sums test scoped fixtures, class (and shared) scoped fixtures
+    are paid once per class.
+    '''
+    for (namespace_name, namespace) in report['namespaces'].items():
+        for (name, info) in namespace['fixtures'].items():
+            info['cost'] = timings.get(f'{namespace_name}.{name}')
+
+    for module in report['modules']:
+        for klass in module.get('classes', {}).values():
+            fixtures = report['namespaces'][klass['namespace']]['fixtures']
+            class_scoped = set()
+            klass['cost'] = 0.0
+            for test in klass['tests'].values():
+                test['cost'] = 0.0
+                for name in test['fixtures']:
+                    cost = fixtures[name]['cost'] or 0.0
+                    if fixtures[name]['scope'] == 'test':
+                        test['cost'] += cost
+                    elif name not in class_scoped:
+                        class_scoped.add(name)
+                        klass['cost'] += cost
+                klass['cost'] += test['cost']
+
+
+def build_plan(
+    paths: Iterable[str],
+    timings: dict[str, float] | None = None,
+    jobs: int = 1
+) -> dict:
+    "Build plan of all test modules in paths."
+    modules = find_modules(paths)
+    if jobs > 1:
+        # every module is imported in fresh worker process
+        with ProcessPoolExecutor(jobs) as pool:
+            results = list(pool.map(plan_module, modules))
+    else:
+        results = list(map(plan_module, modules))
+
+    # merge namespaces used across modules
+    namespaces = {}
+    used = {}
+    for result in results:
+        for (name, fixtures) in result.pop('namespaces', {}).items():
+            namespaces.setdefault(name, {'fixtures': fixtures})
+            used.setdefault(name, set())
+        for klass in result.get('classes', {}).values():
+            functions = (*klass['tests'].values(), *klass['helpers'].values())
+            for function in functions:
+                used[klass['namespace']].update(function['fixtures'])
+
+    for (name, namespace) in namespaces.items():
+        namespace['unused'] = [
+            fixture
+            for (fixture, info) in namespace['fixtures'].items()
+            # plain class attributes are often not meant as fixtures
+            if fixture not in used[name] and info['kind'] != 'constant'
+        ]
+
+    report = {
+        'modules': results,
+        'namespaces': namespaces,
+        'missing': [
+            {
+                'test': f'{result["module"]}.{klass_name}.{fname}',
+                'fixtures': test['missing']
+            }
+            for result in results
+            for (klass_name, klass) in result.get('classes', {}).items()
+            for (fname, test) in klass['tests'].items()
+            if test['missing']
+        ] + [
+            {
+                'helper': name,
+                'fixtures': helper['missing']
+            }
+            for result in results
+            for klass in result.get('classes', {}).values()
+            for (name, helper) in klass['helpers'].items()
+            if helper['missing']
+        ],
+        'errors': [
+            {'path': result['path'], 'error': result['error']}
+            for result in results
+            if 'error' in result
+        ]
+    }
+    estimate_costs(report, timings or {})
+    return report
+
+
+def main(args) -> int:
+    "`plan` command of command line interface."
+    timings = {}
+    if args.timings:
+        timings = json.loads(Path(args.timings).read_text())
+
+    report = build_plan(args.paths, timings, args.jobs)
+    json.dump(report, args.output, indent=2)
+    args.output.write('\n')
+
+    for missing in report['missing']:
+        print(
+            f'{missing.get("test") or missing["helper"]}: '
+            f'fixtures does not exists: '
+            f'{", ".join(missing["fixtures"])}',
+            file=sys.stderr
+        )
+    for (name, namespace) in report['namespaces'].items():
+        if namespace['unused']:
+            print(
+                f'{name}: unused fixtures: {", ".join(namespace["unused"])}',
+                file=sys.stderr
+            )
+    for error in report['errors']:
+        print(f'{error["path"]}: {error["error"]}', file=sys.stderr)
+
+    return 1 if report['missing'] or report['errors'] else 0
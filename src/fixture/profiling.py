@@ -0,0 +1,215 @@
+'''
+Profiling of fixtures: time (`cProfile`) and memory (`tracemalloc`) spent
+on getting every fixture value and closing its generator.
+
+Results are aggregated per fixture and per namespace class and written as
+`pstats` files and memory report:
+- `<namespace>.<fixture>.<setup|teardown>.pstats`,
+- `<namespace>.pstats`,
+- `memory.json` and `memory.txt`.
+'''
+from contextlib import contextmanager
+from pathlib import Path
+from threading import Lock
+import cProfile
+import json
+import pstats
+import sys
+import tracemalloc
+
+from fixture import hooks
+
+
+def namespace_name(namespace_class: type) -> str:
+    return f'{namespace_class.__module__}.{namespace_class.__qualname__}'
+
+
+class MemoryStats:
+    "Memory allocated by fixture calls."
+    __slots__ = ('calls', 'retained', 'peak', 'sites')
+
+    def __init__(self):
+        self.calls = 0
+        # bytes still allocated after calls
+        self.retained = 0
+        # the biggest peak of single call
+        self.peak = 0
+        # allocation site: retained bytes (only with snapshots)
+        self.sites: dict[str, int] = {}
+
+    def as_dict(self) -> dict:
+        return {
+            'calls': self.calls,
+            'retained': self.retained,
+            'peak': self.peak,
+            'sites': dict(sorted(
+                self.sites.items(),
+                key=lambda item: -item[1]
+            )[:10])
+        }
+
+
+class FixtureProfiler(hooks.FixtureHook):
+    '''
+    Hook profiling fixtures.
+
+    With `snapshots` every call takes `tracemalloc` snapshots to find
+    allocation sites, which is much slower.
+    '''
+
+    def __init__(self, snapshots: bool = False):
+        self.snapshots = snapshots
+        # (namespace class, fixture name, phase): stats
+        self.stats: dict[tuple[type, str, str], pstats.Stats] = {}
+        self.memory: dict[tuple[type, str, str], MemoryStats] = {}
+        self._lock = Lock()
+
+    def profile(self, namespace_class: type, name: str, phase: str, func):
+        # before Python 3.12 enabling profiler silently replaces active one
+        # (e.g. `python -m cProfile` run), fixture isn't profiled then
+        profile = cProfile.Profile() if sys.getprofile() is None else None
+        tracing = tracemalloc.is_tracing()
+        if tracing:
+            before = tracemalloc.take_snapshot() if self.snapshots else None
+            tracemalloc.reset_peak()
+            start, _ = tracemalloc.get_traced_memory()
+
+        try:
+            if profile:
+                profile.enable()
+        except ValueError:
+            # since Python 3.12 profilers use `sys.monitoring`, enabling
+            # raises when other one is active
+            profile = None
+        try:
+            return func()
+        finally:
+            if profile:
+                profile.disable()
+            if tracing:
+                current, peak = tracemalloc.get_traced_memory()
+                after = tracemalloc.take_snapshot() if self.snapshots else None
+            self._save(
+                (namespace_class, name, phase),
+                profile,
+                (current - start, peak - start) if tracing else None,
+                after.compare_to(before, 'lineno') if tracing and after else ()
+            )
+
+    def _save(self, key, profile, memory, differences):
+        with self._lock:
+            if profile:
+                stats = self.stats.get(key)
+                if stats is None:
+                    self.stats[key] = pstats.Stats(profile)
+                else:
+                    stats.add(profile)
+
+            if memory:
+                info = self.memory.setdefault(key, MemoryStats())
+                info.calls += 1
+                info.retained += memory[0]
+                info.peak = max(info.peak, memory[1])
+                for difference in differences:
+                    if difference.size_diff:
+                        site = str(difference.traceback)
+                        info.sites[site] = \
+                            info.sites.get(site, 0) + difference.size_diff
+
+    def setup(self, namespace_class, name, getter):
+        return self.profile(namespace_class, name, 'setup', getter)
+
+    def teardown(self, namespace_class, name, generator, close):
+        self.profile(namespace_class, name, 'teardown', close)
+
+    def memory_report(self) -> dict:
+        "Memory stats per namespace class and fixture."
+        report = {}
+        for ((namespace_class, name, phase), info) in self.memory.items():
+            namespace = report.setdefault(namespace_name(namespace_class), {
+                'retained': 0,
+                'peak': 0,
+                'fixtures': {}
+            })
+            namespace['retained'] += info.retained
+            namespace['peak'] = max(namespace['peak'], info.peak)
+            namespace['fixtures'].setdefault(name, {})[phase] = info.as_dict()
+        return report
+
+    def write(self, output_dir: str | Path):
+        "Write `pstats` files and memory report."
+        output_dir = Path(output_dir)
+        output_dir.mkdir(parents=True, exist_ok=True)
+
+        namespaces: dict[type, pstats.Stats] = {}
+        for ((namespace_class, name, phase), stats) in self.stats.items():
+            prefix = namespace_name(namespace_class)
+            stats.dump_stats(output_dir / f'{prefix}.{name}.{phase}.pstats')
+            namespaces.setdefault(namespace_class, pstats.Stats()).add(stats)
+        for (namespace_class, stats) in namespaces.items():
+            stats.dump_stats(
+                output_dir / f'{namespace_name(namespace_class)}.pstats'
+            )
+
+        report = self.memory_report()
+        (output_dir / 'memory.json').write_text(json.dumps(report, indent=2))
+        (output_dir / 'memory.txt').write_text(format_memory_report(report))
+
+
+def format_memory_report(report: dict) -> str:
+    "Namespaces and fixtures sorted by retained memory."
+    lines = []
+    for (namespace, info) in sorted(
+        report.items(),
+        key=lambda item: -item[1]['retained']
+    ):
+        lines.append(
+            f'{namespace}: retained {info["retained"]} B, '
+            f'peak {info["peak"]} B'
+        )
+        fixtures = sorted(
+            (
+                (name, phase, stats)
+                for (name, phases) in info['fixtures'].items()
+                for (phase, stats) in phases.items()
+            ),
+            key=lambda item: -item[2]['retained']
+        )
+        for (name, phase, stats) in fixtures:
+            lines.append(
+                f'    {name} ({phase}, {stats["calls"]} calls): '
+                f'retained {stats["retained"]} B, peak {stats["peak"]} B'
+            )
+            for (site, size) in stats['sites'].items():
+                lines.append(f'        {size:+} B {site}')
+    return '\n'.join(lines) + '\n'
+
+
+@contextmanager
+def profile_fixtures(
+    output_dir: str | Path | None = None,
+    snapshots: bool = False
+):
+    '''
+    Profile fixtures injected inside the block, results are written to
+    `output_dir` (if passed) when the block ends.
+
+    Example:
+    ```
+    with profile_fixtures('profile') as profiler:
+        unittest.main(exit=False)
+    ```
+    '''
+    profiler = FixtureProfiler(snapshots)
+    started = not tracemalloc.is_tracing()
+    if started:
+        tracemalloc.start()
+    hooks.add_hook(profiler)
+    try:
+        yield profiler
+    finally:
+        hooks.remove_hook(profiler)
+        if started:
+            tracemalloc.stop()
+        if output_dir is not None:
+            profiler.write(output_dir)
@@ -0,0 +1,187 @@
+'''
+Pytest plugin, registered with `pytest11` entry point.
+
+Options:
+- `--fixture-impact=record` records index of tests fingerprints,
+- `--fixture-impact=select` runs only tests affected by changes since the last
+  recorded run (and records index too),
+- `--fixture-impact-file` index path, relative to rootdir,
+- `--fixture-profile` directory for fixtures profiling results,
+- `--fixture-leaks` reports fixtures values alive after tests and not closed
+  generators,
+- `--fixture-trace` file to append fixtures resolution events to.
+
+Patches of `mock` fixtures and values of `factory` fixtures with `class` scope
+are stopped (closed) after the last test of class, `session` ones at the end
+of session.
+'''
+from typing import TYPE_CHECKING
+import sys
+
+import pytest
+
+if TYPE_CHECKING:
+    # plugin is loaded by every pytest process, tools are imported when
+    # their options are used
+    from fixture.impact import ImpactIndex
+
+
+def pytest_addoption(parser: pytest.Parser):
+    group = parser.getgroup('fixture')
+    group.addoption(
+        '--fixture-impact',
+        choices=('record', 'select'),
+        default=None,
+        help='record fixtures usage index, or select only tests affected '
+             'by fixtures, namespaces or tests changes'
+    )
+    group.addoption(
+        '--fixture-impact-file',
+        default='.fixture_impact.json',
+        help='fixtures usage index file (default: .fixture_impact.json)'
+    )
+    group.addoption(
+        '--fixture-profile',
+        metavar='DIR',
+        default=None,
+        help='profile time and memory of fixtures, write pstats files and '
+             'memory report into directory'
+    )
+    group.addoption(
+        '--fixture-leaks',
+        action='store_true',
+        help='report fixtures values alive after tests and not closed '
+             'generators'
+    )
+    group.addoption(
+        '--fixture-trace',
+        metavar='FILE',
+        default=None,
+        help='append fixtures setup, teardown and members reads events '
+             'to trace file (JSON lines)'
+    )
+
+
+def pytest_configure(config: pytest.Config):
+    mode = config.getoption('fixture_impact')
+    if mode:
+        from fixture.impact import ImpactIndex
+
+        index = ImpactIndex(
+            config.rootpath / config.getoption('fixture_impact_file')
+        )
+        config.pluginmanager.register(
+            ImpactSelection(index, select=mode == 'select'),
+            'fixture-impact'
+        )
+
+    profile_dir = config.getoption('fixture_profile')
+    if profile_dir:
+        from fixture.profiling import profile_fixtures
+
+        profiling = profile_fixtures(config.rootpath / profile_dir)
+        profiling.__enter__()
+        config.add_cleanup(lambda: profiling.__exit__(None, None, None))
+
+    if config.getoption('fixture_leaks'):
+        from fixture.leaks import detect_leaks
+
+        # enabled before collection, so nested members reads are tracked
+        detection = detect_leaks()
+        config.pluginmanager.register(
+            LeaksReport(detection.__enter__()),
+            'fixture-leaks'
+        )
+        config.add_cleanup(lambda: detection.__exit__(None, None, None))
+
+    trace_file = config.getoption('fixture_trace')
+    if trace_file:
+        from fixture.trace import record_trace
+
+        # enabled before collection, so nested members reads are recorded
+        recording = record_trace(config.rootpath / trace_file)
+        recording.__enter__()
+        config.add_cleanup(lambda: recording.__exit__(None, None, None))
+
+
+def close_scope(scope: str | None = None):
+    "Stop mocks and close factories, none are active before modules import."
+    mock = sys.modules.get('fixture.mock')
+    if mock:
+        mock.stop_mocks(scope)
+    factory = sys.modules.get('fixture.factory')
+    if factory:
+        factory.close_factories(scope)
+
+
+def pytest_runtest_teardown(item: pytest.Item, nextitem: pytest.Item | None):
+    if nextitem is None \
+            or getattr(nextitem, 'cls', None) is not getattr(item, 'cls', None):
+        close_scope('class')
+
+
+def pytest_sessionfinish():
+    close_scope()
+
+
+class ImpactSelection:
+    def __init__(self, index: 'ImpactIndex', select: bool):
+        self.index = index
+        self.select = select
+        # test id: fingerprint
+        self.fingerprints: dict[str, str] = {}
+
+    def pytest_collection_modifyitems(
+        self,
+        config: pytest.Config,
+        items: list[pytest.Item]
+    ):
+        selected, deselected = [], []
+        for item in items:
+            fingerprint = self.index.fingerprint(
+                getattr(item, 'cls', None),
+                getattr(item, 'originalname', item.name)
+            )
+            if fingerprint is None:
+                # not tracked tests always run
+                selected.append(item)
+                continue
+
+            self.fingerprints[item.nodeid] = fingerprint
+            if not self.select or self.index.is_affected(
+                item.nodeid,
+                fingerprint
+            ):
+                selected.append(item)
+            else:
+                deselected.append(item)
+
+        if deselected:
+            config.hook.pytest_deselected(items=deselected)
+            items[:] = selected
+
+    def pytest_runtest_logreport(self, report: pytest.TestReport):
+        fingerprint = self.fingerprints.get(report.nodeid)
+        if fingerprint is None:
+            return
+
+        if report.failed:
+            self.index.record(report.nodeid, fingerprint, 'failed')
+        elif report.skipped:
+            self.index.record(report.nodeid, fingerprint, 'skipped')
+        elif report.when == 'call':
+            self.index.record(report.nodeid, fingerprint, 'passed')
+
+    def pytest_sessionfinish(self):
+        self.index.save()
+
+
+class LeaksReport:
+    def __init__(self, detector):
+        self.detector = detector
+
+    def pytest_terminal_summary(self, terminalreporter):
+        report = self.detector.report()
+        if report:
+            terminalreporter.section('fixtures leaks')
+            terminalreporter.write_line(report)
@@ -0,0 +1,377 @@
+'''
+Fork-after-warmup runner of decorated test classes.
+
+Test modules are imported and fixtures marked with `@shared` (session
+fixtures) are computed once in the parent process. Then workers are created
+with `os.fork`, so they inherit computed values through copy-on-write pages,
+every worker runs its own test classes and streams results back over pipe
+(JSON lines).
+
+Classes are never split between workers, so class fixtures (e.g.
+`@cached_property`, `setUpClass`) are computed once. Only classes decorated
+with `use_fixture_namespace` are run, `unittest.TestCase` classes by
+`unittest` (with `setUp`, `setUpClass`, ...), other classes by calling their
+test methods.
+
+Without `os.fork` (e.g. Windows) tests are run in the parent process.
+'''
+from typing import Callable, Iterable
+from unittest import SkipTest
+import json
+import os
+import selectors
+import sys
+import time
+import traceback
+import unittest
+
+from fixture.factory import close_factories
+from fixture.mock import stop_mocks
+from fixture.plan import find_modules, import_path
+
+# outcomes counted as failed run
+FAILURES = ('failed', 'error')
+
+
+def test_id(klass: type, name: str) -> str:
+    return f'{klass.__module__}.{klass.__qualname__}.{name}'
+
+
+def collect(paths: Iterable[str]) -> tuple[list[type], list[dict]]:
+    "Import test modules and get decorated classes."
+    classes, errors = [], []
+    for path in find_modules(paths):
+        try:
+            module = import_path(path)
+        except Exception as error:
+            errors.append({'path': str(path), 'error': repr(error)})
+            continue
+        for klass in vars(module).values():
+            if isinstance(klass, type) \
+                    and '__fixture_plan__' in vars(klass) \
+                    and klass.__module__ == module.__name__:
+                classes.append(klass)
+    return classes, errors
+
+
+def tests_names(klass: type) -> list[str]:
+    if issubclass(klass, unittest.TestCase):
+        return list(unittest.defaultTestLoader.getTestCaseNames(klass))
+    return [
+        name
+        for name in klass.__fixture_plan__.tests
+        if name.startswith('test')
+    ]
+
+
+def warmup(classes: list[type]) -> list[str]:
+    "Compute session (`@shared`) fixtures used by classes."
+    computed = []
+    for klass in classes:
+        plan = klass.__fixture_plan__
+        used = {name for names in plan.tests.values() for name in names}
+        for (name, kind) in plan.kinds.items():
+            if kind.scope == 'shared' and name in used:
+                plan.fixtures_getters[name]()
+                computed.append(f'{test_id(plan.namespace_class, name)}')
+    return computed
+
+
+def partition(classes: list[type], jobs: int) -> list[list[type]]:
+    "Split classes between workers, balancing number of tests."
+    parts = [[] for _ in range(jobs)]
+    sizes = [0] * jobs
+    for klass in sorted(classes, key=lambda k: -len(tests_names(k))):
+        index = sizes.index(min(sizes))
+        parts[index].append(klass)
+        sizes[index] += len(tests_names(klass))
+    return [part for part in parts if part]
+
+
+class StreamingResult(unittest.TestResult):
+    '''
+    Test result reporting every outcome as soon as it's known.
+
+    Failed subtests are reported with their test. Errors of class and module
+    fixtures (e.g. `setUpClass`) are reported with their traceback for every
+    test of `tests` which didn't report result, tests aren't run then.
+    '''
+
+    def __init__(
+        self,
+        report: Callable[[dict], None],
+        tests: Iterable[str] = ()
+    ):
+        super().__init__()
+        self.report = report
+        self.start = time.perf_counter()
+        self.tests = list(tests)
+        self.reported = set()
+        # (outcome, details) of failed subtests of current test
+        self.subtests = []
+
+    def startTest(self, test):
+        super().startTest(test)
+        self.start = time.perf_counter()
+        self.subtests = []
+
+    def stopTest(self, test):
+        super().stopTest(test)
+        # test with failed subtests doesn't report any other outcome
+        if self.subtests and test.id() not in self.reported:
+            self.send(test.id(), 'passed')
+
+    def send(self, name: str, outcome: str, details: str | None = None):
+        if self.subtests:
+            # test fails with its subtests, also when its own code passed
+            if outcome not in FAILURES:
+                outcome = 'error' if any(
+                    subtest_outcome == 'error'
+                    for (subtest_outcome, _) in self.subtests
+                ) else 'failed'
+                details = None
+            details = '\n'.join([
+                *(subtest_details for (_, subtest_details) in self.subtests),
+                *([details] if details else [])
+            ])
+            self.subtests = []
+        self.reported.add(name)
+        self.report({
+            'test': name,
+            'outcome': outcome,
+            'duration': time.perf_counter() - self.start,
+            'details': details
+        })
+
+    def addSuccess(self, test):
+        super().addSuccess(test)
+        self.send(test.id(), 'passed')
+
+    def addFailure(self, test, err):
+        super().addFailure(test, err)
+        self.send(test.id(), 'failed', self.failures[-1][1])
+
+    def targets(self, test) -> list[str]:
+        "Ids of test, or of tests not run because of class fixture."
+        if isinstance(test, unittest.TestCase):
+            return [test.id()]
+        pending = [name for name in self.tests if name not in self.reported]
+        return pending or [test.id()]
+
+    def addError(self, test, err):
+        super().addError(test, err)
+        details = self.errors[-1][1]
+        if not isinstance(test, unittest.TestCase):
+            # class or module fixture error, e.g. `setUpClass (module.Class)`
+            details = f'{test.id()}\n{details}'
+        for name in self.targets(test):
+            self.send(name, 'error', details)
+
+    def addSubTest(self, test, subtest, err):
+        super().addSubTest(test, subtest, err)
+        if err is None:
+            return
+        if issubclass(err[0], test.failureException):
+            outcome, details = 'failed', self.failures[-1][1]
+        else:
+            outcome, details = 'error', self.errors[-1][1]
+        self.subtests.append((outcome, f'{subtest.id()}\n{details}'))
+
+    def addSkip(self, test, reason):
+        super().addSkip(test, reason)
+        for name in self.targets(test):
+            self.send(name, 'skipped', reason)
+
+    def addExpectedFailure(self, test, err):
+        super().addExpectedFailure(test, err)
+        self.send(test.id(), 'passed')
+
+    def addUnexpectedSuccess(self, test):
+        super().addUnexpectedSuccess(test)
+        self.send(test.id(), 'failed', 'unexpected success')
+
+
+def run_class(klass: type, report: Callable[[dict], None]):
+    "Run tests of class, report every result."
+    try:
+        run_tests(klass, tests_names(klass), report)
+    finally:
+        # patches of class scoped mocks and factories values end with class
+        stop_mocks('class')
+        close_factories('class')
+
+
+def run_tests(klass: type, names: list[str], report: Callable[[dict], None]):
+    if issubclass(klass, unittest.TestCase):
+        suite = unittest.TestSuite(map(klass, names))
+        suite.run(StreamingResult(
+            report,
+            [test_id(klass, name) for name in names]
+        ))
+        return
+
+    for name in names:
+        start = time.perf_counter()
+        outcome, details = 'passed', None
+        try:
+            getattr(klass(), name)()
+        except SkipTest as skip:
+            outcome, details = 'skipped', str(skip)
+        except AssertionError:
+            outcome, details = 'failed', traceback.format_exc()
+        except Exception:
+            outcome, details = 'error', traceback.format_exc()
+        report({
+            'test': test_id(klass, name),
+            'outcome': outcome,
+            'duration': time.perf_counter() - start,
+            'details': details
+        })
+
+
+def run_worker(classes: list[type], fd: int):
+    "Run classes in forked worker, write results to pipe."
+    with os.fdopen(fd, 'w') as pipe:
+        def report(result: dict):
+            pipe.write(json.dumps(result) + '\n')
+            # results are streamed, not sent at the end
+            pipe.flush()
+
+        for klass in classes:
+            run_class(klass, report)
+        stop_mocks()
+        close_factories()
+
+
+def fork_workers(parts: list[list[type]]) -> dict[int, int]:
+    "Start workers, get pipe read end: worker pid."
+    workers = {}
+    for part in parts:
+        read_fd, write_fd = os.pipe()
+        # buffered output would be written by every worker again
+        sys.stdout.flush()
+        sys.stderr.flush()
+        pid = os.fork()
+        if pid == 0:
+            code = 0
+            try:
+                os.close(read_fd)
+                for fd in workers:
+                    os.close(fd)
+                run_worker(part, write_fd)
+            except BaseException:
+                traceback.print_exc()
+                code = 1
+            finally:
+                os._exit(code)
+        os.close(write_fd)
+        workers[read_fd] = pid
+    return workers
+
+
+def read_results(workers: dict[int, int]) -> Iterable[dict]:
+    "Stream results from workers pipes until all workers end."
+    selector = selectors.DefaultSelector()
+    buffers = {}
+    for fd in workers:
+        os.set_blocking(fd, False)
+        selector.register(fd, selectors.EVENT_READ)
+        buffers[fd] = b''
+
+    while buffers:
+        for (key, _) in selector.select():
+            fd = key.fd
+            chunk = os.read(fd, 65536)
+            if not chunk:
+                selector.unregister(fd)
+                os.close(fd)
+                del buffers[fd]
+                os.waitpid(workers[fd], 0)
+                continue
+            *lines, buffers[fd] = (buffers[fd] + chunk).split(b'\n')
+            for line in lines:
+                yield json.loads(line)
+    selector.close()
+
+
+def run(
+    paths: Iterable[str],
+    jobs: int | None = None,
+    report: Callable[[dict], None] | None = None
+) -> dict:
+    "Run decorated test classes from paths in forked workers."
+    jobs = jobs or os.cpu_count() or 1
+    report = report or (lambda result: None)
+    started = time.perf_counter()
+
+    classes, errors = collect(paths)
+    warmed = warmup(classes)
+    expected = {
+        test_id(klass, name)
+        for klass in classes
+        for name in tests_names(klass)
+    }
+
+    results = []
+
+    def collect_result(result: dict):
+        results.append(result)
+        report(result)
+
+    if jobs > 1 and hasattr(os, 'fork'):
+        workers = fork_workers(partition(classes, jobs))
+        for result in read_results(workers):
+            collect_result(result)
+    else:
+        for klass in classes:
+            run_class(klass, collect_result)
+        stop_mocks()
+        close_factories()
+
+    # tests of crashed workers
+    for name in sorted(expected - {result['test'] for result in results}):
+        collect_result({
+            'test': name,
+            'outcome': 'error',
+            'duration': 0.0,
+            'details': 'worker ended before reporting result'
+        })
+
+    counts = {}
+    for result in results:
+        counts[result['outcome']] = counts.get(result['outcome'], 0) + 1
+    return {
+        'results': results,
+        'counts': counts,
+        'warmup': warmed,
+        'errors': errors,
+        'duration': time.perf_counter() - started
+    }
+
+
+def main(args) -> int:
+    "`run` command of command line interface."
+    def report(result: dict):
+        if args.verbose or result['outcome'] in FAILURES:
+            print(f'{result["outcome"].upper()} {result["test"]}', flush=True)
+
+    summary = run(args.paths, args.jobs, report)
+
+    for error in summary['errors']:
+        print(f'{error["path"]}: {error["error"]}', file=sys.stderr)
+    for result in summary['results']:
+        if result['outcome'] in FAILURES:
+            print(f'\n{result["test"]}\n{result["details"]}', file=sys.stderr)
+
+    counts = ', '.join(
+        f'{count} {outcome}'
+        for (outcome, count) in sorted(summary['counts'].items())
+    )
+    print(
+        f'{counts or "no tests"} in {summary["duration"]:.2f}s '
+        f'({len(summary["warmup"])} session fixtures computed before fork)'
+    )
+    failed = summary['errors'] or any(
+        outcome in FAILURES for outcome in summary['counts']
+    )
+    return 1 if failed else 0
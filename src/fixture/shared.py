@@ -0,0 +1,10 @@
+from typing import Callable
+
+
+def shared(func: Callable):
+    '''
+    Mark property as shared - it is deterministic, so it's computed once and
+    reused by all namespaces using it (e.g. copied with `func_copy`).
+    '''
+    setattr(func, 'shared', True)
+    return func
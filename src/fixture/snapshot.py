@@ -0,0 +1,207 @@
+'''
+SQLite database snapshots of seeding fixtures.
+
+Seeding method is run once per namespace class, then the database is copied
+with SQLite online backup API into a snapshot (in memory, or a file in `path`
+directory), which is restored into the database before every next test using
+the fixture. Injected value is the value returned by seeding method.
+
+```
+class Namespace:
+    @snapshot
+    def catalog(self):
+        return [Product.objects.create(name=name) for name in NAMES]
+
+    # snapshot file reused by next runs, until namespace source changes
+    @snapshot(path='.snapshots')
+    def users(self):
+        return User.objects.bulk_create(...)
+```
+
+Django database connection (`using` alias, `default` by default) is used,
+Django is imported only when snapshot is taken. Other SQLite databases can be
+used with `connect`, callable getting namespace object and returning
+`sqlite3.Connection`.
+
+Snapshots are keyed by namespace class and fingerprint of seeding method
+(its source, namespace members it uses and namespace `__init__`), changed
+source invalidates snapshot. Files snapshots store returned value with
+`pickle`, so it must be picklable. Snapshot restores committed data, tests
+should use real commits (e.g. Django `TransactionTestCase`), not rolled back
+transactions.
+'''
+from functools import partial
+from os import PathLike
+from threading import Lock
+from typing import TYPE_CHECKING, Callable
+from weakref import WeakKeyDictionary
+
+if TYPE_CHECKING:
+    # pathlib and pickle are imported when snapshot files are used
+    from pathlib import Path
+
+
+def django_connection(using: str, namespace=None):
+    "Get DB-API connection of Django SQLite database."
+    # Django is an optional dependency
+    from django.db import connections
+
+    connection = connections[using]
+    if connection.vendor != 'sqlite':
+        raise ValueError(
+            f'Snapshot requires SQLite database, {using!r} is '
+            f'{connection.vendor}'
+        )
+    connection.ensure_connection()
+    return connection.connection
+
+
+class SnapshotState:
+    "Taken snapshot of namespace class."
+    __slots__ = ('value', 'database', 'file')
+
+    def __init__(self, value, database=None, file: 'Path | None' = None):
+        self.value = value
+        # in memory snapshot connection, or snapshot file
+        self.database = database
+        self.file = file
+
+    def restore(self, connection):
+        import sqlite3
+
+        if self.database is not None:
+            self.database.backup(connection)
+            return
+        source = sqlite3.connect(self.file)
+        try:
+            source.backup(connection)
+        finally:
+            source.close()
+
+
+class Snapshot:
+    "Seeding fixture of namespace, restored from snapshot for every test."
+
+    def __init__(
+        self,
+        func: Callable,
+        using: str = 'default',
+        path: str | PathLike | None = None,
+        connect: Callable | None = None
+    ):
+        self.func = func
+        self.using = using
+        self.path = path
+        self.connect = connect or partial(django_connection, using)
+        # namespace class: taken snapshot
+        self.states: WeakKeyDictionary[type, SnapshotState] = \
+            WeakKeyDictionary()
+        self._lock = Lock()
+
+    def __repr__(self) -> str:
+        return (
+            f'{type(self).__name__}({self.func.__qualname__}, '
+            f'using={self.using!r}, path={self.path!r})'
+        )
+
+    def fingerprint(self, namespace_class: type, name: str) -> str:
+        from fixture.impact import NamespaceFingerprint, digest
+
+        fingerprints = NamespaceFingerprint(namespace_class)
+        return digest(fingerprints.base, fingerprints(name))
+
+    def get(self, namespace_class: type, name: str, namespace):
+        "Seed database once, restore its snapshot for every next call."
+        connection = self.connect(namespace)
+        state = self.states.get(namespace_class)
+        if state is not None:
+            state.restore(connection)
+            return state.value
+
+        with self._lock:
+            state = self.states.get(namespace_class)
+            if state is not None:
+                state.restore(connection)
+                return state.value
+
+            file = None
+            if self.path is not None:
+                from pathlib import Path
+
+                file = Path(self.path) / '.'.join((
+                    namespace_class.__module__,
+                    namespace_class.__qualname__,
+                    name,
+                    self.fingerprint(namespace_class, name)[:16],
+                    'sqlite3'
+                ))
+                state = self.load(file)
+                if state is not None:
+                    state.restore(connection)
+                    self.states[namespace_class] = state
+                    return state.value
+
+            value = self.func(namespace)
+            self.states[namespace_class] = self.take(connection, value, file)
+            return value
+
+    def take(
+        self,
+        connection,
+        value,
+        file: 'Path | None'
+    ) -> SnapshotState:
+        import pickle
+        import sqlite3
+
+        # snapshot copies committed data only
+        if connection.in_transaction:
+            connection.commit()
+        if file is None:
+            database = sqlite3.connect(':memory:', check_same_thread=False)
+            connection.backup(database)
+            return SnapshotState(value, database=database)
+
+        file.parent.mkdir(parents=True, exist_ok=True)
+        # snapshots of previous sources are not used anymore
+        prefix = file.name.rsplit('.', 2)[0]
+        for stale in file.parent.glob(f'{prefix}.*'):
+            stale.unlink()
+        # value is written first, snapshot file marks complete snapshot
+        file.with_suffix('.pickle').write_bytes(pickle.dumps(value))
+        partial_file = file.with_suffix('.tmp')
+        database = sqlite3.connect(partial_file)
+        try:
+            connection.backup(database)
+        finally:
+            database.close()
+        partial_file.replace(file)
+        return SnapshotState(value, file=file)
+
+    def load(self, file: 'Path') -> SnapshotState | None:
+        "Get snapshot file taken by previous run."
+        import pickle
+
+        if not file.exists():
+            return None
+        try:
+            value = pickle.loads(file.with_suffix('.pickle').read_bytes())
+        except (OSError, pickle.UnpicklingError, EOFError):
+            return None
+        return SnapshotState(value, file=file)
+
+
+def snapshot(
+    func: Callable | None = None,
+    *,
+    using: str = 'default',
+    path: str | PathLike | None = None,
+    connect: Callable | None = None
+):
+    '''
+    Mark seeding method as snapshot fixture. Can be used as `@snapshot` or
+    `@snapshot(path='.snapshots')`.
+    '''
+    if func is None:
+        return partial(snapshot, using=using, path=path, connect=connect)
+    return Snapshot(func, using, path, connect)
@@ -1,14 +1,20 @@
+from contextvars import ContextVar
 from copy import copy
+from threading import Lock
 from typing import Callable
 
+# when set, not existing fixtures are saved in `InjectionPlan.missing`
+# instead of raising `FixtureError` during decoration
+deferred_verification: ContextVar[bool] = ContextVar(
+    'deferred_verification',
+    default=False
+)
+
 
 class FunctionBackup:
-    ""
+    "Thread-safe register of original (not injected) test functions."
     _instance = None
-
-    def __init__(self):
-        # _instance (singleton) is always initialized
-        self.register = self.register if hasattr(self, 'register') else {}
+    _lock = Lock()
 
     @staticmethod
     def _get_key(func: Callable) -> str:
@@ -19,14 +25,23 @@ class FunctionBackup:
 
     def save(self, original: Callable):
         "Save function copy."
-        self.register[self._get_key(original)] = copy(original)
+        key, value = self._get_key(original), copy(original)
+        with self._lock:
+            self.register[key] = value
 
     def get(self, wrapper: Callable) -> Callable:
         "Get copy of original function."
+        # reads are lock-free, single dict lookup is atomic
         return copy(self.register[self._get_key(wrapper)])
 
     def __new__(cls, *args, **kwargs):
         "Create or get singleton."
+        # double-checked locking, lock taken only for the first creation
         if cls._instance is None:
-            cls._instance = super(FunctionBackup, cls).__new__(cls)
+            with cls._lock:
+                if cls._instance is None:
+                    instance = super(FunctionBackup, cls).__new__(cls)
+                    # register must exist before instance is visible
+                    instance.register = {}
+                    cls._instance = instance
         return cls._instance
@@ -0,0 +1,176 @@
+'''
+Streaming fixtures, injecting bounded iterators over data too big for memory.
+
+```
+class Namespace:
+    # lines of file, read lazily (optionally through mmap)
+    requests = stream.file('requests.jsonl', limit=1000, mmap=True)
+
+    # items of generator method
+    @stream(limit=100)
+    def users(self):
+        with open('users.csv') as file:
+            yield from csv.reader(file)
+```
+
+Every test gets new `StreamReader`, which is closed after the test (with its
+generator, mmap and file), also when the test didn't read it to the end.
+'''
+from codecs import iterdecode
+from functools import partial
+from itertools import islice
+from os import PathLike
+from typing import Callable, Iterable
+import mmap as _mmap
+
+
+class StreamReader:
+    "Bounded iterator closing its resources."
+
+    def __init__(
+        self,
+        iterator: Iterable,
+        limit: int | None = None,
+        resources: Iterable = ()
+    ):
+        self._source = iterator
+        self._iterator = iter(iterator) if limit is None \
+            else islice(iterator, limit)
+        # closed in reversed order, after source iterator
+        self._resources = list(resources)
+        self.closed = False
+
+    def __iter__(self):
+        return self
+
+    def __next__(self):
+        if self.closed:
+            raise ValueError('I/O operation on closed stream')
+        return next(self._iterator)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+    def close(self):
+        if self.closed:
+            return
+        self.closed = True
+        close = getattr(self._source, 'close', None)
+        try:
+            if close:
+                close()
+        finally:
+            for resource in reversed(self._resources):
+                resource.close()
+
+
+class Stream:
+    "Streaming fixture of namespace, opened for every test."
+
+    def __init__(self, limit: int | None = None):
+        # maximal number of items
+        self.limit = limit
+
+    def open(self, namespace) -> StreamReader:
+        raise NotImplementedError
+
+
+class GeneratorStream(Stream):
+    "Streaming fixture of namespace, items of generator method."
+
+    def __init__(self, func: Callable, limit: int | None = None):
+        super().__init__(limit)
+        self.func = func
+
+    def open(self, namespace) -> StreamReader:
+        return StreamReader(self.func(namespace), self.limit)
+
+
+class FileStream(Stream):
+    '''
+    Streaming fixture of namespace, lines (or chunks of `chunk_size` bytes)
+    of file.
+    '''
+
+    def __init__(
+        self,
+        path: str | PathLike | Callable,
+        limit: int | None = None,
+        chunk_size: int | None = None,
+        mmap: bool = False,
+        encoding: str | None = None
+    ):
+        super().__init__(limit)
+        self.path = path
+        self.chunk_size = chunk_size
+        self.mmap = mmap
+        self.encoding = encoding
+
+    def __repr__(self) -> str:
+        return (
+            f'{type(self).__name__}({self.path!r}, limit={self.limit}, '
+            f'chunk_size={self.chunk_size}, mmap={self.mmap}, '
+            f'encoding={self.encoding!r})'
+        )
+
+    def open(self, namespace) -> StreamReader:
+        # path can be computed from namespace, e.g. `lambda self: self.dir`
+        path = self.path(namespace) if callable(self.path) else self.path
+        file = open(path, 'rb')
+        resources = [file]
+        try:
+            source = file
+            # empty file cannot be mapped
+            if self.mmap and file.seek(0, 2):
+                file.seek(0)
+                source = _mmap.mmap(file.fileno(), 0, access=_mmap.ACCESS_READ)
+                resources.append(source)
+
+            if self.chunk_size:
+                items = iter(partial(source.read, self.chunk_size), b'')
+            else:
+                items = iter(source.readline, b'')
+            if self.encoding:
+                # incremental decoding, chunks can split characters
+                items = iterdecode(items, self.encoding)
+            return StreamReader(items, self.limit, resources)
+        except BaseException:
+            for resource in reversed(resources):
+                resource.close()
+            raise
+
+
+def stream(
+    func: Callable | None = None,
+    *,
+    limit: int | None = None
+):
+    '''
+    Mark generator method as streaming fixture, injected test gets bounded
+    iterator over its items. Can be used as `@stream` or `@stream(limit=10)`.
+    '''
+    if func is None:
+        return partial(stream, limit=limit)
+    return GeneratorStream(func, limit)
+
+
+def file(
+    path: str | PathLike | Callable,
+    *,
+    limit: int | None = None,
+    chunk_size: int | None = None,
+    mmap: bool = False,
+    encoding: str | None = None
+) -> FileStream:
+    '''
+    Streaming fixture of file lines, or chunks of `chunk_size` bytes.
+    Items are bytes, or str if `encoding` is passed.
+    '''
+    return FileStream(path, limit, chunk_size, mmap, encoding)
+
+
+setattr(stream, 'file', file)
+
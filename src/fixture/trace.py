@@ -0,0 +1,199 @@
+'''
+Trace of fixtures resolution.
+
+Recorder appends one JSON line per finished event to the trace file:
+- `call` of injected test function (with fixtures setup and teardown),
+- `setup` of every injected fixture,
+- `access` of namespace members read from other members (`self.x`),
+- `teardown` (closing fixture generator).
+
+Example line (wrapped):
+```
+{"ev":"setup","ns":"tests.Namespace","fx":"words","pid":1,
+ "test":"tests.TestA.test_a","tid":2,"ts":1520,"dur":87}
+```
+
+Times (`ts` since recorder start, `dur`) are in nanoseconds. Nested events
+end before their parents, so they are written first. Lines are built from
+prefixes encoded once per fixture and writes are buffered (never flushed per
+event), the file is flushed when recording ends.
+
+Trace can be converted to Chrome trace-event format (`chrome://tracing`,
+Perfetto) or to fixtures timings used by `python -m fixture plan --timings`.
+'''
+from contextlib import contextmanager
+from pathlib import Path
+from threading import get_ident, local
+from typing import Iterable, Iterator
+import json
+import os
+import time
+
+from fixture import hooks
+
+# buffer of trace file, events are written in chunks
+BUFFER_SIZE = 1024 * 1024
+
+_encode = json.JSONEncoder(separators=(',', ':')).encode
+
+
+def qualified_name(obj) -> str:
+    return f'{obj.__module__}.{obj.__qualname__}'
+
+
+class TraceRecorder(hooks.FixtureHook):
+    "Hook appending fixtures events to trace file."
+
+    def __init__(self, path: str | Path):
+        self.path = Path(path)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self.file = open(self.path, 'ab', buffering=BUFFER_SIZE)
+        self.start = time.perf_counter_ns()
+        self.pid = os.getpid()
+        # encoded name of test running in current thread
+        self._current = local()
+        # (event, namespace class, fixture name): encoded line prefix
+        self._prefixes: dict[tuple[str, type, str], str] = {}
+
+    def event(
+        self,
+        event: str,
+        namespace_class: type,
+        name: str,
+        start: int,
+        end: int
+    ):
+        key = (event, namespace_class, name)
+        prefix = self._prefixes.get(key)
+        if prefix is None:
+            # encoded once for every event kind and fixture
+            prefix = self._prefixes[key] = (
+                f'{{"ev":{_encode(event)},'
+                f'"ns":{_encode(qualified_name(namespace_class))},'
+                f'"fx":{_encode(name)},"pid":{self.pid},'
+            )
+        test = getattr(self._current, 'test', None)
+        if test is None:
+            test = self._current.test = self.encode_test(None)
+        line = (
+            f'{prefix}{test},"ts":{start - self.start},"dur":{end - start}}}\n'
+        )
+        # buffered binary file is thread-safe
+        if not self.file.closed:
+            self.file.write(line.encode())
+
+    def encode_test(self, name: str | None) -> str:
+        return f'"test":{_encode(name)},"tid":{get_ident()}'
+
+    def span(self, event: str, namespace_class: type, name: str, func):
+        start = time.perf_counter_ns()
+        try:
+            return func()
+        finally:
+            self.event(
+                event,
+                namespace_class,
+                name,
+                start,
+                time.perf_counter_ns()
+            )
+
+    def call(self, namespace_class, func, run):
+        parent = getattr(self._current, 'test', None)
+        self._current.test = self.encode_test(qualified_name(func))
+        try:
+            return self.span('call', namespace_class, func.__name__, run)
+        finally:
+            self._current.test = parent
+
+    def setup(self, namespace_class, name, getter):
+        return self.span('setup', namespace_class, name, getter)
+
+    def access(self, namespace_class, name, get):
+        return self.span('access', namespace_class, name, get)
+
+    def teardown(self, namespace_class, name, generator, close):
+        self.span('teardown', namespace_class, name, close)
+
+    def close(self):
+        self.file.close()
+
+
+@contextmanager
+def record_trace(path: str | Path) -> Iterator[TraceRecorder]:
+    '''
+    Append events of fixtures injected inside the block to trace file.
+    Namespaces decorated inside the block report also nested members reads.
+
+    Example:
+    ```
+    with record_trace('fixtures.trace.jsonl'):
+        unittest.main(exit=False)
+    ```
+    '''
+    recorder = TraceRecorder(path)
+    hooks.add_hook(recorder, members=True)
+    try:
+        yield recorder
+    finally:
+        hooks.remove_hook(recorder)
+        recorder.close()
+
+
+def read_trace(path: str | Path) -> Iterator[dict]:
+    "Read trace events, a line cut by interrupted run is skipped."
+    with open(path) as file:
+        for line in file:
+            try:
+                yield json.loads(line)
+            except json.JSONDecodeError:
+                continue
+
+
+def to_chrome(events: Iterable[dict]) -> dict:
+    "Convert trace events to Chrome trace-event format."
+    return {
+        'traceEvents': [
+            {
+                'name': event['fx']
+                if event['ev'] != 'call' else event['test'],
+                'cat': event['ev'],
+                'ph': 'X',
+                'ts': event['ts'] / 1000,
+                'dur': event['dur'] / 1000,
+                'pid': event['pid'],
+                'tid': event['tid'],
+                'args': {'test': event['test'], 'namespace': event['ns']}
+            }
+            for event in events
+        ],
+        'displayTimeUnit': 'ms'
+    }
+
+
+def to_timings(events: Iterable[dict]) -> dict[str, float]:
+    '''
+    Mean setup time (seconds) of every fixture, in format of
+    `python -m fixture plan --timings`.
+    '''
+    totals: dict[str, list] = {}
+    for event in events:
+        if event['ev'] == 'setup':
+            total = totals.setdefault(f'{event["ns"]}.{event["fx"]}', [0, 0])
+            total[0] += event['dur']
+            total[1] += 1
+    return {
+        name: duration / calls / 1e9
+        for (name, (duration, calls)) in sorted(totals.items())
+    }
+
+
+def main(args) -> int:
+    "`trace` command of command line interface."
+    events = read_trace(args.trace)
+    if args.format == 'chrome':
+        json.dump(to_chrome(events), args.output)
+    else:
+        json.dump(to_timings(events), args.output, indent=2)
+    args.output.write('\n')
+    return 0
@@ -0,0 +1,149 @@
+from functools import cached_property
+from unittest import TestCase, defaultTestLoader
+import unittest
+import pytest
+from fixture import *
+
+
+@pytest.fixture
+def events():
+    return []
+
+
+@pytest.fixture
+def namespace(events):
+    class Namespace:
+        @cached_property
+        @unzip
+        def database(self):
+            events.append('database')
+            try:
+                yield 'database'
+            finally:
+                events.append('database closed')
+
+        @property
+        def user(self):
+            events.append('user')
+            return {'name': 'a'}
+
+        limit = 10
+
+    return Namespace
+
+
+def run(test_class: type) -> unittest.TestResult:
+    result = unittest.TestResult()
+    defaultTestLoader.loadTestsFromTestCase(test_class).run(result)
+    return result
+
+#
+#
+# tests
+#
+#
+
+
+def test_class_fixtures(namespace, events):
+    '''
+    GIVEN test case with class and per-test fixtures
+    WHEN running its tests with subtests
+    THEN class fixtures are resolved once in setUpClass
+    AND they are closed in tearDownClass, before the original one
+    AND per-test fixtures are resolved once for every test
+    '''
+    @use_fixture_namespace(namespace, setup_class=True)
+    class ExampleTest(TestCase):
+        @classmethod
+        def setUpClass(cls):
+            super().setUpClass()
+            events.append('setUpClass')
+
+        @classmethod
+        def tearDownClass(cls):
+            events.append('tearDownClass')
+            super().tearDownClass()
+
+        def test_1(self, database, user, limit):
+            for i in range(3):
+                with self.subTest(i=i):
+                    assert (database, user['name'], limit) == \
+                        ('database', 'a', 10)
+
+        def test_2(self, database):
+            assert database == 'database'
+
+    result = run(ExampleTest)
+
+    assert result.wasSuccessful(), result.failures + result.errors
+    assert events == [
+        'setUpClass',
+        'database',
+        'user',
+        'database closed',
+        'tearDownClass'
+    ]
+
+
+def test_class_fixture_failure(namespace, events):
+    '''
+    GIVEN class fixture failing
+    WHEN running test case
+    THEN tests are not run
+    AND original tearDownClass is called
+    '''
+    class BrokenNamespace:
+        database = namespace.database
+
+        @cached_property
+        def broken(self):
+            raise RuntimeError()
+
+    @use_fixture_namespace(BrokenNamespace, setup_class=True)
+    class ExampleTest(TestCase):
+        @classmethod
+        def tearDownClass(cls):
+            events.append('tearDownClass')
+
+        def test_method(self, database, broken):
+            events.append('test')
+
+    result = run(ExampleTest)
+
+    assert len(result.errors) == 1
+    assert events == ['database', 'database closed', 'tearDownClass']
+
+
+def test_class_fixtures_of_many_classes(namespace, events):
+    '''
+    GIVEN test cases using the same namespace with class fixtures
+    WHEN running them one after another (and the first one again)
+    THEN closed class fixtures are computed again for every class run
+    '''
+    @use_fixture_namespace(namespace, setup_class=True)
+    class FirstTest(TestCase):
+        def test_method(self, database):
+            assert database == 'database'
+
+    @use_fixture_namespace(namespace, setup_class=True)
+    class SecondTest(TestCase):
+        def test_method(self, database):
+            assert database == 'database'
+
+    results = [run(FirstTest), run(SecondTest), run(FirstTest)]
+
+    for result in results:
+        assert result.wasSuccessful(), result.failures + result.errors
+    assert events == ['database', 'database closed'] * 3
+
+
+def test_setup_class_requires_test_case(namespace):
+    '''
+    GIVEN class which is not unittest test case
+    WHEN decorating it with setup_class
+    THEN it raises exception
+    '''
+    with pytest.raises(TypeError):
+        @use_fixture_namespace(namespace, setup_class=True)
+        class ExampleClass:
+            def test_method(self, user): ...
@@ -0,0 +1,132 @@
+from concurrent.futures import ThreadPoolExecutor
+from functools import cached_property
+from threading import Barrier, get_ident
+import time
+import pytest
+from fixture import *
+from fixture.state import FunctionBackup
+
+
+THREADS = 32
+CALLS = 50
+
+
+@pytest.fixture
+def computations():
+    return []
+
+
+@pytest.fixture
+def shared_namespace(computations):
+    class Namespace:
+        @cached_property
+        def heavy(self):
+            computations.append(get_ident())
+            # give other threads time to race for the value
+            time.sleep(0.05)
+            return object()
+
+        @property
+        def namespace_object(self):
+            return self
+
+        @property
+        def thread(self):
+            return get_ident()
+
+    return Namespace
+
+
+def run_in_threads(func):
+    barrier = Barrier(THREADS)
+
+    def worker():
+        barrier.wait()
+        return [func() for _ in range(CALLS)]
+
+    with ThreadPoolExecutor(THREADS) as pool:
+        futures = [pool.submit(worker) for _ in range(THREADS)]
+        return [result for f in futures for result in f.result()]
+
+#
+#
+# tests
+#
+#
+
+
+def test_cached_fixture_single_flight(shared_namespace, computations):
+    '''
+    GIVEN cached property field exists in class
+    WHEN many threads inject it at the same time
+    THEN it's computed only once
+    AND every thread gets the same value
+    '''
+    @use_fixture_namespace(shared_namespace)
+    class ExampleClass:
+        def test_method(self, heavy, thread):
+            return heavy, thread, get_ident()
+
+    tests = ExampleClass()
+    results = run_in_threads(tests.test_method)  # type: ignore
+
+    assert len(computations) == 1
+    assert len({heavy for (heavy, _, _) in results}) == 1
+    # non cached properties are evaluated in the calling thread
+    assert all(thread == caller for (_, thread, caller) in results)
+
+
+def test_namespace_object_per_thread(shared_namespace):
+    '''
+    GIVEN property field returning namespace object
+    WHEN many threads inject it
+    THEN every thread has its own namespace object
+    AND cached properties are still shared
+    '''
+    @use_fixture_namespace(shared_namespace)
+    class ExampleClass:
+        def test_method(self, namespace_object, heavy):
+            return get_ident(), namespace_object, heavy
+
+    tests = ExampleClass()
+    results = run_in_threads(tests.test_method)  # type: ignore
+
+    objects = {}
+    for (thread, namespace_object, heavy) in results:
+        assert objects.setdefault(thread, namespace_object) is namespace_object
+        assert heavy is results[0][2]
+    assert len(set(map(id, objects.values()))) == len(objects)
+
+
+def test_function_backup_concurrent_access():
+    '''
+    GIVEN many threads
+    WHEN they save and get functions from backup at the same time
+    THEN all threads share one backup
+    AND every saved function can be retrieved
+    '''
+    def build(index):
+        class Backup:
+            def test_method(self):
+                return index
+        Backup.__qualname__ = f'Backup{index}'
+        Backup.test_method.__qualname__ = f'Backup{index}.test_method'
+        return Backup.test_method
+
+    functions = [build(index) for index in range(THREADS * CALLS)]
+    chunks = [functions[i::THREADS] for i in range(THREADS)]
+    barrier = Barrier(THREADS)
+
+    def worker(chunk):
+        barrier.wait()
+        backup = FunctionBackup()
+        for func in chunk:
+            backup.save(func)
+        return backup, [backup.get(func)(None) for func in chunk]
+
+    with ThreadPoolExecutor(THREADS) as pool:
+        results = list(pool.map(worker, chunks))
+
+    assert len({id(backup) for (backup, _) in results}) == 1
+    for (chunk, (_, values)) in zip(chunks, results):
+        assert values == [func(None) for func in chunk]
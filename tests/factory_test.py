@@ -0,0 +1,152 @@
+import pytest
+from fixture import *
+from fixture.factory import close_factories
+
+
+@pytest.fixture
+def built():
+    return []
+
+
+@pytest.fixture
+def namespace(built):
+    class Namespace:
+        @factory
+        def make_users(self, count, prefix='user'):
+            built.append(('users', count))
+            return [f'{prefix}{i}' for i in range(count)]
+
+        @factory(scope='test')
+        def open_resource(self, name):
+            built.append(('open', name))
+            try:
+                yield {'name': name}
+            finally:
+                built.append(('close', name))
+
+    yield Namespace
+    close_factories()
+
+#
+#
+# tests
+#
+#
+
+
+def test_class_scope(namespace, built):
+    '''
+    GIVEN factory with class scope
+    WHEN calling it with the same arguments in many tests
+    THEN value is built once for every arguments
+    AND hits and misses are counted
+    AND values are dropped at the end of class scope
+    '''
+    @use_fixture_namespace(namespace)
+    class ExampleClass:
+        def test_method(self, make_users):
+            users = make_users(2)
+            assert make_users(2) is users
+            assert make_users(2, prefix='admin') == ['admin0', 'admin1']
+            return make_users
+
+    first = ExampleClass().test_method()  # type: ignore
+    second = ExampleClass().test_method()  # type: ignore
+
+    assert built == [('users', 2), ('users', 2)]
+    assert second.stats() == (4, 2, 2)
+
+    close_factories('class')
+    ExampleClass().test_method()  # type: ignore
+    assert len(built) == 4
+    assert first.stats() == (4, 2, 0)
+
+
+def test_test_scope(namespace, built):
+    '''
+    GIVEN generator factory with test scope
+    WHEN calling it in test
+    THEN value is built once for every arguments in test
+    AND generators are closed after test
+    '''
+    @use_fixture_namespace(namespace)
+    class ExampleClass:
+        def test_method(self, open_resource):
+            assert open_resource('a') is open_resource('a')
+            open_resource('b')
+            assert built[-1] == ('open', 'b')
+            return open_resource.stats()
+
+    stats = ExampleClass().test_method()  # type: ignore
+    ExampleClass().test_method()  # type: ignore
+
+    assert stats == (1, 2, 2)
+    assert built == [
+        ('open', 'a'), ('open', 'b'), ('close', 'b'), ('close', 'a')
+    ] * 2
+
+
+def test_unhashable_arguments(namespace, built):
+    '''
+    GIVEN factory called with unhashable arguments
+    WHEN calling it many times
+    THEN value is built for every call
+    '''
+    @use_fixture_namespace(namespace)
+    class ExampleClass:
+        def test_method(self, make_users):
+            make_users(1, prefix=['x'])
+            make_users(1, prefix=['x'])
+            return make_users.stats()
+
+    assert ExampleClass().test_method() == (0, 2, 0)  # type: ignore
+    assert len(built) == 2
+
+
+def test_keyword_arguments_key():
+    '''
+    GIVEN factory called with positional arguments looking like keyword ones
+    WHEN calling it with keyword arguments
+    THEN calls are memoised apart
+    '''
+    class Namespace:
+        @factory
+        def echo(self, *args, **kwargs):
+            return args, kwargs
+
+    @use_fixture_namespace(Namespace)
+    class ExampleClass:
+        def test_method(self, echo):
+            return echo((1,), (('a', 2),)), echo(1, a=2)
+
+    try:
+        positional, keyword = ExampleClass().test_method()  # type: ignore
+    finally:
+        close_factories()
+
+    assert positional == (((1,), (('a', 2),)), {})
+    assert keyword == ((1,), {'a': 2})
+
+
+def test_class_scope_of_many_classes(namespace, built):
+    '''
+    GIVEN classes decorated with the same namespace
+    WHEN calling class scoped factory in tests of both classes
+    THEN every class builds its own values
+    '''
+    @use_fixture_namespace(namespace)
+    class FirstClass:
+        def test_method(self, make_users):
+            return make_users(2)
+
+    @use_fixture_namespace(namespace)
+    class SecondClass:
+        def test_method(self, make_users):
+            return make_users(2)
+
+    first = FirstClass().test_method()  # type: ignore
+    second = SecondClass().test_method()  # type: ignore
+
+    assert first is not second
+    assert FirstClass().test_method() is first  # type: ignore
+    assert built == [('users', 2), ('users', 2)]
@@ -0,0 +1,138 @@
+import pytest
+
+pytest_plugins = ['pytester']
+
+NAMESPACE = '''
+class Namespace:
+    @property
+    def words(self):
+        return {words}
+
+    @property
+    def something(self):
+        return self.words + ['d']
+
+    @property
+    def number(self):
+        return {number}
+'''
+
+# pytest resolves arguments of plain test classes as pytest fixtures,
+# unittest test cases are run as they are
+TESTS = '''
+from unittest import TestCase
+import fixture
+from namespace import Namespace
+
+
+@fixture.use_fixture_namespace(Namespace)
+class TestClass(TestCase):
+    def test_words(self, words):
+        assert words
+
+    def test_something(self, something):
+        assert something
+
+    def test_number(self, number):
+        assert number == 1
+
+
+def test_not_tracked():
+    pass
+'''
+
+
+@pytest.fixture
+def suite(pytester):
+    def write(words="['a']", number=1, tests=TESTS):
+        pytester.makepyfile(
+            namespace=NAMESPACE.format(words=words, number=number),
+            test_impact=tests
+        )
+
+    def run(*args):
+        return pytester.runpytest(
+            '-p', 'fixture.pytest_plugin',
+            '--fixture-impact=select',
+            *args
+        )
+
+    pytester.syspathinsert()
+    write()
+    return write, run
+
+#
+#
+# tests
+#
+#
+
+
+def test_first_run_selects_all(suite):
+    '''
+    GIVEN no recorded index
+    WHEN running tests with impact selection
+    THEN all tests are run
+    '''
+    _, run = suite
+    run().assert_outcomes(passed=4)
+
+
+def test_unchanged_tests_deselected(suite):
+    '''
+    GIVEN recorded index
+    WHEN running tests again without changes
+    THEN only not tracked tests are run
+    '''
+    _, run = suite
+    run()
+    result = run()
+    result.assert_outcomes(passed=1, deselected=3)
+
+
+def test_changed_fixture_selects_dependent_tests(suite):
+    '''
+    GIVEN recorded index
+    WHEN fixture source changes
+    THEN tests using it are run
+    AND tests using fixtures which access it through self are run
+    '''
+    write, run = suite
+    run()
+    write(words="['a', 'b']")
+    result = run('-v')
+    result.assert_outcomes(passed=3, deselected=1)
+    result.stdout.fnmatch_lines([
+        '*test_something PASSED*',
+        '*test_words PASSED*',
+    ])
+
+
+def test_failed_tests_selected(suite):
+    '''
+    GIVEN recorded index with failed test
+    WHEN running tests again without changes
+    THEN failed test is run again
+    '''
+    write, run = suite
+    write(number=2)
+    run().assert_outcomes(passed=3, failed=1)
+    run().assert_outcomes(passed=1, failed=1, deselected=2)
+
+
+def test_record_mode_runs_all(suite, pytester):
+    '''
+    GIVEN recorded index
+    WHEN running tests in record mode
+    THEN all tests are run
+    AND index is saved
+    '''
+    _, run = suite
+    run()
+    result = pytester.runpytest(
+        '-p', 'fixture.pytest_plugin',
+        '--fixture-impact=record',
+        '--fixture-impact-file=other.json'
+    )
+    result.assert_outcomes(passed=4)
+    assert (pytester.path / 'other.json').exists()
@@ -0,0 +1,159 @@
+from functools import cached_property
+import pytest
+from fixture import *
+
+
+@pytest.fixture
+def computations():
+    return []
+
+
+@pytest.fixture
+def namespace(computations):
+    class Namespace:
+        @property
+        def words(self):
+            return ['a', 'b']
+
+        @cached_property
+        def heavy(self):
+            computations.append('heavy')
+            return object()
+
+    return Namespace
+
+#
+#
+# tests
+#
+#
+
+
+def test_inject_function(namespace):
+    '''
+    GIVEN namespace
+    WHEN injecting fixtures into module level function
+    THEN fixtures are injected
+    AND passed arguments have higher priority
+    '''
+    @inject(namespace)
+    def helper(words):
+        return words[0]
+
+    assert helper() == 'a'  # type: ignore
+    assert helper(words=['x']) == 'x'
+
+
+def test_inject_shares_namespace_cache(namespace, computations):
+    '''
+    GIVEN namespace with cached property
+    WHEN injecting it into many functions
+    THEN cached property is computed once
+    '''
+    @inject(namespace)
+    def first(heavy):
+        return heavy
+
+    @inject(namespace)
+    def second(heavy):
+        return heavy
+
+    assert first() is second()  # type: ignore
+    assert computations == ['heavy']
+
+
+def test_inject_shares_class_cache(namespace, computations):
+    '''
+    GIVEN class decorated with namespace
+    WHEN injecting fixtures into function from decorated class
+    THEN cached fixtures are shared with class tests
+    '''
+    @use_fixture_namespace(namespace)
+    class ExampleClass:
+        def test_method(self, heavy):
+            return heavy
+
+    @inject(ExampleClass)
+    def helper(heavy):
+        return heavy
+
+    assert helper() is ExampleClass().test_method()  # type: ignore
+    assert computations == ['heavy']
+
+
+def test_select_methods(namespace):
+    '''
+    GIVEN class with methods not starting with a test name
+    WHEN selecting methods by regex, predicate or mark
+    THEN selected methods are injected
+    AND other methods are left untouched
+    '''
+    @use_fixture_namespace(namespace, select='test|setUp')
+    class RegexClass:
+        def setUp(self, words):
+            return words
+
+        def helper(self, words):
+            return words
+
+    @use_fixture_namespace(namespace, select=lambda name: name == 'helper')
+    class PredicateClass:
+        def helper(self, words):
+            return words
+
+    @use_fixture_namespace(namespace)
+    class MarkedClass:
+        @injectable
+        def helper(self, words):
+            return words
+
+    assert RegexClass().setUp() == ['a', 'b']  # type: ignore
+    with pytest.raises(TypeError):
+        RegexClass().helper()  # type: ignore
+    assert PredicateClass().helper() == ['a', 'b']  # type: ignore
+    assert MarkedClass().helper() == ['a', 'b']  # type: ignore
+
+
+def test_inject_class(namespace):
+    '''
+    GIVEN class
+    WHEN decorating it with inject
+    THEN it works like use_fixture_namespace
+    '''
+    @inject(namespace, select='check')
+    class ExampleClass:
+        def check_words(self, words):
+            return words
+
+    assert ExampleClass().check_words() == ['a', 'b']  # type: ignore
+
+
+def test_inject_not_existing_fixture(namespace):
+    '''
+    GIVEN namespace
+    WHEN injecting not existing fixture into function
+    THEN it raises exception
+    '''
+    with pytest.raises(FixtureError):
+        @inject(namespace)
+        def helper(not_existing): ...
+
+
+def test_inject_helper_is_not_test(namespace):
+    '''
+    GIVEN decorated class
+    WHEN injecting its fixtures into module level function
+    THEN function is not registered as test of the class
+    '''
+    @use_fixture_namespace(namespace)
+    class ExampleClass:
+        def test_method(self, words): ...
+
+    @inject(ExampleClass)
+    def helper(heavy): ...
+
+    plan = ExampleClass.__fixture_plan__  # type: ignore
+    assert plan.tests == {'test_method': ['words']}
+    assert plan.helpers == {
+        f'{__name__}.{helper.__qualname__}': ['heavy']
+    }
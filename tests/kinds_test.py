@@ -0,0 +1,159 @@
+from functools import cache
+import pytest
+from fixture import *
+from fixture.namespace_injector.kinds import (
+    FixtureKind,
+    register_kind,
+    unregister_kind
+)
+
+
+@pytest.fixture
+def calls():
+    return []
+
+
+@pytest.fixture
+def namespace(calls):
+    class Namespace:
+        url = 'http://localhost'
+        limits = {'size': 10}
+
+        @staticmethod
+        def client():
+            calls.append('client')
+            return object()
+
+        @staticmethod
+        @unzip
+        def connection():
+            try:
+                yield 'connection'
+            finally:
+                calls.append('closed')
+
+        @cache
+        def settings(self):
+            calls.append('settings')
+            return {'debug': True}
+
+    return Namespace
+
+
+class Resource:
+    "Fixture member creating closable values."
+
+    def __init__(self, calls):
+        self.calls = calls
+
+    def open(self):
+        self.calls.append('opened')
+        return self
+
+    def close(self):
+        self.calls.append('closed')
+
+
+class ResourceKind(FixtureKind):
+    name = 'resource'
+
+    def match(self, member):
+        return isinstance(member, Resource)
+
+    def create_getter(self, namespace_class, namespace_context, name, member):
+        def getter():
+            resource = member.open()
+            return resource, resource
+
+        return getter
+
+#
+#
+# tests
+#
+#
+
+
+def test_constant_fixtures(namespace):
+    '''
+    GIVEN namespace with plain class attributes
+    WHEN injecting them
+    THEN the same objects are injected into every test
+    AND they don't have getters
+    '''
+    @use_fixture_namespace(namespace)
+    class ExampleClass:
+        def test_method(self, url, limits):
+            return url, limits
+
+    assert ExampleClass().test_method() == (  # type: ignore
+        'http://localhost',
+        {'size': 10}
+    )
+    assert ExampleClass().test_method()[1] is namespace.limits  # type: ignore
+    plan = ExampleClass.__fixture_plan__  # type: ignore
+    assert 'url' not in plan.fixtures_getters
+    assert plan.constants['url'] == 'http://localhost'
+
+
+def test_staticmethod_fixtures(namespace, calls):
+    '''
+    GIVEN namespace with static methods
+    WHEN injecting them
+    THEN factories are called for every test
+    AND unzip marked generators are closed after test
+    '''
+    @use_fixture_namespace(namespace)
+    class ExampleClass:
+        def test_method(self, client, connection):
+            return client, connection
+
+    first, connection = ExampleClass().test_method()  # type: ignore
+    second, _ = ExampleClass().test_method()  # type: ignore
+
+    assert first is not second
+    assert connection == 'connection'
+    assert calls == ['client', 'closed', 'client', 'closed']
+
+
+def test_cache_fixtures(namespace, calls):
+    '''
+    GIVEN namespace with functools.cache method
+    WHEN injecting it into many tests
+    THEN it is computed once
+    '''
+    @use_fixture_namespace(namespace)
+    class ExampleClass:
+        def test_1(self, settings):
+            return settings
+
+        def test_2(self, settings):
+            return settings
+
+    assert ExampleClass().test_1() is ExampleClass().test_2()  # type: ignore
+    assert calls == ['settings']
+
+
+def test_register_kind(calls):
+    '''
+    GIVEN registered fixture kind
+    WHEN injecting members of this kind
+    THEN values are created by kind getter
+    AND closed after test
+    '''
+    class Namespace:
+        resource = Resource(calls)
+
+    kind = ResourceKind()
+    register_kind(kind)
+    try:
+        @use_fixture_namespace(Namespace)
+        class ExampleClass:
+            def test_method(self, resource):
+                calls.append('test')
+    finally:
+        unregister_kind(kind)
+
+    ExampleClass().test_method()  # type: ignore
+
+    assert calls == ['opened', 'test', 'closed']
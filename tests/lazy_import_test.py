@@ -0,0 +1,128 @@
+from pathlib import Path
+import os
+import subprocess
+import sys
+import pytest
+
+
+@pytest.fixture
+def run_python():
+    env = {
+        **os.environ,
+        'PYTHONPATH': str(Path(__file__).parents[1] / 'src')
+    }
+
+    def run(code: str):
+        # fresh interpreter, modules of test session are already imported
+        return subprocess.run(
+            [sys.executable, '-c', code],
+            env=env,
+            capture_output=True,
+            text=True
+        )
+    return run
+
+#
+#
+# tests
+#
+#
+
+
+def test_package_import_is_lazy(run_python):
+    '''
+    GIVEN fresh interpreter
+    WHEN importing package
+    THEN injector modules are not imported
+    AND they are imported on the first member access
+    '''
+    result = run_python(
+        'import sys, fixture\n'
+        'assert "fixture.namespace_injector" not in sys.modules\n'
+        'assert "inspect" not in sys.modules\n'
+        'fixture.use_fixture_namespace\n'
+        'assert "fixture.namespace_injector" in sys.modules\n'
+    )
+    assert result.returncode == 0, result.stderr
+
+
+def test_members_not_hidden_by_submodules(run_python):
+    '''
+    GIVEN submodules with the same names as package members
+    WHEN importing them before accessing members
+    THEN package members are still functions
+    '''
+    result = run_python(
+        'import fixture.unzip, fixture.func_copy.copy\n'
+        'import fixture, inspect\n'
+        'assert inspect.isfunction(fixture.unzip)\n'
+        'assert inspect.isfunction(fixture.func_copy)\n'
+        'assert sorted(fixture.__all__) == sorted(\n'
+        '    name for name in dir(fixture) if name in fixture.__all__)\n'
+    )
+    assert result.returncode == 0, result.stderr
+
+
+def test_unknown_member(run_python):
+    '''
+    GIVEN package
+    WHEN accessing not existing member
+    THEN it raises exception
+    '''
+    result = run_python('import fixture; fixture.not_existing')
+    assert 'AttributeError' in result.stderr
+
+
+def test_legacy_records_paths(run_python):
+    '''
+    GIVEN code importing records from merged numbered steps package
+    WHEN importing them from old paths
+    THEN record types and getter are the current ones
+    '''
+    result = run_python(
+        'from fixture.namespace_injector.steps.outer_scope._1_ import (\n'
+        '    GetterInfo, FixtureRecord)\n'
+        'from fixture.namespace_injector.steps.outer_scope._1_.create_getter '
+        'import GetterInfo as Info, create_getter\n'
+        'from fixture.namespace_injector import records\n'
+        'from fixture.namespace_injector.steps import outer_scope\n'
+        'assert GetterInfo is Info is records.GetterInfo\n'
+        'assert FixtureRecord is records.FixtureRecord\n'
+        'assert create_getter is outer_scope.create_getter\n'
+    )
+    assert result.returncode == 0, result.stderr
+
+
+def test_pytest_plugin_import_is_lazy(run_python):
+    '''
+    GIVEN pytest plugin loaded by every pytest process
+    WHEN importing it
+    THEN impact selection, mock and factory modules are not imported
+    '''
+    result = run_python(
+        'import sys, fixture.pytest_plugin\n'
+        'for name in ("fixture.impact", "fixture.mock", "fixture.factory"):\n'
+        '    assert name not in sys.modules, name\n'
+    )
+    assert result.returncode == 0, result.stderr
+
+
+def test_submodules_functions_import(run_python):
+    '''
+    GIVEN submodules with the same names as package members
+    WHEN importing their functions with documented `from` imports
+    THEN module functions are imported
+    AND package members are still the decorators
+    '''
+    result = run_python(
+        'from fixture.mock import stop_mocks\n'
+        'from fixture.factory import close_factories\n'
+        'from fixture.stream import file\n'
+        'from fixture.snapshot import Snapshot\n'
+        'import fixture, inspect\n'
+        'stop_mocks("class")\n'
+        'close_factories("class")\n'
+        'for name in ("mock", "stream", "snapshot", "factory", "shared"):\n'
+        '    assert inspect.isfunction(getattr(fixture, name)), name\n'
+    )
+    assert result.returncode == 0, result.stderr
@@ -0,0 +1,89 @@
+from functools import cached_property
+from fixture import *
+from fixture import hooks
+from fixture.leaks import detect_leaks
+
+
+class Value:
+    "Weakly referenceable value."
+
+
+def create_example_class():
+    class Namespace:
+        @cached_property
+        def rows(self):
+            yield 'first'
+            yield 'second'
+
+        @property
+        def first_row(self):
+            return next(self.rows)
+
+        @property
+        def fresh(self):
+            return Value()
+
+    @use_fixture_namespace(Namespace)
+    class ExampleClass:
+        def test_rows(self, first_row):
+            return first_row
+
+        def test_fresh(self, fresh):
+            assert isinstance(fresh, Value)
+
+    return ExampleClass
+
+#
+#
+# tests
+#
+#
+
+
+def test_detect_unclosed_generator():
+    '''
+    GIVEN namespace member caching generator read by other member
+    WHEN running tests with leaks detection
+    THEN not closed generator is reported once
+    AND it is reported as survivor
+    '''
+    with detect_leaks() as detector:
+        example_class = create_example_class()
+        example_class().test_rows()
+        example_class().test_rows()
+
+    assert [(leak.fixture, leak.kind) for leak in detector.leaks] == [
+        ('rows', 'unclosed generator')
+    ]
+    assert detector.leaks[0].test.endswith('ExampleClass.test_rows')
+    assert [leak.fixture for leak in detector.survivors()] == ['rows']
+    assert 'unclosed generator' in detector.report()
+
+
+def test_released_values_are_not_reported():
+    '''
+    GIVEN namespace member creating new value
+    WHEN running tests with leaks detection
+    THEN nothing is reported
+    '''
+    with detect_leaks() as detector:
+        create_example_class()().test_fresh()
+
+    assert detector.leaks == []
+    assert detector.report() == ''
+
+
+def test_detection_disabled():
+    '''
+    GIVEN leaks detection block
+    WHEN block ends
+    THEN namespaces decorated later are not observed
+    AND tests are not tracked
+    '''
+    with detect_leaks() as detector:
+        pass
+    create_example_class()().test_rows()
+
+    assert hooks.active == ()
+    assert not hooks.observe_members
+    assert detector.leaks == []
@@ -0,0 +1,177 @@
+import pytest
+from fixture import *
+from fixture.mock import stop_mocks
+
+pytest_plugins = ['pytester']
+
+
+def service():
+    return 'real'
+
+
+@pytest.fixture
+def namespace():
+    class Namespace:
+        per_test = mock(f'{__name__}.service', return_value='mocked')
+        per_class = mock(f'{__name__}.service', scope='class')
+
+    yield Namespace
+    stop_mocks()
+
+
+# pytest resolves arguments of plain test classes as pytest fixtures,
+# unittest test cases are run as they are
+TESTS = '''
+from unittest import TestCase
+import fixture
+import target
+
+
+class Namespace:
+    service = fixture.mock('target.service', scope='class')
+
+
+@fixture.use_fixture_namespace(Namespace)
+class TestFirst(TestCase):
+    def test_1(self, service):
+        service()
+        assert target.service.call_count == 1
+
+    def test_2(self, service):
+        assert target.service is service
+        assert service.call_count == 0
+
+
+class TestSecond(TestCase):
+    def test_real(self):
+        assert target.service() == 'real'
+'''
+
+#
+#
+# tests
+#
+#
+
+
+def test_test_scope(namespace):
+    '''
+    GIVEN mock fixture with test scope
+    WHEN injecting it into many tests
+    THEN target is patched only during tests
+    AND the same mock is reused and reset between tests
+    '''
+    @use_fixture_namespace(namespace)
+    class ExampleClass:
+        def test_method(self, per_test):
+            assert service() == 'mocked'
+            assert per_test.call_count == 1
+            return per_test
+
+    first = ExampleClass().test_method()  # type: ignore
+    assert service() == 'real'
+    second = ExampleClass().test_method()  # type: ignore
+
+    assert first is second
+    assert first.call_count == 0
+    assert service() == 'real'
+
+
+def test_class_scope(namespace):
+    '''
+    GIVEN mock fixture with class scope
+    WHEN injecting it into many tests
+    THEN target stays patched between tests
+    AND mock is reset between tests
+    AND patch is stopped with class scope mocks
+    '''
+    @use_fixture_namespace(namespace)
+    class ExampleClass:
+        def test_method(self, per_class):
+            per_class()
+            assert per_class.call_count == 1
+            return per_class
+
+    patched = ExampleClass().test_method()  # type: ignore
+    assert service is patched
+    ExampleClass().test_method()  # type: ignore
+
+    stop_mocks('class')
+    assert service is not patched
+    assert service() == 'real'
+
+
+def test_many_scopes_of_target(namespace):
+    '''
+    GIVEN mock fixtures of test and class scope patching the same target
+    WHEN injecting both into many tests
+    THEN test scope mock is patched in every test
+    AND class scope mock is patched between tests
+    AND target is not patched after patches are stopped
+    '''
+    @use_fixture_namespace(namespace)
+    class ExampleClass:
+        def test_method(self, per_test, per_class):
+            assert service is per_test
+            return per_test, per_class
+
+    per_test, per_class = ExampleClass().test_method()  # type: ignore
+    assert service is per_class
+    ExampleClass().test_method()  # type: ignore
+    assert service is per_class
+
+    stop_mocks('class')
+    assert service() == 'real'
+
+
+def test_invalid_scope():
+    '''
+    GIVEN mock with not existing scope
+    WHEN creating it
+    THEN it raises exception
+    '''
+    with pytest.raises(ValueError):
+        mock(f'{__name__}.service', scope='module')
+
+
+def test_fingerprint_covers_arguments():
+    '''
+    GIVEN mocks of the same target with different arguments
+    WHEN fingerprinting them for test impact selection
+    THEN every argument changes fingerprint
+    '''
+    from unittest.mock import NonCallableMock
+    from fixture.impact import NamespaceFingerprint
+
+    def fingerprint(member):
+        namespace = type('Namespace', (), {'service': member})
+        return NamespaceFingerprint(namespace)('service')
+
+    target = f'{__name__}.service'
+    fingerprints = {
+        fingerprint(mock(target, return_value=1)),
+        fingerprint(mock(target, return_value=2)),
+        fingerprint(mock(target, return_value=1, side_effect=None)),
+        fingerprint(mock(target, return_value=1, autospec=True)),
+        fingerprint(mock(target, new_callable=NonCallableMock)),
+    }
+
+    assert len(fingerprints) == 5
+    assert fingerprint(mock(target, return_value=1)) in fingerprints
+
+
+def test_pytest_plugin_stops_class_scope(pytester):
+    '''
+    GIVEN class scoped mock fixture used by tests class
+    WHEN running tests of other class
+    THEN target is not patched
+    '''
+    pytester.makepyfile(
+        target="def service():\n    return 'real'\n",
+        test_mock=TESTS
+    )
+    pytester.syspathinsert()
+
+    result = pytester.runpytest('-p', 'fixture.pytest_plugin')
+
+    result.assert_outcomes(passed=3)
@@ -245,10 +245,8 @@ def test_loading_in_order(property_field_loading_in_order):
 
 
 # isinstance(mock, Generator) => True
-@patch('fixture.namespace_injector.steps.outer_scope._1_.create_getter.isinstance', return_value=True)
-@patch('fixture.namespace_injector.steps.outer_scope._1_.builder.inspect.isdatadescriptor', return_value=True)
-@patch('fixture.namespace_injector.steps.outer_scope._1_.builder.inspect.ismethoddescriptor', return_value=True)
-def test_generators_closed(_isinstance, _isdata, _ismethod, property_field_generators):
+@patch('fixture.namespace_injector.kinds.isinstance', return_value=True)
+def test_generators_closed(_isinstance, property_field_generators):
     '''
     GIVEN property fields in class with yields
     WHEN injecting fields
@@ -269,10 +267,8 @@ def test_generators_closed(_isinstance, _isdata, _ismethod, property_field_gener
 # isinstance(mock, Generator) => True
 
 
-@patch('fixture.namespace_injector.steps.outer_scope._1_.create_getter.isinstance', return_value=True)
-@patch('fixture.namespace_injector.steps.outer_scope._1_.builder.inspect.isdatadescriptor', return_value=True)
-@patch('fixture.namespace_injector.steps.outer_scope._1_.builder.inspect.ismethoddescriptor', return_value=True)
-def test_broken_test_generators_closed(_isinstance, _isdata, _ismethod, property_field_generators):
+@patch('fixture.namespace_injector.kinds.isinstance', return_value=True)
+def test_broken_test_generators_closed(_isinstance, property_field_generators):
     '''
     GIVEN property fields in class with yields
     WHEN injecting fields
@@ -0,0 +1,135 @@
+from unittest import SkipTest
+import pytest
+from fixture import *
+
+
+@pytest.fixture
+def evaluated():
+    return []
+
+
+@pytest.fixture
+def namespace(evaluated):
+    class Namespace:
+        @property
+        @priority('expensive')
+        def database(self):
+            evaluated.append('database')
+            return 'database'
+
+        @property
+        @unzip
+        def server(self):
+            evaluated.append('server')
+            yield 'server'
+
+        @property
+        @priority('cheap')
+        def settings(self):
+            evaluated.append('settings')
+            return {'valid': False}
+
+        @property
+        @priority('cheap')
+        def valid_settings(self):
+            evaluated.append('valid_settings')
+            if not self.settings['valid']:
+                raise ValueError('invalid settings')
+
+    return Namespace
+
+#
+#
+# tests
+#
+#
+
+
+def test_priority_order(namespace, evaluated):
+    '''
+    GIVEN fixtures with priorities
+    WHEN injecting them
+    THEN fixtures are evaluated by priority
+    AND fixtures with the same priority in definition order
+    '''
+    @use_fixture_namespace(namespace)
+    class ExampleClass:
+        def test_method(self, server, database, settings):
+            pass
+
+    ExampleClass().test_method()  # type: ignore
+
+    assert evaluated == ['settings', 'server', 'database']
+    assert ExampleClass.__fixture_plan__.tests == {  # type: ignore
+        'test_method': ['settings', 'server', 'database']
+    }
+
+
+def test_fail_fast(namespace, evaluated):
+    '''
+    GIVEN cheap fixture failing
+    WHEN injecting it with expensive fixtures
+    THEN expensive fixtures are not evaluated
+    '''
+    @use_fixture_namespace(namespace)
+    class ExampleClass:
+        def test_method(self, database, server, valid_settings):
+            pass
+
+    with pytest.raises(ValueError):
+        ExampleClass().test_method()  # type: ignore
+
+    assert evaluated == ['valid_settings', 'settings']
+
+
+def test_setup_failure_closes_generators(evaluated):
+    '''
+    GIVEN fixture failing after generator fixture
+    WHEN injecting them
+    THEN generator is closed
+    '''
+    class Namespace:
+        @property
+        @unzip
+        def server(self):
+            try:
+                yield 'server'
+            finally:
+                evaluated.append('server closed')
+
+        @property
+        def broken(self):
+            raise RuntimeError()
+
+    @use_fixture_namespace(Namespace)
+    class ExampleClass:
+        def test_method(self, server, broken):
+            pass
+
+    with pytest.raises(RuntimeError):
+        ExampleClass().test_method()  # type: ignore
+
+    assert evaluated == ['server closed']
+
+
+def test_precondition(namespace, evaluated):
+    '''
+    GIVEN test with not satisfied precondition
+    WHEN running it
+    THEN test is skipped before fixtures are evaluated
+    '''
+    @use_fixture_namespace(namespace)
+    class ExampleClass:
+        @precondition(lambda self: self.enabled)
+        def test_method(self, database):
+            pass
+
+        enabled = False
+
+    with pytest.raises(SkipTest):
+        ExampleClass().test_method()  # type: ignore
+    assert evaluated == []
+
+    ExampleClass.enabled = True
+    ExampleClass().test_method()  # type: ignore
+    assert evaluated == ['database']
@@ -0,0 +1,199 @@
+import json
+import sys
+import pytest
+from fixture.__main__ import main
+from fixture.plan import build_plan
+
+
+NAMESPACE = '''
+from functools import cached_property
+import fixture
+
+
+class Namespace:
+    @property
+    def words(self):
+        return ['a']
+
+    @cached_property
+    def heavy(self):
+        return 1
+
+    @property
+    @fixture.unzip
+    def mock(self):
+        yield 1
+
+    @property
+    def unused(self):
+        return 0
+
+    LIMIT = 5
+'''
+
+VALID_TESTS = '''
+import fixture
+from {package}.namespace import Namespace
+
+
+@fixture.use_fixture_namespace(Namespace)
+class TestValid:
+    def test_words(self, words, heavy): ...
+
+    def test_mock(self, heavy, mock): ...
+'''
+
+INVALID_TESTS = '''
+import fixture
+from {package}.namespace import Namespace
+
+
+@fixture.use_fixture_namespace(Namespace)
+class TestInvalid:
+    def test_first(self, words, not_existing): ...
+
+    def test_second(self, other_not_existing): ...
+
+
+@fixture.inject(TestInvalid)
+def make_user(words, not_existing_helper): ...
+'''
+
+
+@pytest.fixture
+def tests_package(tmp_path, monkeypatch):
+    # package name must be unique, modules stay in `sys.modules`
+    package = f'plan_{tmp_path.name}'
+    monkeypatch.setattr(sys, 'path', sys.path.copy())
+
+    root = tmp_path / package
+    root.mkdir()
+    (root / '__init__.py').touch()
+    (root / 'namespace.py').write_text(NAMESPACE)
+    (root / 'valid_test.py').write_text(VALID_TESTS.format(package=package))
+    (root / 'test_invalid.py').write_text(
+        INVALID_TESTS.format(package=package)
+    )
+    return package, root
+
+#
+#
+# tests
+#
+#
+
+
+def test_plan_describes_fixtures(tests_package):
+    '''
+    GIVEN test modules with decorated classes
+    WHEN building plan
+    THEN fixtures used by every test are described in injection order
+    AND fixtures kinds and scopes are described
+    AND costs are estimated from timings
+    '''
+    package, root = tests_package
+    namespace = f'{package}.namespace.Namespace'
+
+    report = build_plan([str(root)], timings={
+        f'{namespace}.words': 0.5,
+        f'{namespace}.heavy': 2.0,
+    })
+
+    valid = next(
+        module for module in report['modules']
+        if module['module'] == f'{package}.valid_test'
+    )
+    klass = valid['classes']['TestValid']
+    assert klass['namespace'] == namespace
+    assert klass['tests']['test_words']['fixtures'] == ['words', 'heavy']
+    assert klass['tests']['test_mock']['fixtures'] == ['heavy', 'mock']
+    # cached property is paid once per class
+    assert klass['tests']['test_words']['cost'] == 0.5
+    assert klass['cost'] == 2.5
+
+    fixtures = report['namespaces'][namespace]['fixtures']
+    assert fixtures['heavy'] == {
+        'kind': 'cached_property', 'scope': 'class', 'unzip': False,
+        'cost': 2.0
+    }
+    assert fixtures['mock'] == {
+        'kind': 'property', 'scope': 'test', 'unzip': True, 'cost': None
+    }
+
+
+def test_plan_reports_all_problems(tests_package):
+    '''
+    GIVEN test modules with many not existing fixtures
+    WHEN building plan
+    THEN all not existing fixtures are reported in one pass
+    AND fixtures of injected helpers are reported apart from tests
+    AND fixtures unused by any test are reported
+    AND constants are not reported as unused
+    '''
+    package, root = tests_package
+
+    report = build_plan([str(root)])
+
+    assert report['missing'] == [
+        {
+            'test': f'{package}.test_invalid.TestInvalid.test_first',
+            'fixtures': ['not_existing']
+        },
+        {
+            'test': f'{package}.test_invalid.TestInvalid.test_second',
+            'fixtures': ['other_not_existing']
+        },
+        {
+            'helper': f'{package}.test_invalid.make_user',
+            'fixtures': ['not_existing_helper']
+        },
+    ]
+    invalid = next(
+        module for module in report['modules']
+        if module['module'] == f'{package}.test_invalid'
+    )
+    klass = invalid['classes']['TestInvalid']
+    assert list(klass['tests']) == ['test_first', 'test_second']
+    assert klass['helpers'][f'{package}.test_invalid.make_user'] == {
+        'fixtures': ['words'],
+        'missing': ['not_existing_helper']
+    }
+    namespace = report['namespaces'][f'{package}.namespace.Namespace']
+    assert namespace['unused'] == ['unused']
+    assert report['errors'] == []
+
+
+def test_plan_command(tests_package, tmp_path, capsys):
+    '''
+    GIVEN test modules with not existing fixtures
+    WHEN running plan command
+    THEN plan is written as JSON
+    AND problems are printed
+    AND command fails
+    '''
+    _, root = tests_package
+    output = tmp_path / 'plan.json'
+
+    assert main(['plan', str(root), '-o', str(output)]) == 1
+
+    assert len(json.loads(output.read_text())['missing']) == 3
+    assert 'unused fixtures: unused' in capsys.readouterr().err
+
+
+def test_plan_import_error(tmp_path, monkeypatch):
+    '''
+    GIVEN test module which cannot be imported
+    WHEN building plan
+    THEN error is reported
+    AND other modules are still planned
+    '''
+    monkeypatch.setattr(sys, 'path', sys.path.copy())
+    broken = tmp_path / f'broken_{tmp_path.name}_test.py'
+    broken.write_text('raise RuntimeError("broken")')
+
+    report = build_plan([str(tmp_path)])
+
+    assert report['errors'] == [{
+        'path': str(broken),
+        'error': "RuntimeError('broken')"
+    }]
@@ -0,0 +1,103 @@
+import json
+import pstats
+import sys
+import pytest
+from fixture import *
+from fixture.profiling import profile_fixtures
+
+
+@pytest.fixture
+def namespace():
+    class Namespace:
+        @property
+        def big(self):
+            return bytearray(1024 * 1024)
+
+        @property
+        @unzip
+        def resource(self):
+            yield 'resource'
+            # teardown
+            bytearray(1024)
+
+    return Namespace
+
+
+@pytest.fixture
+def example_class(namespace):
+    @use_fixture_namespace(namespace)
+    class ExampleClass:
+        def test_method(self, big, resource):
+            return len(big), resource
+
+    return ExampleClass
+
+#
+#
+# tests
+#
+#
+
+
+def test_profile_fixtures(example_class, namespace, tmp_path):
+    '''
+    GIVEN decorated class
+    WHEN running tests with profiling
+    THEN time of every fixture setup and teardown is saved as pstats files
+    AND time of namespace is saved as pstats file
+    AND memory of every fixture is reported
+    '''
+    with profile_fixtures(tmp_path, snapshots=True):
+        for _ in range(3):
+            example_class().test_method()
+
+    prefix = f'{namespace.__module__}.{namespace.__qualname__}'
+    for name in [
+        f'{prefix}.big.setup',
+        f'{prefix}.resource.setup',
+        f'{prefix}.resource.teardown',
+        prefix
+    ]:
+        assert pstats.Stats(str(tmp_path / f'{name}.pstats')).total_calls
+
+    report = json.loads((tmp_path / 'memory.json').read_text())
+    big = report[prefix]['fixtures']['big']['setup']
+    assert big['calls'] == 3
+    assert big['peak'] >= 1024 * 1024
+    assert big['sites']
+    assert 'big (setup, 3 calls)' in (tmp_path / 'memory.txt').read_text()
+
+
+def test_profiling_disabled(example_class):
+    '''
+    GIVEN decorated class
+    WHEN profiling block ends
+    THEN next tests are not profiled
+    '''
+    with profile_fixtures() as profiler:
+        example_class().test_method()
+    example_class().test_method()
+
+    assert all(info.calls == 1 for info in profiler.memory.values())
+
+
+def test_outer_profiler_kept(example_class):
+    '''
+    GIVEN profiler already active (e.g. `python -m cProfile` run)
+    WHEN profiling fixtures
+    THEN fixtures are not profiled with cProfile
+    AND outer profiler stays active
+    '''
+    def outer(frame, event, arg): ...
+
+    sys.setprofile(outer)
+    try:
+        with profile_fixtures() as profiler:
+            example_class().test_method()
+        active = sys.getprofile()
+    finally:
+        sys.setprofile(None)
+
+    assert active is outer
+    assert not profiler.stats
+    assert profiler.memory
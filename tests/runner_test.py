@@ -0,0 +1,219 @@
+import os
+import sys
+import pytest
+from fixture.__main__ import main
+from fixture.runner import partition, run
+
+
+NAMESPACE = '''
+import os
+import fixture
+
+
+class Namespace:
+    @property
+    @fixture.shared
+    def session(self):
+        with open({log!r}, 'a') as log:
+            log.write(f'session {{os.getpid()}}\\n')
+        return {{'pid': os.getpid()}}
+
+    @property
+    def number(self):
+        return 1
+'''
+
+TESTS = '''
+import os
+import unittest
+import fixture
+from {package}.namespace import Namespace
+
+
+def record(name, session):
+    with open({log!r}, 'a') as log:
+        log.write(f'{{name}} {{os.getpid()}} {{session["pid"]}}\\n')
+
+
+@fixture.use_fixture_namespace(Namespace)
+class TestPlain:
+    def test_first(self, session, number):
+        record('first', session)
+
+    def test_second(self, session):
+        record('second', session)
+        assert False, 'expected failure'
+
+
+@fixture.use_fixture_namespace(Namespace)
+class TestCase(unittest.TestCase):
+    def test_third(self, session, number):
+        record('third', session)
+
+    def test_skipped(self, number):
+        self.skipTest('not now')
+'''
+
+FIXTURES_ERRORS_TESTS = '''
+import unittest
+import fixture
+
+
+class Namespace:
+    @property
+    def number(self):
+        return 1
+
+
+@fixture.use_fixture_namespace(Namespace)
+class TestSubTests(unittest.TestCase):
+    def test_subtests(self, number):
+        for i in range(3):
+            with self.subTest(i=i):
+                self.assertLess(i, number, 'expected failure')
+
+    def test_passed(self, number):
+        with self.subTest(i=0):
+            pass
+
+
+@fixture.use_fixture_namespace(Namespace)
+class TestBrokenSetup(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        raise RuntimeError('broken class setup')
+
+    def test_first(self, number): ...
+
+    def test_second(self, number): ...
+'''
+
+
+@pytest.fixture
+def tests_package(tmp_path, monkeypatch):
+    # package name must be unique, modules stay in `sys.modules`
+    package = f'runner_{tmp_path.name}'
+    monkeypatch.setattr(sys, 'path', sys.path.copy())
+
+    log = tmp_path / 'log.txt'
+    root = tmp_path / package
+    root.mkdir()
+    (root / '__init__.py').touch()
+    (root / 'namespace.py').write_text(NAMESPACE.format(log=str(log)))
+    (root / 'tests_test.py').write_text(
+        TESTS.format(package=package, log=str(log))
+    )
+    return package, root, log
+
+#
+#
+# tests
+#
+#
+
+
+@pytest.mark.skipif(not hasattr(os, 'fork'), reason='requires os.fork')
+def test_run_forked(tests_package):
+    '''
+    GIVEN test modules using shared fixture
+    WHEN running them in worker processes
+    THEN shared fixture is computed once, before fork
+    AND tests are run in workers with inherited fixture value
+    AND results of all tests are reported
+    '''
+    package, root, log = tests_package
+
+    summary = run([str(root)], jobs=2)
+
+    lines = log.read_text().splitlines()
+    assert lines[0] == f'session {os.getpid()}'
+    records = [line.split() for line in lines[1:]]
+    assert sorted(name for (name, _, _) in records) == \
+        ['first', 'second', 'third']
+    for (_, worker, session) in records:
+        assert worker != str(os.getpid())
+        assert session == str(os.getpid())
+
+    assert summary['counts'] == {'passed': 2, 'failed': 1, 'skipped': 1}
+    failed = next(
+        result for result in summary['results']
+        if result['outcome'] == 'failed'
+    )
+    assert failed['test'] == f'{package}.tests_test.TestPlain.test_second'
+    assert 'expected failure' in failed['details']
+
+
+def test_run_in_process(tests_package, capsys):
+    '''
+    GIVEN test modules with failing test
+    WHEN running them with one job from command line
+    THEN tests are run in current process
+    AND failure is reported with exit code
+    '''
+    package, root, log = tests_package
+
+    code = main(['run', '-j', '1', str(root)])
+
+    assert code == 1
+    for line in log.read_text().splitlines():
+        assert line.split()[1] == str(os.getpid())
+    out = capsys.readouterr().out
+    assert f'FAILED {package}.tests_test.TestPlain.test_second' in out
+    assert '1 failed, 2 passed, 1 skipped' in out
+
+
+def test_partition():
+    '''
+    GIVEN classes with different number of tests
+    WHEN splitting them between workers
+    THEN every class is run by exactly one worker
+    AND number of tests is balanced
+    '''
+    class Plan:
+        def __init__(self, count):
+            self.tests = {f'test_{i}': [] for i in range(count)}
+
+    classes = [
+        type(f'Class{count}', (), {'__fixture_plan__': Plan(count)})
+        for count in (5, 1, 3, 2, 1)
+    ]
+
+    parts = partition(classes, 3)
+
+    assert sorted(len(part) for part in parts) == [1, 2, 2]
+    assert sorted(k.__name__ for part in parts for k in part) == \
+        sorted(k.__name__ for k in classes)
+    sizes = sorted(
+        sum(len(k.__fixture_plan__.tests) for k in part) for part in parts
+    )
+    assert sizes == [3, 4, 5]
+
+
+def test_run_fixtures_errors(tests_package):
+    '''
+    GIVEN test case with failing subtests and test case with broken setUpClass
+    WHEN running them
+    THEN test is reported once as failed with failures of its subtests
+    AND setUpClass error is reported for every test of class with traceback
+    '''
+    package, root, _ = tests_package
+    (root / 'errors_test.py').write_text(FIXTURES_ERRORS_TESTS)
+
+    summary = run([str(root / 'errors_test.py')], jobs=1)
+
+    # class.test: result
+    results = {
+        result['test'].split('.', 2)[2]: result
+        for result in summary['results']
+    }
+    assert len(summary['results']) == 4
+    assert results['TestSubTests.test_passed']['outcome'] == 'passed'
+    failed = results['TestSubTests.test_subtests']
+    assert failed['outcome'] == 'failed'
+    assert failed['details'].count('not less than 1') == 2
+    assert '(i=1)' in failed['details'] and '(i=2)' in failed['details']
+    for name in ('test_first', 'test_second'):
+        broken = results[f'TestBrokenSetup.{name}']
+        assert broken['outcome'] == 'error'
+        assert 'setUpClass' in broken['details']
+        assert 'broken class setup' in broken['details']
@@ -0,0 +1,180 @@
+from functools import cached_property
+import pytest
+from fixture import *
+
+
+@pytest.fixture
+def computations():
+    return []
+
+
+@pytest.fixture
+def base_namespace(computations):
+    class BaseNamespace:
+        @property
+        def words(self):
+            return ['a', 'b']
+
+        @cached_property
+        def heavy(self):
+            computations.append('heavy')
+            return object()
+
+        @cached_property
+        def sentence(self):
+            computations.append('sentence')
+            return ' '.join(self.words)
+
+        @property
+        @shared
+        def schema(self):
+            computations.append('schema')
+            return {'id': int}
+
+    return BaseNamespace
+
+
+@pytest.fixture
+def other_namespace(base_namespace):
+    class OtherNamespace:
+        heavy = base_namespace.heavy
+        sentence = base_namespace.sentence
+        schema = base_namespace.schema
+
+        @property
+        def words(self):
+            return ['x', 'y']
+
+    return OtherNamespace
+
+
+@pytest.fixture
+def base_class(base_namespace):
+    @use_fixture_namespace(base_namespace)
+    class BaseClass:
+        def test_method(self, heavy, sentence, schema):
+            return heavy, sentence, schema
+
+    return BaseClass
+
+#
+#
+# tests
+#
+#
+
+
+def test_same_function_is_shared(base_class, other_namespace, computations):
+    '''
+    GIVEN namespace reusing cached property of copied tests namespace
+    WHEN running copied test
+    THEN cached property is computed once for both namespaces
+    AND cached property using overridden members is computed for each
+    '''
+    @use_fixture_namespace(other_namespace)
+    class OtherClass:
+        @func_copy(base_class.test_method)
+        def test_copy(self): ...
+
+    heavy, sentence, schema = base_class().test_method()  # type: ignore
+    other_heavy, other_sentence, other_schema = OtherClass().test_copy()
+
+    assert heavy is other_heavy
+    assert (sentence, other_sentence) == ('a b', 'x y')
+    assert schema is other_schema
+    assert sorted(computations) == ['heavy', 'schema', 'sentence', 'sentence']
+
+
+def test_marked_shared(base_namespace, computations):
+    '''
+    GIVEN property marked as shared
+    WHEN injecting it into many tests and namespaces
+    THEN it is computed once
+    '''
+    class AnotherNamespace:
+        schema = base_namespace.schema
+
+    @use_fixture_namespace(base_namespace)
+    class FirstClass:
+        def test_1(self, schema):
+            return schema
+
+        def test_2(self, schema):
+            return schema
+
+    @use_fixture_namespace(AnotherNamespace)
+    class SecondClass:
+        def test_method(self, schema):
+            return schema
+
+    assert FirstClass().test_1() is FirstClass().test_2()  # type: ignore
+    assert FirstClass().test_1() is SecondClass().test_method()  # type: ignore
+    assert computations == ['schema']
+
+
+def test_shared_unzip():
+    '''
+    GIVEN shared property marked with unzip
+    WHEN injecting it
+    THEN it raises exception
+    '''
+    class Namespace:
+        @property
+        @shared
+        @unzip
+        def resource(self):
+            yield 1
+
+    with pytest.raises(ValueError):
+        @use_fixture_namespace(Namespace)
+        class ExampleClass:
+            def test_method(self, resource): ...
+
+
+def test_same_namespace_not_shared(base_namespace, computations):
+    '''
+    GIVEN two classes decorated with the same namespace
+    WHEN running their tests
+    THEN cached property is computed once for every class
+    '''
+    @use_fixture_namespace(base_namespace)
+    class FirstClass:
+        def test_method(self, heavy):
+            return heavy
+
+    @use_fixture_namespace(base_namespace)
+    class SecondClass:
+        def test_method(self, heavy):
+            return heavy
+
+    assert FirstClass().test_method() is FirstClass().test_method()  # type: ignore
+    assert FirstClass().test_method() is not SecondClass().test_method()  # type: ignore
+    assert computations == ['heavy', 'heavy']
+
+
+def test_namespace_class_dependent_not_shared():
+    '''
+    GIVEN copied test using cached property which reads namespace class
+    WHEN running copied test in subclass namespace
+    THEN cached property is computed for subclass namespace
+    '''
+    class Base:
+        @cached_property
+        def name(self):
+            return type(self).__name__
+
+    class Sub(Base):
+        name = Base.__dict__['name']
+
+    @use_fixture_namespace(Base)
+    class BaseClass:
+        def test_method(self, name):
+            return name
+
+    @use_fixture_namespace(Sub)
+    class SubClass:
+        @func_copy(BaseClass.test_method)
+        def test_copy(self): ...
+
+    assert BaseClass().test_method() == 'Base'  # type: ignore
+    assert SubClass().test_copy() == 'Sub'
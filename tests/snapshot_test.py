@@ -0,0 +1,107 @@
+import sqlite3
+import pytest
+from fixture import *
+
+
+@pytest.fixture
+def database(tmp_path):
+    connection = sqlite3.connect(tmp_path / 'test.sqlite3')
+    connection.execute('CREATE TABLE user (name TEXT)')
+    connection.commit()
+    yield connection
+    connection.close()
+
+
+@pytest.fixture
+def seeded():
+    return []
+
+
+def users(connection) -> list[str]:
+    return [name for (name,) in connection.execute('SELECT name FROM user')]
+
+
+@pytest.fixture
+def test_class(database, seeded):
+    class Namespace:
+        @snapshot(connect=lambda self: database)
+        def users(self):
+            seeded.append('users')
+            database.executemany(
+                'INSERT INTO user VALUES (?)',
+                [('a',), ('b',)]
+            )
+            return 2
+
+    @use_fixture_namespace(Namespace)
+    class ExampleClass:
+        def test_method(self, users):
+            # changes are committed, like tests not wrapped in transaction
+            database.execute("INSERT INTO user VALUES ('c')")
+            database.commit()
+            return users
+
+    return ExampleClass
+
+#
+#
+# tests
+#
+#
+
+
+def test_restored(test_class, database, seeded):
+    '''
+    GIVEN seeding fixture with snapshot
+    WHEN injecting it into many tests
+    THEN seeding method is run once
+    AND database is restored before every next test
+    '''
+    assert test_class().test_method() == 2
+    assert users(database) == ['a', 'b', 'c']
+    assert test_class().test_method() == 2
+    assert users(database) == ['a', 'b', 'c']
+
+    assert seeded == ['users']
+
+
+def test_file_snapshot(tmp_path, database, seeded):
+    '''
+    GIVEN seeding fixture with snapshot file
+    WHEN injecting it into test of new namespace with the same source
+    THEN snapshot file is restored without seeding
+    AND changed source invalidates snapshot
+    '''
+    def create_namespace(count: int):
+        class Namespace:
+            @snapshot(path=tmp_path / 'snapshots', connect=lambda s: database)
+            def users(self):
+                seeded.append('users')
+                database.executemany(
+                    'INSERT INTO user VALUES (?)',
+                    [(str(i),) for i in range(self.count)]
+                )
+                return ['users']
+
+        Namespace.count = count
+
+        @use_fixture_namespace(Namespace)
+        class ExampleClass:
+            def test_method(self, users):
+                return users
+
+        return ExampleClass
+
+    create_namespace(2)().test_method()  # type: ignore
+    database.execute('DELETE FROM user')
+    database.commit()
+
+    assert create_namespace(2)().test_method() == ['users']  # type: ignore
+    assert users(database) == ['0', '1']
+    assert seeded == ['users']
+    assert len(list((tmp_path / 'snapshots').glob('*.sqlite3'))) == 1
+
+    # constant members are part of namespace source
+    create_namespace(3)().test_method()  # type: ignore
+    assert seeded == ['users', 'users']
+    assert len(list((tmp_path / 'snapshots').glob('*.sqlite3'))) == 1
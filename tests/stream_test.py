@@ -0,0 +1,104 @@
+import pytest
+from fixture import *
+
+
+@pytest.fixture
+def dataset(tmp_path):
+    path = tmp_path / 'requests.jsonl'
+    path.write_text(''.join(f'{{"id": {i}}}\n' for i in range(100)))
+    return path
+
+
+@pytest.fixture
+def closed():
+    return []
+
+
+@pytest.fixture
+def namespace(dataset, closed):
+    class Namespace:
+        lines = stream.file(dataset, limit=3)
+        mapped = stream.file(dataset, mmap=True, encoding='utf-8')
+        chunks = stream.file(lambda self: self.path, chunk_size=64)
+
+        @property
+        def path(self):
+            return dataset
+
+        @stream(limit=2)
+        def numbers(self):
+            try:
+                yield from range(10)
+            finally:
+                closed.append('numbers')
+
+    return Namespace
+
+#
+#
+# tests
+#
+#
+
+
+def test_file_stream(namespace, dataset):
+    '''
+    GIVEN namespace with file streams
+    WHEN injecting them
+    THEN lines are read lazily up to the limit
+    AND file is read through mmap or in chunks
+    AND files are closed after test
+    '''
+    @use_fixture_namespace(namespace)
+    class ExampleClass:
+        def test_method(self, lines, mapped, chunks):
+            assert list(lines) == [
+                b'{"id": 0}\n',
+                b'{"id": 1}\n',
+                b'{"id": 2}\n'
+            ]
+            assert next(mapped) == '{"id": 0}\n'
+            assert b''.join(chunks) == dataset.read_bytes()
+            return lines, mapped, chunks
+
+    streams = ExampleClass().test_method()  # type: ignore
+
+    assert all(reader.closed for reader in streams)
+    with pytest.raises(ValueError):
+        next(streams[1])
+
+
+def test_generator_stream(namespace, closed):
+    '''
+    GIVEN namespace with generator stream
+    WHEN test doesn't read the whole stream
+    THEN generator is closed after test
+    AND every test gets new stream
+    '''
+    @use_fixture_namespace(namespace)
+    class ExampleClass:
+        def test_method(self, numbers):
+            return next(numbers)
+
+    assert ExampleClass().test_method() == 0  # type: ignore
+    assert ExampleClass().test_method() == 0  # type: ignore
+    assert closed == ['numbers', 'numbers']
+
+
+def test_stream_closed_on_failure(namespace):
+    '''
+    GIVEN namespace with file stream
+    WHEN test raises exception
+    THEN file is closed
+    '''
+    readers = []
+
+    @use_fixture_namespace(namespace)
+    class ExampleClass:
+        def test_method(self, mapped):
+            readers.append(mapped)
+            raise RuntimeError()
+
+    with pytest.raises(RuntimeError):
+        ExampleClass().test_method()  # type: ignore
+    assert readers[0].closed
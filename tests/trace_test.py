@@ -0,0 +1,105 @@
+import json
+from fixture import *
+from fixture.__main__ import main
+from fixture.trace import read_trace, record_trace, to_chrome
+
+
+def create_example_class():
+    class Namespace:
+        @property
+        def words(self):
+            return ['a', 'b']
+
+        @property
+        def something(self):
+            return self.words + ['c']
+
+        @property
+        @unzip
+        def resource(self):
+            yield 'resource'
+
+    @use_fixture_namespace(Namespace)
+    class ExampleClass:
+        def test_method(self, something, resource):
+            return something, resource
+
+    return ExampleClass
+
+#
+#
+# tests
+#
+#
+
+
+def test_record_trace(tmp_path):
+    '''
+    GIVEN decorated class
+    WHEN running test with trace recording
+    THEN setup, nested reads, teardown and call events are written in order
+    AND nested events are inside their parents
+    '''
+    path = tmp_path / 'trace.jsonl'
+    with record_trace(path):
+        example_class = create_example_class()
+        example_class().test_method()
+
+    events = list(read_trace(path))
+    assert [(event['ev'], event['fx']) for event in events] == [
+        ('access', 'words'),
+        ('access', 'something'),
+        ('setup', 'something'),
+        ('access', 'resource'),
+        ('setup', 'resource'),
+        ('teardown', 'resource'),
+        ('call', 'test_method')
+    ]
+    assert all(
+        event['test'].endswith('ExampleClass.test_method')
+        for event in events
+    )
+    words, something = events[0], events[2]
+    assert something['ts'] <= words['ts']
+    assert words['ts'] + words['dur'] <= something['ts'] + something['dur']
+
+
+def test_trace_is_appended(tmp_path):
+    '''
+    GIVEN trace file
+    WHEN recording again
+    THEN new events are appended
+    AND events recorded after the block ends are not written
+    '''
+    path = tmp_path / 'trace.jsonl'
+    for _ in range(2):
+        with record_trace(path):
+            example_class = create_example_class()
+            example_class().test_method()
+    example_class().test_method()
+
+    calls = [event for event in read_trace(path) if event['ev'] == 'call']
+    assert len(calls) == 2
+
+
+def test_trace_command(tmp_path):
+    '''
+    GIVEN recorded trace
+    WHEN converting it to Chrome trace-event format and to timings
+    THEN every event is converted
+    AND timings of every setup fixture are written
+    '''
+    path = tmp_path / 'trace.jsonl'
+    with record_trace(path):
+        create_example_class()().test_method()
+    chrome, timings = tmp_path / 'chrome.json', tmp_path / 'timings.json'
+
+    assert main(['trace', 'chrome', str(path), '-o', str(chrome)]) == 0
+    assert main(['trace', 'timings', str(path), '-o', str(timings)]) == 0
+
+    events = json.loads(chrome.read_text())['traceEvents']
+    assert len(events) == len(to_chrome(read_trace(path))['traceEvents']) == 7
+    assert {event['ph'] for event in events} == {'X'}
+    assert sorted(
+        name.rsplit('.', 1)[1] for name in json.loads(timings.read_text())
+    ) == ['resource', 'something']